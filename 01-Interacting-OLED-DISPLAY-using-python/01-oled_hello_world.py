@@ -13,6 +13,7 @@ Steps:
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in this folder, for the OLED device)
 - time
 
 Hardware Requirements:
@@ -23,14 +24,12 @@ Usage:
 Run the script, and the text "Hello, OLED!" will be displayed on the OLED screen. The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
+from oled_device import create_device
 from luma.core.render import canvas
-from luma.oled.device import ssd1306
 import time
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
 
 # Display text on the OLED
 with canvas(device) as draw:
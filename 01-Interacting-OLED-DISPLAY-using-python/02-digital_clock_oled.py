@@ -6,15 +6,20 @@ It uses the `luma.oled` library to communicate with the OLED display and the `da
 
 Steps:
 1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
-2. Continuously fetches the current time in the format "HH:MM:SS".
-3. Displays the current time on the OLED screen at the coordinates (10, 10).
+2. Renders the time of the next second in the format "HH:MM:SS" in advance.
+3. Displays it on the OLED screen at the coordinates (10, 10) right when that second begins (`oled_ticks.py`), so the
+   clock neither drifts nor skips a second.
 4. Updates the time every second.
-5. The program runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C).
+5. The program runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C), then prints how late the
+   frames were on average.
 
 Dependencies:
 - luma.core
 - luma.oled
-- time
+- oled_device.py (in this folder, for the OLED device)
+- oled_render.py (in this folder, for partial refresh)
+- oled_ticks.py (in this folder, for the tick scheduler)
+- Pillow (PIL)
 - datetime
 
 Hardware Requirements:
@@ -25,28 +30,32 @@ Usage:
 Run the script, and the current time will be displayed on the OLED screen in real-time. The program will continue running until manually stopped.
 """
 
+from oled_device import create_device
+from oled_render import DirtyRegionRenderer
+from oled_ticks import TickScheduler
+from PIL import Image, ImageDraw, ImageFont
 
-from luma.core.interface.serial import spi
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
-import time
-from datetime import datetime
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+
+# Each frame is sent right at the start of its second (see oled_ticks.py)
+scheduler = TickScheduler(screen)
+
+font = ImageFont.load_default()
+
+def render_frame(now):
+    # The frame for the second `now`
+    frame = Image.new(device.mode, device.size)
+    ImageDraw.Draw(frame).text((10, 10), f"Time: {now:%H:%M:%S}", font=font, fill="white")
+    return frame
 
 try:
-    while True:
-        # Get the current time
-        current_time = datetime.now().strftime("%H:%M:%S")
-        
-        # Display the current time on the OLED
-        with canvas(device) as draw:
-            draw.text((10, 10), f"Time: {current_time}", fill="white")
-        
-        # Wait for 1 second before updating
-        time.sleep(1)
+    scheduler.run(render_frame)
 
 except KeyboardInterrupt:
-    print("Script stopped by user.")
\ No newline at end of file
+    stats = scheduler.stats()
+    print(f"Script stopped by user. {stats['ticks']} ticks, {stats['mean_late_ms']:.1f} ms late on average "
+          f"({stats['max_late_ms']:.1f} ms at most), {stats['missed']} missed.")
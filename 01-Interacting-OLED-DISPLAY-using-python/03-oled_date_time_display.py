@@ -6,17 +6,21 @@ It uses the `luma.oled` library to communicate with the OLED display and the `da
 
 Steps:
 1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
-2. Continuously fetches the current date and time using the `datetime` module.
-3. Formats the time as "HH:MM:SS" and the date as "YYYY-MM-DD".
-4. Displays the formatted time and date on the OLED screen using the `canvas` context.
-5. Updates the display every second.
-6. The program runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C).
+2. Renders the frame of the next second in advance, with the time as "HH:MM:SS" and the date as "YYYY-MM-DD". The
+   date line is drawn once a day and reused (`oled_ticks.py`).
+3. Displays the frame on the OLED screen right when its second begins, so the clock neither drifts nor skips a second.
+4. Updates the display every second.
+5. The program runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C), then prints how late the
+   frames were on average.
 
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in this folder, for the OLED device)
+- oled_render.py (in this folder, for partial refresh)
+- oled_ticks.py (in this folder, for the tick scheduler)
+- Pillow (PIL)
 - datetime
-- time
 
 Hardware Requirements:
 - SSD1306 OLED display connected via SPI.
@@ -26,33 +30,36 @@ Usage:
 Run the script, and the current date and time will be displayed on the OLED screen. The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
-import time
-from datetime import datetime
-from PIL import ImageFont  # Import ImageFont from Pillow
+from oled_device import create_device
+from oled_render import DirtyRegionRenderer
+from oled_ticks import CachedLayer, TickScheduler
+from PIL import ImageDraw, ImageFont  # Import ImageFont from Pillow
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+
+# Each frame is sent right at the start of its second (see oled_ticks.py)
+scheduler = TickScheduler(screen)
+
+font = ImageFont.load_default()
+date_layer = CachedLayer(device)  # The date line, drawn again only when the date changes
+
+def render_frame(now):
+    # The frame for the second `now`
+    # Display date (default size), format YYYY-MM-DD
+    frame = date_layer.get(now.date(), lambda draw: draw.text((0, 20), f"Date: {now:%Y-%m-%d}", font=font,
+                                                              fill="white"))
+    # Display time (default size), format HH:MM:SS
+    ImageDraw.Draw(frame).text((0, 0), f"Time: {now:%H:%M:%S}", font=font, fill="white")
+    return frame
 
 try:
-    while True:
-        # Get the current date and time
-        now = datetime.now()
-        current_time = now.strftime("%H:%M:%S")  # Format time as HH:MM:SS
-        current_date = now.strftime("%Y-%m-%d")  # Format date as YYYY-MM-DD
-        
-        # Display the current time and date on the OLED
-        with canvas(device) as draw:
-            # Display time (default size)
-            draw.text((0, 0), f"Time: {current_time}", fill="white")
-            # Display date (default size)
-            draw.text((0, 20), f"Date: {current_date}", fill="white")
-        
-        # Wait for 1 second before updating
-        time.sleep(1)
+    scheduler.run(render_frame)
 
 except KeyboardInterrupt:
-    print("Script stopped by user.")
+    stats = scheduler.stats()
+    print(f"Script stopped by user. {stats['ticks']} ticks, {stats['mean_late_ms']:.1f} ms late on average "
+          f"({stats['max_late_ms']:.1f} ms at most), {stats['missed']} missed.")
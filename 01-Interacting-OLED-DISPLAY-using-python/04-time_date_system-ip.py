@@ -2,22 +2,26 @@
 OLED System Info Display Script
 
 This program displays the current time, date, and IP address on an SSD1306 OLED display connected via SPI.
-It uses the `luma.oled` library to communicate with the OLED display and the `socket` module to fetch the IP address.
+It uses the `luma.oled` library to communicate with the OLED display and `oled_ip.py` to fetch the IP address.
 
 Steps:
 1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
-2. Fetches the current time, date, and IP address.
-3. Displays the time, date, and IP address on the OLED screen.
+2. Fetches the current time and date, and the IP address cached by a background thread that looks it up again only
+   when the network changes.
+3. Displays the time, date, and IP address on the OLED screen, stacked by the measured size of the text.
 4. Updates the display every second.
 5. Runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C).
 
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in this folder, for the OLED device)
+- oled_render.py (in this folder, for partial refresh)
 - time
 - datetime
-- Pillow (PIL) for font handling (if needed in the future)
-- socket for fetching the IP address
+- Pillow (PIL) for font handling
+- oled_ip.py (in this folder, for fetching the IP address)
+- oled_layout.py (in this folder, for placing the lines)
 
 Hardware Requirements:
 - SSD1306 OLED display connected via SPI.
@@ -27,29 +31,34 @@ Usage:
 Run the script, and the current time, date, and IP address will be displayed on the OLED screen. The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
+from oled_device import create_device
 from luma.core.render import canvas
-from luma.oled.device import ssd1306
+from oled_render import DirtyRegionRenderer
 import time
 from datetime import datetime
 from PIL import ImageFont  # Import ImageFont from Pillow
-import socket  # Import socket module to get IP address
+from oled_ip import IPAddressProvider  # Cached IP address (oled_ip.py)
+from oled_layout import StackedLines  # Line positions from the measured text (oled_layout.py)
+
+# The IP address is looked up in a background thread, only when the network changes (see oled_ip.py)
+ip_provider = IPAddressProvider()
+ip_provider.start()
 
 # Function to get the IP address
 def get_ip_address():
-    try:
-        # Create a socket to get the IP address
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))  # Connect to a public DNS server
-        ip_address = s.getsockname()[0]  # Get the IP address
-        s.close()
-        return ip_address
-    except Exception as e:
-        return "No IP"
+    return ip_provider.address  # Cached: never waits on the network
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+
+# Use the default font, loaded once instead of by every frame's draw.text()
+font = ImageFont.load_default()
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+# Three lines with 12px between them
+lines = StackedLines(device, [font, font, font], spacing=12)
 
 try:
     while True:
@@ -60,15 +69,17 @@ try:
         
         # Get the IP address
         ip_address = get_ip_address()
+        texts = [f"Time: {current_time}", f"Date: {current_date}", f"IP: {ip_address}"]
+        positions = lines.positions(texts)  # Cached until a line changes length
         
         # Display the current time, date, and IP address on the OLED
-        with canvas(device) as draw:
+        with canvas(screen) as draw:
             # Display time (default size)
-            draw.text((0, 0), f"Time: {current_time}", fill="white")
+            draw.text(positions[0], texts[0], fill="white", font=font)
             # Display date (default size)
-            draw.text((0, 20), f"Date: {current_date}", fill="white")
+            draw.text(positions[1], texts[1], fill="white", font=font)
             # Display IP address (default size)
-            draw.text((0, 40), f"IP: {ip_address}", fill="white")
+            draw.text(positions[2], texts[2], fill="white", font=font)
         
         # Wait for 1 second before updating
         time.sleep(1)
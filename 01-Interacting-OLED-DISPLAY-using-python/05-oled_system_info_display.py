@@ -7,16 +7,21 @@ It uses the `luma.oled` library to communicate with the OLED display and the `Pi
 Steps:
 1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
 2. Retrieves the current time and date using the `datetime` module.
-3. Retrieves the device's IP address using the `socket` module.
-4. Displays the time, date, and IP address on the OLED screen using the default font.
+3. Retrieves the device's IP address from `oled_ip.py`, which caches it and looks it up again in a background
+   thread only when the network changes.
+4. Displays the time, date, and IP address on the OLED screen using the default font, stacked by the measured size
+   of the text.
 5. Updates the display every second and keeps the program running indefinitely until interrupted by the user (e.g., Ctrl+C).
 
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in this folder, for the OLED device)
+- oled_render.py (in this folder, for partial refresh)
 - Pillow (for font rendering)
 - datetime
-- socket
+- oled_ip.py (in this folder)
+- oled_layout.py (in this folder, for placing the lines)
 - time
 
 Hardware Requirements:
@@ -27,33 +32,35 @@ Usage:
 Run the script, and the OLED display will show the current time, date, and IP address. The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
+from oled_device import create_device
 from luma.core.render import canvas
-from luma.oled.device import ssd1306
+from oled_render import DirtyRegionRenderer
 import time
 from datetime import datetime
 from PIL import ImageFont  # Import ImageFont from Pillow
-import socket  # Import socket module to get IP address
+from oled_ip import IPAddressProvider  # Cached IP address (oled_ip.py)
+from oled_layout import StackedLines  # Line positions from the measured text (oled_layout.py)
+
+# The IP address is looked up in a background thread, only when the network changes (see oled_ip.py)
+ip_provider = IPAddressProvider()
+ip_provider.start()
 
 # Function to get the IP address
 def get_ip_address():
-    try:
-        # Create a socket to get the IP address
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))  # Connect to a public DNS server
-        ip_address = s.getsockname()[0]  # Get the IP address
-        s.close()
-        return ip_address
-    except Exception as e:
-        return "No IP"
+    return ip_provider.address  # Cached: never waits on the network
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
 
 # Use the default font
 font = ImageFont.load_default()
 
+# Three lines with 12px between them
+lines = StackedLines(device, [font, font, font], spacing=12)
+
 try:
     while True:
         # Get the current date and time
@@ -63,15 +70,17 @@ try:
         
         # Get the IP address
         ip_address = get_ip_address()
+        texts = [f"Time: {current_time}", f"Date: {current_date}", f"IP: {ip_address}"]
+        positions = lines.positions(texts)  # Cached until a line changes length
         
         # Display the current time, date, and IP address on the OLED
-        with canvas(device) as draw:
+        with canvas(screen) as draw:
             # Display time (default font)
-            draw.text((0, 0), f"Time: {current_time}", fill="white", font=font)
+            draw.text(positions[0], texts[0], fill="white", font=font)
             # Display date (default font)
-            draw.text((0, 20), f"Date: {current_date}", fill="white", font=font)
+            draw.text(positions[1], texts[1], fill="white", font=font)
             # Display IP address (default font)
-            draw.text((0, 40), f"IP: {ip_address}", fill="white", font=font)
+            draw.text(positions[2], texts[2], fill="white", font=font)
         
         # Wait for 1 second before updating
         time.sleep(1)
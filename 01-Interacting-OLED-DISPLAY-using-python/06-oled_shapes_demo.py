@@ -10,12 +10,15 @@ Steps:
    - A rectangle with an outline and filled with black.
    - A circle with an outline and filled with black.
    - A horizontal line.
-3. The shapes are redrawn every second.
+3. The shapes are checked every second, but as they never change they are drawn and sent to the display only once
+   (`STATIC_FRAME`, see `oled_render.py`).
 4. The program runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C).
 
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in this folder, for the OLED device)
+- oled_render.py (in this folder, for skipping unchanged frames)
 - time
 
 Hardware Requirements:
@@ -27,28 +30,32 @@ Run the script, and the shapes (rectangle, circle, and line) will be displayed o
 The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
+from oled_device import create_device
 from luma.core.render import canvas
-from luma.oled.device import ssd1306
+from oled_render import DirtyRegionRenderer
 import time
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Skip frames that are already on the display (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+STATIC_FRAME = "shapes"  # The shapes never change, so they are drawn once
 
 try:
     while True:
-        with canvas(device) as draw:
-            # Draw a rectangle
-            draw.rectangle((10, 10, 50, 50), outline="white", fill="black")
-            
-            # Draw a circle
-            draw.ellipse((60, 10, 100, 50), outline="white", fill="black")
-            
-            # Draw a line
-            draw.line((10, 60, 100, 60), fill="white")
+        if not screen.showing(STATIC_FRAME):  # Already on the display: nothing to draw or send
+            with canvas(screen) as draw:
+                # Draw a rectangle
+                draw.rectangle((10, 10, 50, 50), outline="white", fill="black")
+
+                # Draw a circle
+                draw.ellipse((60, 10, 100, 50), outline="white", fill="black")
+
+                # Draw a line
+                draw.line((10, 60, 100, 60), fill="white")
         
-        # Wait for 1 second before redrawing
+        # Wait for 1 second before checking again
         time.sleep(1)
 
 except KeyboardInterrupt:
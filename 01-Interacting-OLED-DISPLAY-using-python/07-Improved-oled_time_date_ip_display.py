@@ -9,15 +9,19 @@ Key Features:
 2. Displays the current date in DD-MM-YYYY format.
 3. Fetches and displays the device's IP address.
 4. Uses custom fonts for better readability (DejaVuSans.ttf is preferred).
-5. Dynamically calculates text positions to ensure proper alignment and spacing.
+5. Stacks the lines by the measured size of their text (`oled_layout.py`), so they fit the display whatever the fonts.
+6. Renders text from cached glyphs (`oled_glyphs.py`), so FreeType only rasterises each character once.
+7. Loads its fonts from the font registry (`oled_fonts.py`), which caches them as small bitmap fonts on disk.
+8. Renders each second's frame in advance and sends it right when the second begins (`oled_ticks.py`); the date and
+   IP lines are only drawn again when they change.
 
 Dependencies:
 - luma.core
 - luma.oled
+- oled_render.py (in this folder, for partial refresh)
 - PIL (Pillow)
 - datetime
-- socket
-- time
+- oled_device.py, oled_fonts.py, oled_glyphs.py, oled_ip.py, oled_layout.py, oled_ticks.py (in this folder)
 
 Hardware Requirements:
 - SSD1306 OLED display connected via SPI.
@@ -27,83 +31,87 @@ Usage:
 1. Run the script.
 2. The OLED display will show the current time, date, and IP address.
 3. The program updates every second and runs indefinitely until stopped by the user (e.g., by pressing Ctrl+C).
+   On exit it prints how late the frames were on average.
 
 Custom Fonts:
 - The program attempts to load the "DejaVuSans.ttf" font for better display quality.
 - If the font is not found, it falls back to the default font.
+- The first run compiles both sizes into bitmap fonts in `~/.cache/oled-fonts`; later runs load those instead of
+  parsing the TTF file.
 
 IP Address:
-- The program fetches the device's IP address using a socket connection.
-- If the IP address cannot be retrieved, it displays "No IP".
+- The IP address is looked up at start-up and then again in a background thread only when the network changes
+  (`oled_ip.py`), so the clock never waits on the network.
+- If the IP address cannot be retrieved, it displays "No IP" until the network comes back.
 
 Exit:
 - The program can be stopped by pressing Ctrl+C, and it cleans up the OLED display before exiting.
 """
 
-from luma.core.interface.serial import spi
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
-import time
-from datetime import datetime
-from PIL import ImageFont
-import socket
+from oled_device import create_device
+from oled_render import DirtyRegionRenderer
+from oled_ticks import CachedLayer, TickScheduler
+from PIL import ImageDraw, ImageFont
+from oled_ip import IPAddressProvider
+from oled_glyphs import glyph_atlas
+from oled_fonts import load_font
+from oled_layout import StackedLines, fit_text
+
+# Looked up in a background thread when the network changes, not once per frame
+ip_provider = IPAddressProvider()
+ip_provider.start()
 
 def get_ip_address():
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip_address = s.getsockname()[0]
-        s.close()
-        return ip_address
-    except Exception as e:
-        return "No IP"
-
-# Initialize SPI and OLED
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+    return ip_provider.address  # Cached: never waits on the network
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+
+# Each frame is sent right at the start of its second (see oled_ticks.py)
+scheduler = TickScheduler(screen)
 
 # Custom font settings
 try:
-    font_main = ImageFont.truetype("DejaVuSans.ttf", 14)  # Main font (Time and Date)
-    font_ip = ImageFont.truetype("DejaVuSans.ttf", 13)     # IP font (1px smaller)
+    font_main = load_font("DejaVuSans.ttf", 14)  # Main font (Time and Date)
+    font_ip = load_font("DejaVuSans.ttf", 13)     # IP font (1px smaller)
 except IOError:
     print("Custom font not found, using default")
     font_main = ImageFont.load_default()
     font_ip = ImageFont.load_default()
 
-def calculate_y_positions():
-    # Use getbbox to calculate positions
-    bbox_main = font_main.getbbox("Test")  # For main font
-    bbox_ip = font_ip.getbbox("Test")      # For IP font
-    
-    height_main = bbox_main[3] - bbox_main[1]  # Height of main font
-    height_ip = bbox_ip[3] - bbox_ip[1]        # Height of IP font
-    
-    line_spacing = 6  # Increase gap between lines (पहले 2 था, अब 6 कर दिया)
-    
-    return [
-        (0, 0),  # Time position
-        (0, height_main + line_spacing),  # Date position
-        (0, height_main + line_spacing + height_ip + line_spacing)  # IP position
-    ]
+# Glyphs are rasterised once per font and reused every second
+text_main = glyph_atlas(font_main)
+text_ip = glyph_atlas(font_ip)
+
+# Time, date and IP lines, 6px apart (पहले 2 था, अब 6 कर दिया); measured again only when a line changes length
+lines = StackedLines(device, [font_main, font_main, font_ip], spacing=6)
+
+# Date and IP lines, drawn again only when one of them changes
+info_layer = CachedLayer(device)
+
+def render_frame(now):
+    # The frame for the second `now`
+    ip_address = get_ip_address()
+    texts = [f"Time: {now:%H:%M:%S}", f"Date: {now:%d-%m-%Y}",  # DD-MM-YYYY format
+             fit_text(font_ip, f"IP: {ip_address}", device.width)]  # Cut to the display width
+    y_positions = lines.positions(texts)
+
+    def draw_info(draw):
+        text_main.draw(draw, y_positions[1], texts[1], fill="white")
+        text_ip.draw(draw, y_positions[2], texts[2], fill="white")  # Use smaller font for IP
+
+    frame = info_layer.get((texts[1], texts[2], y_positions), draw_info)
+    text_main.draw(ImageDraw.Draw(frame), y_positions[0], texts[0], fill="white")
+    return frame
 
 try:
-    y_positions = calculate_y_positions()
-    
-    while True:
-        now = datetime.now()
-        current_time = now.strftime("%H:%M:%S")
-        current_date = now.strftime("%d-%m-%Y")  # DD-MM-YYYY format
-        ip_address = get_ip_address()
-
-        with canvas(device) as draw:
-            # Render text with updated positions and fonts
-            draw.text(y_positions[0], f"Time: {current_time}", fill="white", font=font_main)
-            draw.text(y_positions[1], f"Date: {current_date}", fill="white", font=font_main)
-            draw.text(y_positions[2], f"IP: {ip_address[:15]}", fill="white", font=font_ip)  # Use smaller font for IP
-
-        time.sleep(1)
+    scheduler.run(render_frame)
 
 except KeyboardInterrupt:
-    print("Script stopped by user.")
-    device.cleanup()
\ No newline at end of file
+    stats = scheduler.stats()
+    print(f"Script stopped by user. {stats['ticks']} ticks, {stats['mean_late_ms']:.1f} ms late on average "
+          f"({stats['max_late_ms']:.1f} ms at most), {stats['missed']} missed.")
+    device.cleanup()
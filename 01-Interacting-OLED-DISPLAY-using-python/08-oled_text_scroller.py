@@ -7,15 +7,23 @@ it resets to the right side and continues scrolling indefinitely.
 
 Steps:
 1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
-2. Defines the text message to be displayed.
-3. Uses a loop to continuously update the position of the text, creating a scrolling effect.
-4. Resets the text position to the right side of the screen once it fully scrolls off the left side.
+2. Defines the text message to be displayed and renders it once into a wide strip (`oled_scroll.py`).
+3. Uses a loop to continuously show the next window of the strip, creating a scrolling effect. Only the part of the
+   display the text covers is sent (`oled_render.py`).
+4. Resets the text position to the right side of the screen once it fully scrolls off the left side. The width of the
+   text is measured once (`oled_layout.py`), so the text comes back as soon as it has left the screen.
 5. Adjusts the scrolling speed using a delay (0.05 seconds in this case).
 6. Stops the program when the user interrupts it (e.g., by pressing Ctrl+C).
 
+With `HARDWARE_SCROLL = True`, the program shows the text once and lets the SSD1306 scroll it by itself (commands
+0x26/0x27), so nothing is sent while it scrolls. The controller can only rotate its own 128 columns: text wider than
+the display is cut, and the text wraps round without a gap.
+
 Dependencies:
 - luma.core
 - luma.oled
+- Pillow (PIL)
+- oled_device.py, oled_layout.py, oled_render.py, oled_scroll.py (in this folder)
 - time
 
 Hardware Requirements:
@@ -27,31 +35,39 @@ Run the script, and the text "This is a scrolling text message!" will scroll acr
 The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
+from oled_device import create_device
+from PIL import ImageFont
+from oled_render import DirtyRegionRenderer
+from oled_scroll import HardwareScroll, TextScroller
 import time
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+HARDWARE_SCROLL = False  # True: the SSD1306 scrolls the text by itself
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
 
-# Text to display
+# Text to display, rendered once (see oled_scroll.py)
 text = "This is a scrolling text message!"
+font = ImageFont.load_default()
+scroller = TextScroller(device, font, text, y=10)
 
 try:
-    position = 0  # Starting position of the text
+    if HARDWARE_SCROLL:
+        hardware_scroll = HardwareScroll(device)  # About 21 pixels per second
+        hardware_scroll.start(scroller.frame())
+        while True:
+            time.sleep(1)  # Nothing to send
+
     while True:
-        with canvas(device) as draw:
-            # Draw the text at the current position
-            draw.text((position, 10), text, fill="white")
-        
-        # Update the position for scrolling
-        position -= 1  # Move text to the left
-        if position < -len(text) * 8:  # Reset position when text scrolls off the screen
-            position = device.width  # Reset to the right side of the screen
-        
+        # Show the text at the current position
+        screen.display(scroller.frame())  # Moves the text 1px to the left
+
         time.sleep(0.05)  # Adjust the speed of scrolling
 
 except KeyboardInterrupt:
-    print("Script stopped by user.")
\ No newline at end of file
+    if HARDWARE_SCROLL:
+        hardware_scroll.stop()
+    print("Script stopped by user.")
@@ -0,0 +1,71 @@
+"""
+OLED Partial Refresh Benchmark Script
+
+This program runs the clock, date/time, system-info, scroller, dashboard and static-image scripts of this folder
+unchanged against a capture of the SPI interface (`oled_capture.py`) and counts the bytes each frame sends to the
+SSD1306, without any hardware.
+
+Steps:
+1. Runs each script with `oled_bench.py`: the device is an SSD1306 on a `CaptureSerial`, and `time.time()` and
+   `datetime.now()` come from a simulated clock that starts at 23:59:55 on 31 December, so the seconds and, after a
+   few frames, the date change. Every `time.sleep()` ends a frame: it returns at once, advances the simulated clock
+   and records the bytes and transfers of the frame.
+2. After `--frames` frames the script gets a KeyboardInterrupt, so it runs its own cleanup code.
+3. Prints the bytes per frame sent by the partial refresh (`oled_render.py`) next to what full frames would have
+   sent, leaving out the first frame (display initialisation and the first full frame), and how many frames were
+   skipped because they were already on the display.
+
+Dependencies:
+- luma.core
+- luma.oled
+- oled_bench.py, oled_capture.py, oled_device.py, oled_render.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 09-oled_partial_refresh_benchmark.py`
+- `--frames 60` runs more frames per script.
+- Pass script names to run only some of them, e.g.
+  `python3 09-oled_partial_refresh_benchmark.py 02-digital_clock_oled.py`
+"""
+
+import argparse
+from oled_bench import run_script
+
+WORKLOADS = [
+    ("02-digital_clock_oled.py", "clock"),
+    ("03-oled_date_time_display.py", "date/time"),
+    ("04-time_date_system-ip.py", "system info"),
+    ("05-oled_system_info_display.py", "system info"),
+    ("07-Improved-oled_time_date_ip_display.py", "system info"),
+    ("08-oled_text_scroller.py", "scroller"),
+    ("14-oled_system_dashboard.py", "dashboard"),
+    ("06-oled_shapes_demo.py", "static"),
+    ("Adding-Font/01-oled_custom_font_display.py", "static"),
+    ("Adding-Font/02-oled_custom_font_large_text.py", "static"),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="Count the SPI bytes per frame of the OLED clock scripts")
+    parser.add_argument("scripts", nargs="*", help="scripts to run (default: all of WORKLOADS)")
+    parser.add_argument("--frames", type=int, default=20, help="frames per script")
+    args = parser.parse_args()
+
+    workloads = [(name, workload) for name, workload in WORKLOADS if not args.scripts or name in args.scripts]
+
+    print(f"{'script':<28}{'workload':<13}{'frames':>7}{'B/frame':>9}{'full B/frame':>13}{'saved':>7}"
+          f"{'windows':>8}{'skipped':>8}{'render ms':>10}")
+    for name, workload in workloads:
+        serial, clock, script = run_script(name, args.frames)
+        screen = script.get("screen")
+        frames = serial.frames[1:args.frames + 1]
+        count = max(len(frames), 1)
+        sent = sum(frame["bytes"] for frame in frames) / count
+        stats = screen.stats() if screen is not None else {"frames": 0, "windows": 0, "skipped": 0, "full_bytes": 0}
+        full = stats["full_bytes"] / stats["frames"] if stats["frames"] else 0.0
+        saved = 1 - sent / full if full else 0.0
+        windows = stats["windows"] / stats["frames"] if stats["frames"] else 0.0
+        render_ms = sum(clock.render_times[1:]) / count * 1000
+        print(f"{name[:26]:<28}{workload:<13}{len(frames):>7}{sent:>9.1f}{full:>13.1f}{saved:>7.0%}"
+              f"{windows:>8.1f}{stats['skipped']:>8}{render_ms:>10.2f}")
+
+if __name__ == '__main__':
+    main()
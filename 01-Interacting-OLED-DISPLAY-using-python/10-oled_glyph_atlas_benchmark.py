@@ -0,0 +1,94 @@
+"""
+OLED Glyph Atlas Benchmark Script
+
+This program measures how long it takes to render the text of `07-Improved-oled_time_date_ip_display.py` into a
+128x64 frame, with `draw.text()` and with the glyph atlas (`oled_glyphs.py`), without any hardware.
+
+Steps:
+1. Loads the fonts of the 07 script (DejaVuSans 14 and 13, or the default font if DejaVuSans is missing).
+2. Renders `FRAMES` frames of "Time: HH:MM:SS", "Date: DD-MM-YYYY" and "IP: ..." for consecutive seconds:
+   - "draw.text": FreeType rasterises every string on every frame, as the script did before.
+   - "atlas (cold)": a new atlas, so the first frames also rasterise the glyphs.
+   - "atlas": the warm atlas, as in the running script.
+3. Prints the CPU time per frame and the share of a 1 second frame (the 07 refresh rate) and of a 50 ms frame (20 fps)
+   it uses. A Raspberry Pi runs the same code several times slower than a desktop CPU, so the shares are what
+   matters: the render time has to fit the frame many times over.
+4. Checks that the atlas frames are pixel-identical to the `draw.text()` frames.
+
+Dependencies:
+- Pillow (PIL)
+- oled_glyphs.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 10-oled_glyph_atlas_benchmark.py`
+"""
+
+import time
+from datetime import datetime, timedelta
+from PIL import Image, ImageDraw, ImageFont
+from oled_glyphs import GlyphAtlas
+
+FRAMES = 2000  # Rendered seconds per method
+SIZE = (128, 64)  # OLED resolution
+IP_ADDRESS = "192.168.100.123"
+
+def load_fonts():
+    # The fonts of the 07 script
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", 14), ImageFont.truetype("DejaVuSans.ttf", 13)
+    except IOError:
+        font = ImageFont.load_default()
+        return font, font
+
+def frame_texts(count):
+    # (time line, date line, IP line) of `count` consecutive seconds
+    start = datetime(2024, 12, 31, 23, 50, 0)
+    texts = []
+    for second in range(count):
+        now = start + timedelta(seconds=second)
+        texts.append((f"Time: {now:%H:%M:%S}", f"Date: {now:%d-%m-%Y}", f"IP: {IP_ADDRESS}"))
+    return texts
+
+def render(texts, draw_line):
+    # Render every frame, return the CPU time per frame and the frames
+    frames = []
+    start = time.process_time()
+    for time_text, date_text, ip_text in texts:
+        image = Image.new("1", SIZE)
+        draw = ImageDraw.Draw(image)
+        draw_line(draw, 0, time_text, 0)
+        draw_line(draw, 19, date_text, 0)
+        draw_line(draw, 38, ip_text, 1)
+        frames.append(image.tobytes())
+    return (time.process_time() - start) / len(texts), frames
+
+def main():
+    fonts = load_fonts()
+    texts = frame_texts(FRAMES)
+
+    def with_draw_text(draw, y, text, font):
+        draw.text((0, y), text, font=fonts[font], fill="white")
+
+    def with_atlas(atlases):
+        def draw_line(draw, y, text, font):
+            atlases[font].draw(draw, (0, y), text, fill="white")
+        return draw_line
+
+    cold = [GlyphAtlas(font) for font in fonts]
+    results = [
+        ("draw.text", render(texts, with_draw_text)),
+        ("atlas (cold)", render(texts[:1], with_atlas(cold))),
+        ("atlas", render(texts, with_atlas(cold))),  # Warm now
+    ]
+
+    reference = results[0][1][1]
+    print(f"{FRAMES} frames, fonts: {', '.join(str(getattr(font, 'path', 'default')) for font in fonts)}")
+    print(f"{'method':<14}{'us/frame':>10}{'1 s frame':>11}{'50 ms frame':>13}{'speed-up':>10}{'identical':>11}")
+    for name, (seconds, frames) in results:
+        identical = sum(frame == expected for frame, expected in zip(frames, reference))
+        print(f"{name:<14}{seconds * 1e6:>10.1f}{seconds:>11.3%}{seconds / 0.05:>13.2%}"
+              f"{results[0][1][0] / seconds:>9.1f}x{identical:>6}/{len(frames)}")
+    print(f"Glyphs rasterised: {sum(atlas.rasterised for atlas in cold)}")
+
+if __name__ == '__main__':
+    main()
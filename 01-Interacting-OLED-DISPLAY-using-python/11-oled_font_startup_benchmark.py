@@ -0,0 +1,109 @@
+"""
+OLED Font Startup Benchmark Script
+
+This program measures how long the OLED scripts take to load their fonts at start-up, with `ImageFont.truetype()` and
+with the font registry (`oled_fonts.py`) on a cold and on a warm cache, without any hardware.
+
+Steps:
+1. Every run is a new Python process, like a script that starts, so nothing is cached in memory between runs.
+   Each process loads the fonts of a workload and draws the workload's text once with each font, and reports the
+   time to load the fonts and the time to the first frame. `ImageFont.truetype()` only opens the font file;
+   FreeType parses the outlines and rasterises the glyphs when the first frame is drawn, so the time to the first
+   frame is the one to compare.
+2. Runs each workload `--runs` times per method:
+   - "truetype": `ImageFont.truetype()`, as the scripts did before.
+   - "registry (cold)": `load_font()` with an empty cache directory, so it returns TrueType fonts and compiles and
+     saves the bitmap fonts in a background thread a second later (after the process ended, so never here).
+   - "registry (warm)": `load_font()` with the cache filled beforehand (`save_bitmap_font()`); only loads the bitmap
+     fonts.
+3. Prints the median times per method, the speed-up of the first frame against `truetype` and the size of the
+   cached files.
+
+Dependencies:
+- Pillow (PIL)
+- oled_fonts.py, oled_glyphs.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 11-oled_font_startup_benchmark.py`
+- `--runs 20` starts more processes per method.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+MOON_DANCE = os.path.join(FOLDER, "Adding-Font", "Moon_Dance", "MoonDance-Regular.ttf")
+
+WORKLOADS = [
+    ("07 (DejaVuSans 14+13)", [("DejaVuSans.ttf", 14), ("DejaVuSans.ttf", 13)],
+     ["Time: 23:59:59", "Date: 31-12-2024", "IP: 192.168.100.123"]),
+    ("Adding-Font (MoonDance 12+20)", [(MOON_DANCE, 12), (MOON_DANCE, 20)], ["Hello World!", "Araham  Abeddin"]),
+]
+
+# Runs in a new process: loads the fonts, then draws the first frame with every font, and prints the milliseconds
+# both took. Importing the registry counts as loading; PIL is imported before the clock starts.
+LOADER = """
+import json, sys, time
+from PIL import Image, ImageDraw, ImageFont
+method, fonts, texts = json.loads(sys.argv[1])
+start = time.perf_counter()
+if method == "fill":
+    from oled_fonts import cache_path, save_bitmap_font
+    for path, size in fonts:
+        save_bitmap_font(path, size, cache_path(path, size))
+    sys.exit()
+if method == "truetype":
+    loaded = [ImageFont.truetype(path, size) for path, size in fonts]
+else:
+    from oled_fonts import load_font
+    loaded = [load_font(path, size) for path, size in fonts]
+load = time.perf_counter()
+draw = ImageDraw.Draw(Image.new("1", (128, 64)))
+for font in loaded:
+    for y, text in enumerate(texts):
+        draw.text((0, y * 20), text, font=font, fill="white")
+end = time.perf_counter()
+print((load - start) * 1000, (end - start) * 1000)
+"""
+
+def load_time(method, fonts, texts, cache_dir):
+    # Milliseconds a new process takes to load `fonts`, and to load them and draw the first frame
+    env = dict(os.environ, OLED_FONT_CACHE=cache_dir)
+    output = subprocess.run([sys.executable, "-c", LOADER, json.dumps([method, fonts, texts])], cwd=FOLDER,
+                            env=env, check=True, capture_output=True, text=True).stdout
+    return tuple(float(value) for value in output.split())
+
+def cache_size(cache_dir):
+    return sum(os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the font loading time of the OLED scripts")
+    parser.add_argument("--runs", type=int, default=10, help="processes per method and workload")
+    args = parser.parse_args()
+
+    print(f"{'workload':<31}{'method':<17}{'load ms':>9}{'first frame ms':>16}{'speed-up':>10}{'cache KB':>10}")
+    for name, fonts, texts in WORKLOADS:
+        with tempfile.TemporaryDirectory() as warm_dir:
+            truetype = [load_time("truetype", fonts, texts, warm_dir) for _ in range(args.runs)]
+            cold = []
+            for _ in range(args.runs):
+                with tempfile.TemporaryDirectory() as cold_dir:  # Empty for every run
+                    cold.append(load_time("registry", fonts, texts, cold_dir))
+            load_time("fill", fonts, texts, warm_dir)  # Fills the cache
+            warm = [load_time("registry", fonts, texts, warm_dir) for _ in range(args.runs)]
+
+            reference = statistics.median(frame for _, frame in truetype)
+            for method, times, size in [("truetype", truetype, None), ("registry (cold)", cold, None),
+                                        ("registry (warm)", warm, cache_size(warm_dir))]:
+                load = statistics.median(load for load, _ in times)
+                frame = statistics.median(frame for _, frame in times)
+                size = f"{size / 1024:.1f}" if size is not None else "-"
+                print(f"{name:<31}{method:<17}{load:>9.2f}{frame:>16.2f}{reference / frame:>9.1f}x{size:>10}")
+
+if __name__ == '__main__':
+    main()
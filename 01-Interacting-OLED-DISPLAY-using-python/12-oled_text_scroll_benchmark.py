@@ -0,0 +1,109 @@
+"""
+OLED Text Scroll Benchmark Script
+
+This program compares the ways `08-oled_text_scroller.py` can scroll its message on an SSD1306, against a capture of
+the SPI interface (`oled_capture.py`), without any hardware.
+
+Steps:
+1. Scrolls the message of the 08 script through `--cycles` full cycles (from the left edge until it has left the
+   screen, and back in from the right), 1 pixel per frame, with each method:
+   - "draw.text": draws the text again for every frame and sends full frames, as the script did before.
+   - "strip": crops the window from the strip rendered once (`oled_scroll.py`) and sends full frames.
+   - "strip + partial": the same windows, sent through `DirtyRegionRenderer` (`oled_render.py`), as the script does now.
+   - "hardware": shows one frame and lets the SSD1306 scroll (commands 0x26/0x27); nothing is sent per frame.
+2. Checks that every frame the display would show is the same as with "draw.text".
+3. Prints per method the CPU time and the bytes per frame (leaving out the first frame, which every method sends in
+   full), the bytes per second at the script's 20 frames per second,
+   and the frames per second the method could reach: one frame takes its CPU time plus the time its bytes take on
+   the SPI bus (`--bus-speed`, 8 MHz like luma's default). The hardware scroll runs at the controller's own rate
+   instead: one column every 5 of its frames, about 107 frames per second on a 128x64 module.
+A Raspberry Pi runs the same code several times slower than a desktop CPU, so the CPU times are lower bounds.
+
+Dependencies:
+- luma.core
+- luma.oled
+- Pillow (PIL)
+- oled_capture.py, oled_render.py, oled_scroll.py, oled_layout.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 12-oled_text_scroll_benchmark.py`
+- `--cycles 5` scrolls more cycles, `--bus-speed 400000` shows an I2C-like bus.
+"""
+
+import argparse
+import time
+from luma.core.render import canvas
+from luma.oled.device import ssd1306
+from PIL import ImageFont
+from oled_capture import CaptureSerial
+from oled_render import DirtyRegionRenderer
+from oled_scroll import HardwareScroll, TextScroller
+
+TEXT = "This is a scrolling text message!"  # The message of the 08 script
+Y = 10
+SCRIPT_FPS = 20  # The 08 script sleeps 0.05 seconds per frame
+CONTROLLER_FPS = 107  # SSD1306 frame rate with luma's clock setting (0x80) at 64 rows
+HARDWARE_INTERVAL = 5  # Controller frames per scroll step
+
+def scroll(method, frames, after_frame):
+    # Scroll `frames` frames with `method` on a new captured display; after_frame(serial) runs after each frame
+    serial = CaptureSerial()
+    device = ssd1306(serial)
+    serial.end_frame()  # Leave out the display initialisation
+    scroller = TextScroller(device, ImageFont.load_default(), TEXT, y=Y)
+    screen = DirtyRegionRenderer(device)
+    if method == "hardware":
+        HardwareScroll(device, HARDWARE_INTERVAL).start(scroller.frame())
+        after_frame(serial)  # The only transfer
+        for _ in range(frames - 1):
+            after_frame(serial)
+        return
+    position = 0
+    for _ in range(frames):
+        if method == "draw.text":
+            with canvas(device) as draw:
+                draw.text((position, Y), TEXT, fill="white")
+            position -= 1
+            if position < -scroller.text_width:
+                position = device.width
+        else:
+            (device if method == "strip" else screen).display(scroller.frame())
+        after_frame(serial)
+
+def run(method, frames):
+    # CPU seconds and bytes per frame, and what the display showed after each frame
+    counts = []
+    start = time.process_time()
+    scroll(method, frames, lambda serial: counts.append(serial.end_frame()["bytes"]))
+    seconds = time.process_time() - start
+    # Again for the images: the capture's display model is slow, so it stays out of the timing
+    shown = []
+    scroll(method, frames, lambda serial: shown.append(serial.image().tobytes()))
+    return seconds / frames, sum(counts[1:]) / (frames - 1), shown  # Bytes without the first, full frame
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the ways to scroll text on the OLED")
+    parser.add_argument("--cycles", type=int, default=2, help="scroll cycles per method")
+    parser.add_argument("--bus-speed", type=int, default=8_000_000, help="bus clock in Hz")
+    args = parser.parse_args()
+
+    font = ImageFont.load_default()
+    text_width = TextScroller(ssd1306(CaptureSerial()), font, TEXT, y=Y).text_width
+    frames = args.cycles * (128 + text_width + 1)
+    print(f"{frames} frames, text {text_width}px wide, bus {args.bus_speed / 1e6:g} MHz")
+    print(f"{'method':<17}{'CPU ms/frame':>13}{'B/frame':>9}{'B/s at 20 fps':>15}{'max fps':>9}{'identical':>12}")
+    reference = None
+    for method in ["draw.text", "strip", "strip + partial", "hardware"]:
+        seconds, sent, shown = run(method, frames)
+        if reference is None:
+            reference = shown
+        if method == "hardware":
+            fps = CONTROLLER_FPS / HARDWARE_INTERVAL
+            identical = "-"  # The controller shifts the display; the capture does not model that
+        else:
+            fps = 1 / (seconds + sent * 8 / args.bus_speed)
+            identical = f"{sum(a == b for a, b in zip(shown, reference))}/{frames}"
+        print(f"{method:<17}{seconds * 1000:>13.3f}{sent:>9.1f}{sent * SCRIPT_FPS:>15.0f}{fps:>9.0f}{identical:>12}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+OLED Tick Benchmark Script
+
+This program measures how well the shown second keeps up with the real one, for the old "render, then
+`time.sleep(1)`" loop and for the tick scheduler (`oled_ticks.py`), against a capture of the SPI interface
+(`oled_capture.py`), without any hardware. It runs in real time.
+
+Steps:
+1. Runs the date/time frame of `03-oled_date_time_display.py` for `--seconds` seconds with each loop. Rendering and
+   sending a frame takes an extra `--render-ms` milliseconds of busy CPU, standing in for a slower Raspberry Pi.
+2. For every frame, records the second it shows and when it reached the display.
+3. Prints per loop the frames, how late they were after the start of the second they show (mean and maximum), and how
+   many seconds were skipped or shown twice.
+
+Dependencies:
+- luma.core
+- luma.oled
+- Pillow (PIL)
+- oled_capture.py, oled_render.py, oled_ticks.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 13-oled_tick_benchmark.py`
+- `--seconds 120` runs longer, `--render-ms 60` makes the frames slower.
+"""
+
+import argparse
+import math
+import time
+from datetime import datetime
+from luma.oled.device import ssd1306
+from PIL import ImageDraw, ImageFont
+from oled_capture import CaptureSerial
+from oled_render import DirtyRegionRenderer
+from oled_ticks import CachedLayer, TickScheduler
+
+def frame_renderer(device, render_ms):
+    font = ImageFont.load_default()
+    date_layer = CachedLayer(device)
+
+    def render_frame(now):
+        # The frame of 03-oled_date_time_display.py, plus the extra render time
+        frame = date_layer.get(now.date(), lambda draw: draw.text((0, 20), f"Date: {now:%Y-%m-%d}", font=font,
+                                                                  fill="white"))
+        ImageDraw.Draw(frame).text((0, 0), f"Time: {now:%H:%M:%S}", font=font, fill="white")
+        end = time.perf_counter() + render_ms / 1000
+        while time.perf_counter() < end:
+            pass
+        return frame
+
+    return render_frame
+
+def sleep_loop(seconds, render_ms):
+    # The old loop: (second shown, time sent) of every frame
+    screen = DirtyRegionRenderer(ssd1306(CaptureSerial()))
+    render_frame = frame_renderer(screen, render_ms)
+    shown = []
+    end = time.time() + seconds
+    while time.time() < end:
+        now = time.time()
+        screen.display(render_frame(datetime.fromtimestamp(now)))
+        shown.append((math.floor(now), time.time()))
+        time.sleep(1)
+    return shown
+
+def tick_loop(seconds, render_ms):
+    # The tick scheduler: (second shown, time sent) of every frame
+    screen = DirtyRegionRenderer(ssd1306(CaptureSerial()))
+    render_frame = frame_renderer(screen, render_ms)
+    scheduler = TickScheduler(screen)
+    ticks = []
+
+    def render_tick(now):
+        ticks.append(now.timestamp())
+        return render_frame(now)
+
+    scheduler.run(render_tick, ticks=seconds)
+    # Every tick was sent lateness seconds after it began; the first frame is the one shown at start-up
+    return [(tick, tick + late) for tick, late in zip(ticks[1:], scheduler.lateness)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare how the OLED clock loops keep time")
+    parser.add_argument("--seconds", type=int, default=30, help="seconds per loop")
+    parser.add_argument("--render-ms", type=float, default=30.0, help="extra time to render and send a frame")
+    args = parser.parse_args()
+
+    print(f"{args.seconds} s per loop, {args.render_ms:g} ms extra per frame")
+    print(f"{'loop':<17}{'frames':>7}{'mean late ms':>14}{'max late ms':>13}{'skipped':>9}{'repeated':>10}")
+    for name, loop in [("sleep(1)", sleep_loop), ("tick scheduler", tick_loop)]:
+        shown = loop(args.seconds, args.render_ms)
+        lateness = [sent - second for second, sent in shown]
+        steps = [b[0] - a[0] for a, b in zip(shown, shown[1:])]
+        skipped = sum(step - 1 for step in steps if step > 1)
+        repeated = sum(1 for step in steps if step == 0)
+        print(f"{name:<17}{len(shown):>7}{sum(lateness) / len(lateness) * 1000:>14.1f}"
+              f"{max(lateness) * 1000:>13.1f}{skipped:>9.0f}{repeated:>10}")
+
+if __name__ == '__main__':
+    main()
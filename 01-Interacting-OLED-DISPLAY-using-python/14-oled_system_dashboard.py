@@ -0,0 +1,71 @@
+"""
+OLED System Dashboard Script
+
+This program shows a small system dashboard on an SSD1306 OLED display connected via SPI: the time, the date, the IP
+address, the CPU temperature, and a QR code of the IP address.
+It uses the `luma.oled` library to communicate with the OLED display and the `qrcode` library for the QR code.
+
+Steps:
+1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
+2. Starts the background IP address lookup (`oled_ip.py`).
+3. Builds the dashboard (`oled_dashboard.py`): every widget has its own tile and reads its data at its own pace, the
+   time every second, the date every minute, the IP address every 10 seconds and the temperature every 5 seconds.
+   A tile is only drawn again when its value changed.
+4. Sends each frame right when its second begins (`oled_ticks.py`), and only the changed parts (`oled_render.py`).
+5. Runs indefinitely until the user interrupts it (e.g., by pressing Ctrl+C), then prints how often each widget was
+   drawn.
+
+Dependencies:
+- luma.core
+- luma.oled
+- Pillow (PIL)
+- qrcode
+- oled_dashboard.py, oled_device.py, oled_ip.py, oled_render.py, oled_ticks.py (in this folder)
+
+Hardware Requirements:
+- SSD1306 OLED display connected via SPI.
+- GPIO pins for DC (24) and RST (25) as specified in the code.
+
+Usage:
+Run the script, and the dashboard will be displayed on the OLED screen. Scan the QR code to get the IP address.
+The program will continue running until manually stopped.
+"""
+
+from oled_device import create_device
+from PIL import ImageFont
+from oled_dashboard import system_dashboard
+from oled_ip import IPAddressProvider
+from oled_render import DirtyRegionRenderer
+from oled_ticks import TickScheduler
+
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"  # CPU temperature in millidegrees
+
+# The IP address is looked up in a background thread, only when the network changes (see oled_ip.py)
+ip_provider = IPAddressProvider()
+ip_provider.start()
+
+def cpu_temperature():
+    try:
+        with open(THERMAL_PATH) as f:
+            return f"CPU {int(f.read()) / 1000:.1f}°C"
+    except (OSError, ValueError):
+        return "CPU --.-°C"
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Only send the parts of each frame that changed (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+
+# Each frame is sent right at the start of its second (see oled_ticks.py)
+scheduler = TickScheduler(screen)
+
+font = ImageFont.load_default()
+dashboard = system_dashboard(device, font, lambda now: ip_provider.address, lambda now: cpu_temperature())
+
+try:
+    scheduler.run(dashboard.render)
+
+except KeyboardInterrupt:
+    renders = ", ".join(f"{name} {counts['renders']}" for name, counts in dashboard.stats().items())
+    print(f"Script stopped by user. Tiles drawn: {renders}.")
@@ -0,0 +1,102 @@
+"""
+OLED Dashboard Benchmark Script
+
+This program compares the five-widget dashboard of `14-oled_system_dashboard.py` (`oled_dashboard.py`) with a loop
+that repaints all five widgets every second, as the system-info scripts do, against a capture of the SPI interface
+(`oled_capture.py`), without any hardware.
+
+Steps:
+1. Simulates `--seconds` seconds (an hour by default) from 23:30:00 on 31 December, so the date changes once. The IP
+   address changes once half-way, and the sensor value changes on every 5-second reading.
+2. Renders one frame per second with each method, without sleeping:
+   - "full repaint": a new frame with all five widgets drawn, sent as a full frame (`device.display()`).
+   - "full repaint + partial": the same frames, sent through the dirty-region renderer (`oled_render.py`).
+   - "dashboard": only the tiles whose value changed are drawn again; sent through the dirty-region renderer.
+3. Checks that the dashboard frames are identical to the full repaint frames.
+4. Prints the CPU time per simulated second, the bytes sent per second and how often the widgets were drawn.
+
+Dependencies:
+- luma.core
+- luma.oled
+- Pillow (PIL)
+- qrcode
+- oled_capture.py, oled_dashboard.py, oled_render.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 15-oled_dashboard_benchmark.py`
+- `--seconds 86400` simulates a whole day.
+"""
+
+import argparse
+import math
+import time
+from datetime import datetime, timedelta
+from luma.oled.device import ssd1306
+from PIL import Image, ImageDraw, ImageFont
+from oled_capture import CaptureSerial
+from oled_dashboard import system_dashboard
+from oled_render import DirtyRegionRenderer
+
+START_TIME = datetime(2024, 12, 31, 23, 30, 0)
+
+def simulated_sources(seconds):
+    # IP address and sensor sources that change like the real ones would
+    def ip_source(now):
+        return "192.168.100.123" if (now - START_TIME).total_seconds() < seconds / 2 else "192.168.100.124"
+
+    def sensor_source(now):
+        # A slowly drifting temperature, read every 5 seconds
+        reading = math.floor(now.timestamp() / 5)
+        return f"CPU {48 + 4 * math.sin(reading / 30) + (reading % 3) / 10:.1f}°C"
+
+    return ip_source, sensor_source
+
+def run(method, seconds):
+    # CPU seconds and bytes per simulated second, the frames rendered and the widget counts
+    serial = CaptureSerial()
+    device = ssd1306(serial)
+    serial.end_frame()  # Leave out the display initialisation
+    screen = DirtyRegionRenderer(device)
+    font = ImageFont.load_default()
+    dashboard = system_dashboard(device, font, *simulated_sources(seconds))
+    frames = []
+
+    start = time.process_time()
+    for second in range(seconds):
+        now = START_TIME + timedelta(seconds=second)
+        if method == "dashboard":
+            frame = dashboard.render(now)
+        else:
+            # Every widget read and drawn again, into a new frame
+            frame = Image.new(device.mode, device.size)
+            for widget in dashboard.widgets:
+                tile = Image.new(device.mode, widget.size)
+                widget.render(ImageDraw.Draw(tile), widget.source(now), widget.size)
+                widget.polls += 1
+                widget.renders += 1
+                frame.paste(tile, widget.box[:2])
+        (device if method == "full repaint" else screen).display(frame)
+        frames.append(frame.tobytes())
+    seconds_used = time.process_time() - start
+
+    sent = serial.end_frame()["bytes"]  # Everything since the initialisation
+    return seconds_used / seconds, sent / seconds, frames, dashboard.stats()
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the OLED dashboard with a full repaint every second")
+    parser.add_argument("--seconds", type=int, default=3600, help="simulated seconds")
+    args = parser.parse_args()
+
+    print(f"{args.seconds} simulated seconds from {START_TIME}")
+    print(f"{'method':<24}{'CPU ms/s':>9}{'B/s':>8}{'identical':>12}  tiles drawn")
+    reference = None
+    for method in ["full repaint", "full repaint + partial", "dashboard"]:
+        cpu, sent, frames, stats = run(method, args.seconds)
+        if reference is None:
+            reference = frames
+        identical = sum(a == b for a, b in zip(frames, reference))
+        renders = ", ".join(f"{name} {counts['renders']}" for name, counts in stats.items())
+        print(f"{method:<24}{cpu * 1000:>9.3f}{sent:>8.1f}{identical:>6}/{len(frames):<5}  {renders}")
+
+if __name__ == '__main__':
+    main()
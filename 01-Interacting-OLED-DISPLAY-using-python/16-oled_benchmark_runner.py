@@ -0,0 +1,147 @@
+"""
+OLED Benchmark Runner Script
+
+This program runs the display scripts of this folder unchanged for a number of frames each, against a capture of the
+SPI interface, without any hardware, and reports how long a frame takes to render, how many bytes it sends and how
+many frames per second that allows. The results can be saved as JSON and compared with an earlier run, so a change
+can be measured against the commit before it.
+
+Steps:
+1. Runs each script with `oled_bench.py`: the device comes from `oled_device.py` and is an SSD1306 on a
+   `CaptureSerial` that only counts the bytes (`model=False`), and the clock is simulated, so every `time.sleep()`
+   ends a frame and returns at once.
+2. Runs every script `--repeat` times and keeps the run with the lowest render time, which is the least disturbed by
+   the rest of the computer.
+3. Prints per script:
+   - "first ms": the time to the end of the first frame of the first run, with the script start-up and the display
+     initialisation.
+   - "render ms": the mean time from one frame to the next after the first, for reading the data, drawing the frame
+     and handing its bytes to the bus.
+   - "B/frame" and "transfers": the bytes and the SPI transfers per frame after the first.
+   - "max fps": the frames per second the script could reach: one frame takes its render time plus the time its
+     bytes take on the SPI bus (`--bus-speed`, 8 MHz like luma's default). "-" for scripts that send nothing after
+     the first frame.
+4. With `--json results.json`, saves the results with the commit they were measured on; with
+   `--compare results.json`, prints the change against those saved results.
+A Raspberry Pi runs the same code several times slower than a desktop CPU, so compare results from the same computer.
+
+Dependencies:
+- luma.core
+- luma.oled
+- Pillow (PIL)
+- qrcode
+- oled_bench.py, oled_capture.py, oled_device.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 16-oled_benchmark_runner.py --json before.json`
+- After a change: `python3 16-oled_benchmark_runner.py --compare before.json`
+- `--frames 100` runs more frames per script, `--repeat 5` more runs per script.
+- Pass script names to run only some of them, e.g. `python3 16-oled_benchmark_runner.py 02-digital_clock_oled.py`
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+from datetime import datetime
+from oled_bench import FOLDER, run_script
+from oled_capture import CaptureSerial
+
+SCRIPTS = [
+    "01-oled_hello_world.py",
+    "02-digital_clock_oled.py",
+    "03-oled_date_time_display.py",
+    "04-time_date_system-ip.py",
+    "05-oled_system_info_display.py",
+    "06-oled_shapes_demo.py",
+    "07-Improved-oled_time_date_ip_display.py",
+    "08-oled_text_scroller.py",
+    "14-oled_system_dashboard.py",
+    "Adding-Font/01-oled_custom_font_display.py",
+    "Adding-Font/02-oled_custom_font_large_text.py",
+    "Text-to-QRcode-OLED-Display/01-oled_text_to_qrcode_display.py",
+    "Text-to-QRcode-OLED-Display/02-improved_oled_text_to_qrcode_display.py",
+]
+
+def git_commit():
+    # The commit the results were measured on, "-dirty" with uncommitted changes
+    try:
+        output = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=FOLDER, capture_output=True,
+                                text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+def measure(name, frames, bus_speed):
+    # The results of one run of the script
+    serial, clock, script = run_script(name, frames, CaptureSerial(model=False))
+    counts = serial.frames[1:frames + 1]
+    count = max(len(counts), 1)
+    render = sum(clock.render_times[1:frames + 1]) / count
+    sent = sum(frame["bytes"] for frame in counts) / count
+    wire = sent * 8 / bus_speed
+    return {
+        "frames": len(counts),
+        "first_ms": clock.render_times[0] * 1000,
+        "render_ms": render * 1000,
+        "bytes": sent,
+        "transfers": sum(frame["transfers"] for frame in counts) / count,
+        "wire_ms": wire * 1000,
+        "fps": 1 / (render + wire) if sent else None,  # None: the frames were skipped, nothing to reach
+    }
+
+def change(new, old):
+    if not old:
+        return "-"
+    return f"{(new - old) / old:+.0%}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure render time, bytes and fps of the OLED scripts")
+    parser.add_argument("scripts", nargs="*", help="scripts to run (default: all of SCRIPTS)")
+    parser.add_argument("--frames", type=int, default=50, help="frames per run, after the first")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per script, the fastest is kept")
+    parser.add_argument("--bus-speed", type=int, default=8_000_000, help="bus clock in Hz")
+    parser.add_argument("--json", help="save the results to this file")
+    parser.add_argument("--compare", help="compare with the results saved in this file")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "frames": args.frames,
+        "repeat": args.repeat,
+        "bus_speed": args.bus_speed,
+        "scripts": {},
+    }
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+        baseline = saved["scripts"]
+        print(f"Compared with {saved['commit']} ({saved['date']})")
+
+    print(f"{'script':<28}{'first ms':>9}{'render ms':>10}{'B/frame':>9}{'transfers':>10}{'max fps':>9}"
+          + (f"{'render':>8}{'bytes':>7}" if baseline else ""))
+    for name in args.scripts or SCRIPTS:
+        runs = [measure(name, args.frames, args.bus_speed) for _ in range(args.repeat)]
+        result = min(runs, key=lambda run: run["render_ms"])
+        result["first_ms"] = runs[0]["first_ms"]  # Later runs find the fonts and layouts already cached
+        results["scripts"][name] = result
+        fps = f"{result['fps']:.0f}" if result["fps"] else "-"
+        line = (f"{name[:26]:<28}{result['first_ms']:>9.1f}{result['render_ms']:>10.3f}{result['bytes']:>9.1f}"
+                f"{result['transfers']:>10.1f}{fps:>9}")
+        if baseline:
+            old = baseline.get(name, {})
+            line += (f"{change(result['render_ms'], old.get('render_ms')):>8}"
+                     f"{change(result['bytes'], old.get('bytes')):>7}")
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved to {args.json}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+OLED Transport Sweep Script
+
+This program measures the sustained frame rate and the frame latency an SSD1306 reaches on each bus and bus speed,
+against a simulated bus (`SimulatedBus` in `oled_transport.py`) that takes as long as the real one to send every
+transfer, without any hardware. It gives the full-frame budget to plan an animation with.
+
+Steps:
+1. Builds the transports to compare: SPI at `--spi-speeds` (MHz) for each of `--transfer-sizes`, and I2C at
+   `--i2c-speeds` (kHz). Every transfer also costs `--overhead-us` microseconds for the system call and the D/C pin.
+2. Runs each workload for `--seconds` seconds on each transport, in real time:
+   - "full frame": a ball bouncing across the screen, every frame drawn new and sent in full (`device.display()`),
+     like `with canvas(device)` does; this is the budget for animations.
+   - "scroller": the text scroller of `08-oled_text_scroller.py`, sent through the partial refresh
+     (`oled_render.py`), so only the rows of the text go over the bus.
+3. Prints per transport and workload the bytes per frame, the modelled wire time per frame, the frame latency (from
+   the start of rendering until the last byte is on the bus: mean and 95th percentile) and the sustained frames per
+   second.
+The SSD1306 datasheet specifies up to 10 MHz for SPI and 400 kHz for I2C; faster clocks often work with short wires,
+but are not guaranteed. A Raspberry Pi renders several times slower than a desktop CPU, so at high bus speeds the real
+frame rate is lower than shown here.
+
+Dependencies:
+- luma.core
+- luma.oled
+- Pillow (PIL)
+- oled_capture.py, oled_render.py, oled_scroll.py, oled_transport.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 17-oled_transport_sweep.py`
+- `--seconds 3` measures longer, `--transfer-sizes 64 4096` adds SPI with 64-byte transfers.
+- `--overhead-us 50` sets the cost per transfer measured on your own Raspberry Pi.
+"""
+
+import argparse
+import time
+from luma.oled.device import ssd1306
+from PIL import Image, ImageDraw, ImageFont
+from oled_render import DirtyRegionRenderer
+from oled_scroll import TextScroller
+from oled_transport import SimulatedBus, Transport
+
+TEXT = "This is a scrolling text message!"  # The message of the 08 script
+BALL = 12  # Diameter of the bouncing ball in pixels
+
+def full_frame(device):
+    # A new frame with the ball one step further, sent in full
+    position = [0, 0]
+    velocity = [3, 2]
+
+    def frame():
+        image = Image.new(device.mode, device.size)
+        ImageDraw.Draw(image).ellipse((position[0], position[1], position[0] + BALL - 1, position[1] + BALL - 1),
+                                      fill="white")
+        device.display(image)
+        for axis, limit in enumerate(device.size):
+            position[axis] += velocity[axis]
+            if not 0 <= position[axis] <= limit - BALL:
+                velocity[axis] = -velocity[axis]
+                position[axis] += 2 * velocity[axis]
+
+    return frame
+
+def scroller(device):
+    # The next window of the scrolling text, sent through the partial refresh
+    text = TextScroller(device, ImageFont.load_default(), TEXT, y=10)
+    screen = DirtyRegionRenderer(device)
+    return lambda: screen.display(text.frame())
+
+WORKLOADS = [("full frame", full_frame), ("scroller", scroller)]
+
+def run(transport, workload, seconds):
+    # Frames, bytes and modelled wire seconds per frame, frame latencies and the sustained frame rate
+    bus = SimulatedBus(transport)
+    device = ssd1306(bus)
+    frame = workload(device)
+    frame()  # The first frame is sent in full by every workload
+    bus.end_frame()
+    wire_start = bus.wire_time
+
+    latencies = []
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds or len(latencies) < 5:
+        begin = time.perf_counter()
+        frame()
+        latencies.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - start
+
+    frames = len(latencies)
+    sent = bus.end_frame()["bytes"] / frames
+    wire = (bus.wire_time - wire_start) / frames
+    latencies.sort()
+    return frames, sent, wire, latencies, frames / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure OLED frame rate and latency per bus and bus speed")
+    parser.add_argument("--seconds", type=float, default=1.0, help="seconds per transport and workload")
+    parser.add_argument("--spi-speeds", type=float, nargs="*", default=[0.5, 1, 2, 4, 8, 16, 32], help="SPI in MHz")
+    parser.add_argument("--transfer-sizes", type=int, nargs="*", default=[4096], help="SPI bytes per transfer")
+    parser.add_argument("--i2c-speeds", type=float, nargs="*", default=[100, 400, 1000], help="I2C in kHz")
+    parser.add_argument("--overhead-us", type=float, default=30.0, help="cost of one transfer in microseconds")
+    args = parser.parse_args()
+
+    overhead = args.overhead_us / 1e6
+    transports = [Transport("spi", speed=int(mhz * 1_000_000), transfer_size=size, overhead=overhead)
+                  for size in args.transfer_sizes for mhz in args.spi_speeds]
+    transports += [Transport("i2c", speed=int(khz * 1000), overhead=overhead) for khz in args.i2c_speeds]
+
+    print(f"{args.seconds:g} s per transport and workload, {args.overhead_us:g} us per transfer")
+    print(f"{'transport':<20}{'workload':<12}{'frames':>7}{'B/frame':>9}{'wire ms':>9}{'mean ms':>9}{'p95 ms':>9}"
+          f"{'fps':>8}")
+    for transport in transports:
+        for name, workload in WORKLOADS:
+            frames, sent, wire, latencies, fps = run(transport, workload, args.seconds)
+            mean = sum(latencies) / frames
+            p95 = latencies[min(int(frames * 0.95), frames - 1)]
+            print(f"{str(transport):<20}{name:<12}{frames:>7}{sent:>9.1f}{wire * 1000:>9.3f}{mean * 1000:>9.3f}"
+                  f"{p95 * 1000:>9.3f}{fps:>8.1f}")
+
+if __name__ == '__main__':
+    main()
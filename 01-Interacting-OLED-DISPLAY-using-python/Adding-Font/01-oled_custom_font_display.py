@@ -8,11 +8,14 @@ Steps:
 1. Initializes the SPI interface and OLED device using the specified GPIO pins for DC (Data/Command) and RST (Reset).
 2. Loads a custom font (MoonDance-Regular.ttf) from the specified path and sets the font size to 12.
 3. Enters a loop to continuously display the text "Hello World!" on the OLED screen using the custom font.
+   The text never changes, so it is drawn and sent to the display only once (`STATIC_FRAME`).
 4. Keeps the program running indefinitely to display the text until the user interrupts it (e.g., by pressing Ctrl+C).
 
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in the parent folder, for the OLED device)
+- oled_render.py (in the parent folder, for skipping unchanged frames)
 - PIL (Pillow)
 - time
 
@@ -26,24 +29,32 @@ Usage:
 3. The program will continue running until manually stopped.
 """
 
-from luma.core.interface.serial import spi
 from luma.core.render import canvas
-from luma.oled.device import ssd1306
 from PIL import ImageFont
+import os
+import sys
 import time
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # oled_device.py, oled_render.py
+from oled_device import create_device
+from oled_render import DirtyRegionRenderer
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
+
+# Skip frames that are already on the display (see oled_render.py)
+screen = DirtyRegionRenderer(device)
+STATIC_FRAME = "text"  # The text never changes, so it is drawn once
 
 # Load a custom font (update the path to your font file)
 font = ImageFont.truetype("./Moon_Dance/MoonDance-Regular.ttf", size=12)
 
 try:
     while True:
-        with canvas(device) as draw:
-            # Display text using the custom font
-            draw.text((10, 10), "Hello World!", font=font, fill="white")
+        if not screen.showing(STATIC_FRAME):  # Already on the display: nothing to draw or send
+            with canvas(screen) as draw:
+                # Display text using the custom font
+                draw.text((10, 10), "Hello World!", font=font, fill="white")
         
         time.sleep(1)
 
@@ -16,6 +16,7 @@ Steps:
 Dependencies:
 - luma.core
 - luma.oled
+- oled_device.py (in the parent folder, for the OLED device)
 - PIL (Pillow)
 - qrcode
 - time
@@ -29,16 +30,18 @@ Run the script, and the QR code will be displayed on the OLED screen. The progra
 """
 
 
-from luma.core.interface.serial import spi
 from luma.core.render import canvas
-from luma.oled.device import ssd1306
 from PIL import Image
 import qrcode
+import os
+import sys
 import time
 
-# Initialize SPI and OLED device
-serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
-device = ssd1306(serial)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # oled_device.py
+from oled_device import create_device
+
+# Initialize the OLED device (SPI, or I2C if SPI cannot be opened; $OLED_DEVICE picks another, see oled_device.py)
+device = create_device()
 
 # Text to convert into QR code
 text = "Araham: Together in kindness & unity. 🌟"  # Use shorter text for better scannability
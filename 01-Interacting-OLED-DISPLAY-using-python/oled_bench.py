@@ -0,0 +1,88 @@
+"""
+OLED Benchmark Harness Module
+
+Runs the OLED scripts of this folder unchanged, without any hardware, for a given number of frames: the device comes
+from a capture of the SPI interface (`oled_capture.py`, through `oled_device.py`) and the clock is simulated, so a
+script that sleeps a second between frames runs as fast as it can render them.
+
+Features:
+- `SimulatedClock` replaces `time.sleep()`, `time.time()` and `datetime.now()`. It starts at 23:59:55 on 31 December,
+  so the seconds and, after a few frames, the date change. Every `time.sleep()` ends a frame: it returns at once,
+  advances the clock, records the bytes and transfers of the frame and the time it took to render and send it.
+- `run_script(name, max_frames)` runs a script with `runpy`, from its own folder for the relative font paths, with
+  its output discarded. After `max_frames` frames the script gets a KeyboardInterrupt, so it runs its own cleanup
+  code. It returns the capture, the clock and the script's globals.
+- The first frame holds the script start-up and the display initialisation; leave it out of per-frame figures.
+
+Dependencies:
+- luma.oled
+- oled_capture.py, oled_device.py (in this folder)
+
+Usage:
+    serial, clock, script = run_script("02-digital_clock_oled.py", 20)
+    print(serial.frames[1:], clock.render_times[1:])
+"""
+
+import contextlib
+import datetime
+import io
+import os
+import runpy
+import time
+from luma.oled.device import ssd1306
+from oled_capture import CaptureSerial
+from oled_device import device_factory
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+START_TIME = datetime.datetime(2024, 12, 31, 23, 59, 55)
+
+
+class SimulatedClock:
+    # Replacement for time.sleep(), time.time() and datetime.now(): sleeping ends a frame and moves the clock on
+    def __init__(self, serial, max_frames, start=START_TIME):
+        self.serial = serial
+        self.max_frames = max_frames
+        self.now = start
+        self.render_times = []
+        self._start = time.perf_counter()
+
+    def sleep(self, seconds):
+        self.render_times.append(time.perf_counter() - self._start)
+        self.serial.end_frame()
+        if len(self.serial.frames) > self.max_frames:  # The first frame also holds the display initialisation
+            raise KeyboardInterrupt
+        self.now += datetime.timedelta(seconds=seconds)
+        self._start = time.perf_counter()
+
+    def time(self):
+        return self.now.timestamp()
+
+    def datetime_class(self):
+        clock = self
+
+        class SimulatedDatetime(datetime.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock.now
+
+        return SimulatedDatetime
+
+
+def run_script(name, max_frames, serial=None):
+    # Run the script `name` (relative to this folder) for max_frames frames after the first
+    serial = serial or CaptureSerial()
+    clock = SimulatedClock(serial, max_frames)
+    path = os.path.join(FOLDER, name)
+
+    original_sleep, original_time, original_datetime = time.sleep, time.time, datetime.datetime
+    time.sleep, time.time, datetime.datetime = clock.sleep, clock.time, clock.datetime_class()
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(path))
+    try:
+        with device_factory(lambda **kwargs: ssd1306(serial, **kwargs)), contextlib.redirect_stdout(io.StringIO()):
+            script = runpy.run_path(path, run_name="__main__")
+    finally:
+        os.chdir(cwd)
+        time.sleep, time.time, datetime.datetime = original_sleep, original_time, original_datetime
+    return serial, clock, script
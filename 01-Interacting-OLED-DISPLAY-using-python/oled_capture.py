@@ -0,0 +1,127 @@
+"""
+OLED Capture Module
+
+A stand-in for luma's `spi()`/`i2c()` serial interface that records what would be sent to an SSD1306 instead of
+sending it, so the OLED scripts can be measured without a display.
+
+Features:
+- `CaptureSerial` counts command bytes, data bytes and transfers, in total and per frame (`end_frame()`).
+- It also keeps a model of the SSD1306 display RAM (GDDRAM): the column/page address commands set the window and
+  data fills it in horizontal addressing mode, like on the real controller. `image()` returns what the display would
+  show, so partial updates can be checked against the full frame. `CaptureSerial(model=False)` only counts, which
+  keeps the capture out of render time measurements.
+- `oled_device.py` builds an SSD1306 on a capture (`OLED_DEVICE=capture`), so the scripts run unchanged.
+
+Dependencies:
+- luma.core
+- Pillow (PIL)
+
+Usage:
+    serial = CaptureSerial()
+    device = ssd1306(serial)
+    with canvas(device) as draw:
+        draw.text((10, 10), "Hello, OLED!", fill="white")
+    print(serial.end_frame())  # {"commands": 6, "data": 1024, "transfers": 2, "bytes": 1030}
+"""
+
+from PIL import Image
+
+COLUMNADDR = 0x21
+PAGEADDR = 0x22
+
+# Parameter bytes that follow each SSD1306 command (all others have none)
+COMMAND_ARGS = {
+    0x20: 1,  # Memory addressing mode
+    0x21: 2,  # Column address
+    0x22: 2,  # Page address
+    0x26: 6, 0x27: 6,  # Horizontal scroll setup
+    0x29: 5, 0x2A: 5,  # Vertical and horizontal scroll setup
+    0x81: 1,  # Contrast
+    0x8D: 1,  # Charge pump
+    0xA3: 2,  # Vertical scroll area
+    0xA8: 1,  # Multiplex ratio
+    0xD3: 1,  # Display offset
+    0xD5: 1,  # Clock divide
+    0xD9: 1,  # Pre-charge period
+    0xDA: 1,  # COM pins
+    0xDB: 1,  # VCOMH level
+}
+
+
+class CaptureSerial:
+    def __init__(self, width=128, height=64, model=True):
+        self.width = width
+        self.model = model  # False: count the bytes without updating the GDDRAM model
+        self.pages = height // 8
+        self.gddram = bytearray(width * self.pages)  # Page-major, like the controller
+        self.window = (0, width - 1, 0, self.pages - 1)
+        self._pointer = (0, 0)  # Column and page the next data byte goes to
+        self._pending = []  # Command bytes waiting for their parameters
+
+        self.command_bytes = 0
+        self.data_bytes = 0
+        self.transfers = 0
+        self.frames = []  # Counts of every finished frame
+        self._mark = (0, 0, 0)
+
+    def command(self, *cmd):
+        self.command_bytes += len(cmd)
+        self.transfers += 1
+        for byte in cmd:
+            self._pending.append(byte)
+            if len(self._pending) > COMMAND_ARGS.get(self._pending[0], 0):
+                self._execute(self._pending)
+                self._pending = []
+
+    def data(self, data):
+        self.data_bytes += len(data)
+        self.transfers += 1
+        if not self.model:
+            return
+        first, last, top, bottom = self.window
+        column, page = self._pointer
+        for byte in data:
+            self.gddram[page * self.width + column] = byte
+            column += 1
+            if column > last:
+                column = first
+                page = top if page >= bottom else page + 1
+        self._pointer = (column, page)
+
+    def cleanup(self):
+        pass
+
+    def end_frame(self):
+        # Counts since the previous end_frame()
+        commands, data, transfers = self._mark
+        frame = {
+            "commands": self.command_bytes - commands,
+            "data": self.data_bytes - data,
+            "transfers": self.transfers - transfers,
+        }
+        frame["bytes"] = frame["commands"] + frame["data"]
+        self._mark = (self.command_bytes, self.data_bytes, self.transfers)
+        self.frames.append(frame)
+        return frame
+
+    def image(self):
+        # What the display shows, as a 1-bit image (unrotated)
+        image = Image.new("1", (self.width, self.pages * 8))
+        pixels = image.load()
+        for page in range(self.pages):
+            for column in range(self.width):
+                byte = self.gddram[page * self.width + column]
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        pixels[column, page * 8 + bit] = 1
+        return image
+
+    def _execute(self, command):
+        if command[0] == COLUMNADDR:
+            self.window = (command[1], command[2]) + self.window[2:]
+        elif command[0] == PAGEADDR:
+            self.window = self.window[:2] + (command[1], command[2])
+        else:
+            return
+        self._pointer = (self.window[0], self.window[2])
+
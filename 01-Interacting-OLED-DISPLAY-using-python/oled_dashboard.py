@@ -0,0 +1,122 @@
+"""
+OLED Dashboard Module
+
+The system-info scripts repaint the whole screen every second: time, date and IP address, although only the time
+changes that often. This module splits the screen into tiles. Every widget owns one rectangle, reads its own data
+source at its own interval, and is only drawn again when the value it shows has changed.
+
+Features:
+- `Widget(name, box, interval, source, render)`: `box` is the (left, top, right, bottom) rectangle of the tile,
+  `source(now)` returns the value to show (anything that can be compared), and `render(draw, value, size)` draws it
+  into an empty tile of that size. The source is read on multiples of `interval` seconds.
+- `Dashboard(device, widgets).render(now)` reads the sources that are due, draws the tiles whose value changed and
+  pastes them into the frame it keeps; all other tiles are left as they are. The frame goes to the dirty-region
+  renderer (`oled_render.py`), which sends only the changed pages, and skips the frame if nothing changed.
+  It fits `TickScheduler.run()` (`oled_ticks.py`) as the render function.
+- `text_tile(font)` and `qr_tile()` render a value as a text line or as a QR code (needs the `qrcode` package).
+- `system_dashboard(device, font, ip_source, sensor_source)` lays out the five widgets of the system dashboard:
+  clock, date, IP address and a sensor value on the left, and a QR code of the IP address on the right.
+- Counts how often each widget was read (`polls`) and drawn (`renders`).
+
+Dependencies:
+- Pillow (PIL)
+- qrcode (for `qr_tile()`)
+
+Usage:
+    dashboard = system_dashboard(device, font, lambda now: ip_provider.address, lambda now: cpu_temperature())
+    TickScheduler(DirtyRegionRenderer(device)).run(dashboard.render)
+"""
+
+import math
+from PIL import Image, ImageDraw
+
+try:
+    import qrcode
+except ImportError:  # Only needed for QR tiles
+    qrcode = None
+
+
+class Widget:
+    def __init__(self, name, box, interval, source, render):
+        self.name = name
+        self.box = box  # (left, top, right, bottom), right and bottom excluded
+        self.size = (box[2] - box[0], box[3] - box[1])
+        self.interval = interval  # Seconds between reads of the source
+        self.source = source
+        self.render = render
+        self.value = None
+        self.due = None  # Timestamp of the next read, None = read at once
+        self.polls = 0
+        self.renders = 0
+
+
+class Dashboard:
+    def __init__(self, device, widgets):
+        self.mode = device.mode
+        self.size = device.size
+        self.widgets = list(widgets)
+        self.frame = Image.new(self.mode, self.size)
+
+    def render(self, now):
+        # The frame for `now` (a datetime), with only the changed tiles drawn again
+        timestamp = now.timestamp()
+        for widget in self.widgets:
+            if widget.due is not None and timestamp < widget.due:
+                continue
+            widget.due = (math.floor(timestamp / widget.interval) + 1) * widget.interval
+            value = widget.source(now)
+            widget.polls += 1
+            if widget.renders and value == widget.value:
+                continue
+            widget.value = value
+            tile = Image.new(self.mode, widget.size)
+            widget.render(ImageDraw.Draw(tile), value, widget.size)
+            self.frame.paste(tile, widget.box[:2])
+            widget.renders += 1
+        return self.frame
+
+    def stats(self):
+        return {widget.name: {"polls": widget.polls, "renders": widget.renders} for widget in self.widgets}
+
+
+def text_tile(font, xy=(0, 0)):
+    # Render function that draws the value as text at `xy` in the tile
+    def render(draw, value, size):
+        draw.text(xy, str(value), font=font, fill="white")
+    return render
+
+
+def qr_tile(border=1):
+    # Render function that draws the value as a QR code, as large as the tile allows, centred
+    if qrcode is None:
+        raise ImportError("QR tiles need the qrcode package")
+
+    def render(draw, value, size):
+        qr = qrcode.QRCode(border=border, box_size=1, error_correction=qrcode.constants.ERROR_CORRECT_L)
+        qr.add_data(str(value))
+        qr.make(fit=True)
+        matrix = qr.get_matrix()
+        scale = max(min(size) // len(matrix), 1)
+        left = (size[0] - len(matrix) * scale) // 2
+        top = (size[1] - len(matrix) * scale) // 2
+        # Lit background with dark modules, like the QR code scripts
+        draw.rectangle((left, top, left + len(matrix) * scale - 1, top + len(matrix) * scale - 1), fill="white")
+        for y, row in enumerate(matrix):
+            for x, dark in enumerate(row):
+                if dark:
+                    draw.rectangle((left + x * scale, top + y * scale,
+                                    left + (x + 1) * scale - 1, top + (y + 1) * scale - 1), fill="black")
+    return render
+
+
+def system_dashboard(device, font, ip_source, sensor_source, sensor_interval=5):
+    # Clock, date, IP address and sensor value on the left, a QR code of the IP address on the right
+    text = text_tile(font)
+    left = 81  # Wide enough for "192.168.100.123"
+    return Dashboard(device, [
+        Widget("clock", (0, 0, left, 16), 1, lambda now: f"{now:%H:%M:%S}", text),
+        Widget("date", (0, 16, left, 32), 60, lambda now: f"{now:%a %d-%m-%Y}", text),
+        Widget("ip", (0, 32, left, 48), 10, ip_source, text),
+        Widget("sensor", (0, 48, left, 64), sensor_interval, sensor_source, text),
+        Widget("qr", (left, 0, device.width, device.height), 10, ip_source, qr_tile()),
+    ])
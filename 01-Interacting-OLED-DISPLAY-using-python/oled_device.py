@@ -0,0 +1,106 @@
+"""
+OLED Device Module
+
+The scripts used to build `ssd1306(spi(device=0, port=0, gpio_DC=24, gpio_RST=25))` themselves, so they could only
+run on a Raspberry Pi with the display connected. They now ask this module for their device, which by default is
+still that SSD1306 on SPI, but can also be a stand-in that runs on any computer.
+
+Features:
+- `create_device()` returns the OLED device. The `OLED_DEVICE` environment variable picks the kind:
+  - `auto` (default): the SSD1306 connected via SPI, or via I2C if SPI cannot be opened.
+  - `spi`: the SSD1306 connected via SPI, with DC on GPIO 24 and RST on GPIO 25.
+  - `i2c`: the SSD1306 connected via I2C, on port 1 at address 0x3C.
+  - `capture`: an SSD1306 driven through a capture of the SPI interface (`oled_capture.py`), which records every
+    byte instead of sending it.
+  - `dummy`: luma's `dummy` device, which keeps the last frame in `device.image`.
+  Keyword arguments (`width`, `height`, `rotate`) go to the device. The bus settings (SPI speed and transfer size,
+  I2C port and address) come from the environment, see `oled_transport.py`.
+- `device_factory(factory)` makes `create_device()` call `factory(**kwargs)` while the block runs, so benchmarks can
+  run the scripts unchanged against a device of their own.
+
+Dependencies:
+- luma.core
+- luma.oled
+- oled_capture.py, oled_transport.py (in this folder)
+
+Usage:
+    device = create_device()
+
+    OLED_DEVICE=capture python3 07-Improved-oled_time_date_ip_display.py
+    OLED_SPI_SPEED=16000000 python3 08-oled_text_scroller.py
+"""
+
+import os
+from contextlib import contextmanager
+from luma.core.device import dummy
+from luma.core.error import Error as LumaError
+from luma.oled.device import ssd1306
+from oled_capture import CaptureSerial
+from oled_transport import transport_from_env
+
+DEVICE_ENV = "OLED_DEVICE"
+
+_factory = None  # Set by device_factory()
+
+
+def spi_device(**kwargs):
+    # The SSD1306 connected via SPI, as wired in readme.md
+    return ssd1306(transport_from_env("spi").open(), **kwargs)
+
+
+def i2c_device(**kwargs):
+    # The SSD1306 connected via I2C (SDA, SCL, and no DC or RST pin)
+    return ssd1306(transport_from_env("i2c").open(), **kwargs)
+
+
+def auto_device(**kwargs):
+    # SPI, else I2C; if neither can be opened, the SPI error is raised
+    try:
+        return spi_device(**kwargs)
+    except (LumaError, ImportError, OSError) as spi_error:
+        try:
+            device = i2c_device(**kwargs)
+        except (LumaError, ImportError, OSError):
+            raise spi_error from None
+        print(f"SPI not available ({spi_error}), using the OLED display on I2C")
+        return device
+
+
+def capture_device(width=128, height=64, **kwargs):
+    # An SSD1306 whose bytes are recorded by a CaptureSerial (device._serial_interface)
+    return ssd1306(CaptureSerial(width, height), width=width, height=height, **kwargs)
+
+
+def dummy_device(**kwargs):
+    # luma's dummy device: no controller at all, the frame is kept in device.image
+    return dummy(mode="1", **kwargs)
+
+
+DEVICE_KINDS = {
+    "auto": auto_device,
+    "spi": spi_device,
+    "i2c": i2c_device,
+    "capture": capture_device,
+    "dummy": dummy_device,
+}
+
+
+def create_device(kind=None, **kwargs):
+    # The OLED device of the scripts: `kind`, else $OLED_DEVICE, else SPI falling back to I2C
+    if _factory is not None:
+        return _factory(**kwargs)
+    kind = kind or os.environ.get(DEVICE_ENV, "auto")
+    if kind not in DEVICE_KINDS:
+        raise ValueError(f"Unknown OLED device {kind!r}, expected one of: {', '.join(DEVICE_KINDS)}")
+    return DEVICE_KINDS[kind](**kwargs)
+
+
+@contextmanager
+def device_factory(factory):
+    # Make create_device() return factory(**kwargs) while the block runs
+    global _factory
+    original, _factory = _factory, factory
+    try:
+        yield factory
+    finally:
+        _factory = original
@@ -0,0 +1,170 @@
+"""
+OLED Font Registry Module
+
+Every OLED script loads its TrueType fonts at start-up with `ImageFont.truetype()`, so every new process parses the
+TTF file with FreeType again, once per size. This module keeps one font object per (file, size) in the process, and
+compiles each TrueType size into a PIL bitmap font (`.pil` metrics + `.pbm` glyph sheet, a few KB) that is cached on
+disk. Later start-ups load the bitmap font and never touch FreeType.
+
+Compiling a font takes 20-40 times longer than opening it with FreeType (about 120 ms against 5 ms on a desktop), so
+on a cache miss `load_font()` returns the TrueType font at once and compiles the bitmap font in a background thread,
+for the next start. The thread starts `COMPILE_DELAY` seconds later, so it does not hold up the first frames; a
+script that ends before then leaves the cache for a later start (`save_bitmap_font()` fills it right away).
+
+Features:
+- `load_font(path, size)` returns the same object for the same file and size within a process.
+- The bitmap font is rendered from the TrueType font in 1-bit mode, so text drawn with it is identical to text drawn
+  with hinted TrueType fonts like DejaVuSans on the OLED (unhinted script fonts: see `oled_glyphs.py`). It covers
+  Latin-1 (codes 32-255), which is what PIL bitmap fonts can hold.
+- The cache key includes the file's size and modification time (for a font name, of the file FreeType finds for it),
+  so an edited, upgraded or replaced font file is compiled again.
+- `getbbox()` of the bitmap font measures the ink height like FreeType fonts do, so layouts based on it do not move.
+- `bitmap=False` returns the TrueType font (e.g. for text outside Latin-1). A missing font raises `OSError`, like
+  `ImageFont.truetype()`, so the scripts keep their `ImageFont.load_default()` fallback.
+- The cache directory is `~/.cache/oled-fonts`, or `$OLED_FONT_CACHE` if set. If it cannot be written (read-only
+  home, full disk) or a cached font cannot be read, the TrueType font is used.
+- Loading the bitmap font skips `Image.open()` and hands the glyph sheet to `ImageFont.ImageFont._load_pilfont_data()`,
+  the loader behind `ImageFont.load()`. This is Pillow's private API (tested with Pillow 12.3); on a Pillow without it,
+  `load_font()` returns TrueType fonts.
+
+Dependencies:
+- Pillow (PIL)
+- oled_glyphs.py (in this folder)
+
+Usage:
+    font = load_font("./Moon_Dance/MoonDance-Regular.ttf", 20)  # First run: TrueType, bitmap font cached meanwhile
+    draw.text((10, 10), "Hello World!", font=font, fill="white")
+"""
+
+import io
+import os
+import struct
+import threading
+import zlib
+from PIL import FontFile, Image, ImageFont
+from oled_glyphs import GlyphAtlas
+
+CACHE_DIR = os.environ.get("OLED_FONT_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "oled-fonts"))
+CACHE_VERSION = 2  # Bump when the compiled format changes
+FIRST_CODE = 32  # Codes below are control characters
+LAST_CODE = 255  # PIL bitmap fonts hold 256 codes
+COMPILE_DELAY = 1.0  # Seconds from a cache miss until the bitmap font is compiled
+BITMAP_FONTS = hasattr(ImageFont.ImageFont, "_load_pilfont_data")  # Private Pillow loader, see above
+
+_fonts = {}
+
+
+class BitmapFont(ImageFont.ImageFont):
+    # PIL bitmap font whose getbbox() reports the top and bottom of the ink, like a FreeType font,
+    # instead of the full line height
+    def read(self, filename):
+        # Reads the glyph sheet (a plain PBM) directly: Image.open() would first import the image format plugins,
+        # which takes longer than loading the whole font
+        with open(os.path.splitext(filename)[0] + ".pbm", "rb") as f:
+            _, size, bits = f.read().split(b"\n", 2)
+        image = Image.frombytes("1", tuple(int(value) for value in size.split()), bits, "raw", "1;I")
+        with open(filename, "rb") as f:
+            pil = f.read()
+        self.file = filename
+        self._load_pilfont_data(io.BytesIO(pil), image)
+
+        # The 256 metrics of 10 shorts follow the header; see PIL.FontFile.save()
+        data = pil[pil.index(b"DATA\n") + 5:]
+        self._rows = {}  # code -> (top, bottom) of the ink, from the top of the line
+        metrics = [struct.unpack(">10h", data[i * 20:i * 20 + 20]) for i in range(256)]
+        baseline = -min(metric[3] for metric in metrics)  # Bitmap fonts draw from the highest glyph top
+        for code, metric in enumerate(metrics):
+            if metric[5] > metric[3]:
+                self._rows[code] = (metric[3] + baseline, metric[5] + baseline)
+
+    def getbbox(self, text, *args, **kwargs):
+        left, _, right, _ = super().getbbox(text, *args, **kwargs)
+        rows = [self._rows[code] for code in text.encode("latin-1", "replace") if code in self._rows]
+        if not rows:
+            return left, 0, right, 0
+        return left, min(top for top, _ in rows), right, max(bottom for _, bottom in rows)
+
+
+def load_font(path, size, bitmap=True):
+    # Shared font for `path` (a file, or a name FreeType finds, like "DejaVuSans.ttf") at `size`
+    key = (os.path.abspath(path) if os.path.exists(path) else path, size, bitmap)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = _load_bitmap_font(path, size) if bitmap else ImageFont.truetype(path, size)
+    return font
+
+
+def cache_path(path, size):
+    # Where the compiled bitmap font of `path` at `size` is stored
+    if not os.path.exists(path):
+        # A font name: the file FreeType finds for it, so an upgraded or replaced font is compiled again.
+        # Opening the font is cheap, only rendering goes through FreeType. A missing font raises OSError.
+        path = ImageFont.truetype(path, size).path
+    stat = os.stat(path)
+    identity = [os.path.abspath(path), size, stat.st_size, stat.st_mtime_ns, CACHE_VERSION]
+    digest = zlib.crc32(repr(identity).encode())  # zlib, unlike hashlib, is already loaded by PIL
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, f"{name}-{size}-{digest:08x}.pil")
+
+
+def compile_font(truetype):
+    # Bitmap font (FontFile) with the 1-bit glyphs of a TrueType font
+    atlas = GlyphAtlas(truetype)
+    ascent = truetype.getmetrics()[0]
+    font = FontFile.FontFile()
+    blank = Image.new("1", (1, 1))
+    for code in range(FIRST_CODE, LAST_CODE + 1):
+        image, left, top, advance, _ = atlas.glyph(chr(code))
+        advance = int(round(advance))
+        if image is None:
+            font.glyph[code] = ((advance, 0), (0, 0, 0, 0), (0, 0, 0, 0), blank)
+            continue
+        left, top = int(left), int(top)
+        width, height = image.size
+        # Destination box relative to the baseline, source box within the glyph image
+        font.glyph[code] = ((advance, 0), (left, top - ascent, left + width, top - ascent + height),
+                            (0, 0, width, height), image)
+    # An empty glyph at the ascent keeps the top of the line where FreeType has it
+    font.glyph[0] = ((0, 0), (0, -ascent, 0, -ascent), (0, 0, 0, 0), blank)
+    return font
+
+
+def _load_bitmap_font(path, size):
+    pil_path = cache_path(path, size)
+    if BITMAP_FONTS and os.path.exists(pil_path):
+        font = BitmapFont()
+        try:
+            font.read(pil_path)
+            return font
+        except (OSError, ValueError, SyntaxError) as error:
+            print(f"Cached font {pil_path} not readable ({error}), using the TrueType font")
+            return ImageFont.truetype(path, size)
+    font = ImageFont.truetype(path, size)  # A missing font raises OSError here
+    if BITMAP_FONTS:
+        # A daemon thread never holds up the exit (e.g. Ctrl+C); if it is stopped halfway, only temporary files
+        # are left, and the next start compiles the font again
+        compiler = threading.Timer(COMPILE_DELAY, save_bitmap_font, args=(path, size, pil_path))
+        compiler.name = "oled-font-cache"
+        compiler.daemon = True
+        compiler.start()
+    return font
+
+
+def save_bitmap_font(path, size, pil_path):
+    # Compile the bitmap font and store it at `pil_path`; on errors the cache is skipped
+    root = os.path.splitext(pil_path)[0]
+    temporary = f"{root}.{os.getpid()}.{threading.get_ident()}"  # Never read half-written by another process
+    try:
+        compiled = compile_font(ImageFont.truetype(path, size))  # Own font object, the caller draws with the other
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        compiled.save(temporary + ".pil")
+        # FontFile saves the glyph sheet as PNG; a plain PBM loads without any image plugin
+        compiled.bitmap.save(temporary + ".pbm", "PPM")
+        os.replace(temporary + ".pbm", root + ".pbm")
+        os.replace(temporary + ".pil", pil_path)
+    except OSError as error:
+        print(f"Font cache not written ({error}), the TrueType font stays in use")
+    finally:
+        for extension in (".pil", ".pbm", ".png"):
+            if os.path.exists(temporary + extension):
+                os.remove(temporary + extension)
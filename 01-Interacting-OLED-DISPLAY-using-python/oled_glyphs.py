@@ -0,0 +1,121 @@
+"""
+OLED Glyph Atlas Module
+
+`draw.text()` runs every string through FreeType again on every frame, although a clock only ever shows the same
+dozen characters ("0"-"9", ":", "-", ".", and a few letters). This module rasterises each character of a font once into
+a 1-bit glyph image and composes strings by pasting the cached glyphs.
+
+Features:
+- One `GlyphAtlas` per font (path and size); `glyph_atlas(font)` returns the shared atlas of a font.
+- A glyph is rasterised the first time it is used, with the font's own bounding box offsets, and kept with its
+  advance width. The kerning of each character pair is measured once and cached as well.
+- `draw(draw, xy, text, fill)` places the glyphs where `draw.text()` with the same font would. The result is identical
+  for hinted fonts like DejaVuSans and the default font; with unhinted script fonts, whose glyphs sit at fractional
+  positions, a glyph can land one pixel off. `width(text)` measures a string from the cache.
+- Works with TrueType fonts and with `ImageFont.load_default()`. Strings with line breaks go to `draw.text()`.
+
+Dependencies:
+- Pillow (PIL)
+
+Usage:
+    font = ImageFont.truetype("DejaVuSans.ttf", 14)
+    text = glyph_atlas(font)
+    with canvas(device) as draw:
+        text.draw(draw, (0, 0), "Time: 12:00:00", fill="white")  # Instead of draw.text((0, 0), ..., font=font)
+"""
+
+from PIL import Image, ImageDraw
+
+MODE = "1"  # The OLED's 1-bit mode; FreeType hints glyphs and advances differently for it
+
+
+class GlyphAtlas:
+    def __init__(self, font):
+        self.font = font
+        self.glyphs = {}  # char -> (1-bit image or None, x offset, y offset, advance width, x offset at the start)
+        self.kerning = {}  # (previous char, char) -> extra advance
+        self.rasterised = 0
+
+    def glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.glyphs[char] = self._rasterise(char)
+        return glyph
+
+    def draw(self, draw, xy, text, fill="white"):
+        # Paste the glyphs of `text` with their top left at `xy`, like draw.text(xy, text, font=font, fill=fill)
+        if "\n" in text:
+            draw.text(xy, text, font=self.font, fill=fill)
+            return
+        x, y = xy
+        previous = None
+        for char in text:
+            image, left, top, advance, first_left = self.glyph(char)
+            if previous is None:
+                left = first_left
+            else:
+                x += self._kerning(previous, char)
+            if image is not None:
+                draw.bitmap((int(x + 0.5) + left, y + top), image, fill=fill)
+            x += advance
+            previous = char
+
+    def width(self, text):
+        # Advance width of `text` in pixels
+        width = 0.0
+        previous = None
+        for char in text:
+            if previous is not None:
+                width += self._kerning(previous, char)
+            width += self.glyph(char)[3]
+            previous = char
+        return width
+
+    def _rasterise(self, char):
+        # Draw the character the way draw.text() would, then keep only its ink. FreeType places a glyph with a
+        # negative left bearing differently at the start of a string, so the offset is measured both ways.
+        self.rasterised += 1
+        advance = self.font.getlength(char, mode=MODE)
+        image, first_left, top = self._ink(char)
+        if image is None:
+            return None, 0, 0, advance, 0  # Space and other blank characters
+        pen = self.font.getlength(" " + char, mode=MODE) - advance  # Where the character starts after a space
+        left = self._ink(" " + char)[1] - pen
+        return image, left, top, advance, first_left
+
+    def _ink(self, text):
+        # Ink of `text` drawn at the origin, and its offset
+        left, top, right, bottom = self.font.getbbox(text, mode=MODE)
+        margin = max(right - left, bottom - top, 1)
+        canvas = Image.new(MODE, (right - min(left, 0) + 2 * margin, bottom - min(top, 0) + 2 * margin))
+        ImageDraw.Draw(canvas).text((margin, margin), text, font=self.font, fill=1)
+        ink = canvas.getbbox()
+        if ink is None:
+            return None, 0, 0
+        return canvas.crop(ink), ink[0] - margin, ink[1] - margin
+
+    def _kerning(self, previous, char):
+        pair = (previous, char)
+        kerning = self.kerning.get(pair)
+        if kerning is None:
+            kerning = self.font.getlength(previous + char, mode=MODE) - self.glyph(previous)[3] - self.glyph(char)[3]
+            self.kerning[pair] = kerning
+        return kerning
+
+
+_atlases = {}
+
+
+def font_key(font):
+    # Font file and size, or the font object itself for fonts without a file
+    path = getattr(font, "path", None)
+    return (path, font.size) if isinstance(path, str) else id(font)
+
+
+def glyph_atlas(font):
+    # Shared atlas per font file and size (or per font object for fonts without a file)
+    key = font_key(font)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font)
+    return atlas
@@ -0,0 +1,167 @@
+"""
+OLED IP Address Module
+
+The system-info scripts looked up the IP address inside their render loop: once per second they created a UDP socket,
+`connect()`ed it to 8.8.8.8 and closed it again, although the address almost never changes. This module keeps the
+current address in memory and looks it up again in a background thread, only when the network configuration changes.
+
+Features:
+- `address` returns the cached address at once; the render loop never waits on a network syscall.
+- On Linux, a netlink route socket reports link, address and route changes as they happen. Where netlink is not
+  available, the thread polls `/proc/net/route` and `/sys/class/net` every `poll_interval` seconds instead and
+  only looks the address up when they changed.
+- The lookup uses the "connect a UDP socket" trick, which only asks the kernel for the route to 8.8.8.8 and sends
+  no packets. Without a default route, it falls back to the address of the first interface that is up, and then to
+  `fallback` ("No IP"). The thread keeps running, so the address appears as soon as the network comes back.
+- Errors of the netlink socket never end the thread: after lost notifications (ENOBUFS, when a burst overflows the
+  receive buffer) the address is looked up again, and if the socket fails for good the thread falls back to polling.
+- Counts the lookups (`lookups`) so the savings can be checked.
+
+Dependencies:
+- socket, select, threading, fcntl (Linux, for the interface fallback)
+
+Usage:
+    ip_provider = IPAddressProvider()
+    ip_provider.start()  # One lookup now, then only after network changes
+    draw.text((0, 40), f"IP: {ip_provider.address}", fill="white")
+"""
+
+import os
+import select
+import socket
+import struct
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Not on Linux/Unix
+    fcntl = None
+
+PROBE_ADDRESS = ("8.8.8.8", 80)  # Any public address; no packets are sent to it
+NET_CLASS_PATH = "/sys/class/net"
+ROUTE_PATH = "/proc/net/route"
+SIOCGIFADDR = 0x8915  # ioctl: IPv4 address of an interface
+
+# Netlink route multicast groups
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV4_ROUTE = 0x40
+
+
+def lookup_address(fallback="No IP"):
+    # The source address the kernel would use for outgoing traffic
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(PROBE_ADDRESS)  # UDP: only picks a route, nothing is sent
+            return s.getsockname()[0]
+    except OSError:
+        return interface_address() or fallback
+
+
+def interface_address():
+    # IPv4 address of the first interface that is up (other than loopback), None if there is none
+    if fcntl is None or not os.path.isdir(NET_CLASS_PATH):
+        return None
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for name in sorted(os.listdir(NET_CLASS_PATH)):
+            if name == "lo" or _read(os.path.join(NET_CLASS_PATH, name, "operstate")) != "up":
+                continue
+            try:
+                request = struct.pack("256s", name.encode()[:15])
+                return socket.inet_ntoa(fcntl.ioctl(s.fileno(), SIOCGIFADDR, request)[20:24])
+            except OSError:
+                continue  # Up, but no IPv4 address
+    return None
+
+
+def network_state():
+    # Routes and interface states, to see whether anything changed since the last poll
+    state = [_read(ROUTE_PATH)]
+    if os.path.isdir(NET_CLASS_PATH):
+        for name in sorted(os.listdir(NET_CLASS_PATH)):
+            state.append((name, _read(os.path.join(NET_CLASS_PATH, name, "operstate"))))
+    return state
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class IPAddressProvider:
+    def __init__(self, poll_interval=10.0, fallback="No IP"):
+        self.poll_interval = poll_interval  # Seconds between polls when there is no netlink socket
+        self.fallback = fallback
+        self.address = fallback
+        self.lookups = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        # Look the address up once (before the render loop starts), then watch for changes in the background
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="oled-ip", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def refresh(self):
+        self.address = lookup_address(self.fallback)  # A single assignment, so readers never see a partial value
+        self.lookups += 1
+
+    def _run(self):
+        watcher = self._open_netlink()
+        try:
+            if watcher is None or not self._watch_netlink(watcher):
+                self._poll()
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+    def _open_netlink(self):
+        if not hasattr(socket, "AF_NETLINK"):
+            return None
+        try:
+            watcher = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            watcher.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV4_ROUTE))
+        except OSError:
+            return None
+        watcher.setblocking(False)
+        return watcher
+
+    def _watch_netlink(self, watcher):
+        # Wake up on change notifications; the timeout only lets stop() end the thread.
+        # Returns False if the socket failed, so the caller polls instead.
+        while not self._stop.is_set():
+            try:
+                readable, _, _ = select.select([watcher], [], [], self.poll_interval)
+            except (OSError, ValueError):
+                return False
+            if not readable:
+                continue
+            # A change usually comes as a burst of messages: read them all, then look up once
+            try:
+                while watcher.recv(65536):
+                    pass
+            except BlockingIOError:
+                pass  # All read
+            except OSError:
+                pass  # Notifications were lost (ENOBUFS); the lookup below catches up with them
+            self.refresh()
+        return True
+
+    def _poll(self):
+        state = network_state()
+        while not self._stop.wait(self.poll_interval):
+            current = network_state()
+            if current != state:
+                state = current
+                self.refresh()
@@ -0,0 +1,107 @@
+"""
+OLED Text Layout Module
+
+The scripts placed their lines at fixed coordinates like (0, 20) and (0, 40), estimated line heights from the size of
+"Test", or assumed 8 pixels per character. This module measures the real extent of the text (the box its ink covers
+when drawn at the origin) and stacks lines from it, fitted to the display.
+
+Features:
+- `text_extent(font, text)` measures a string in the OLED's 1-bit mode and caches the result per font and string
+  shape: every digit is replaced by the font's widest digit, so "12:34:56" and "23:59:59" share one measurement, and
+  the width is never too small. A string is measured again only when its length, its letters or the font change.
+- `StackedLines(device, fonts, spacing)` stacks one line per font from top to bottom. `spacing` is the gap in pixels
+  between the ink of two lines; it shrinks if the lines would not fit `device.height`. Without `spacing`, the lines
+  are spread evenly over the whole height. The positions are computed again only when a string shape changes, so
+  laying out a frame costs a dictionary lookup.
+- `fit_text(font, text, width)` cuts a string to the pixels available (e.g. `device.width`).
+
+Dependencies:
+- Pillow (PIL)
+- oled_glyphs.py (in this folder)
+
+Usage:
+    lines = StackedLines(device, [font_main, font_main, font_ip], spacing=6)
+    texts = [f"Time: {current_time}", f"Date: {current_date}", f"IP: {ip_address}"]
+    for xy, text, font in zip(lines.positions(texts), texts, lines.fonts):
+        draw.text(xy, text, font=font, fill="white")
+"""
+
+from oled_glyphs import MODE, font_key
+
+DIGITS = "0123456789"
+
+_widest_digits = {}  # font key -> str.maketrans() table that turns every digit into the widest one
+_extents = {}  # (font key, shape) -> (left, top, right, bottom)
+_fitted = {}  # (font key, shape, width) -> number of characters that fit
+
+
+def text_shape(font, text):
+    # `text` with every digit replaced by the widest digit of the font
+    key = font_key(font)
+    table = _widest_digits.get(key)
+    if table is None:
+        widest = max(DIGITS, key=lambda digit: font.getlength(digit, mode=MODE))
+        table = _widest_digits[key] = str.maketrans(DIGITS, widest * len(DIGITS))
+    return text.translate(table)
+
+
+def text_extent(font, text):
+    # (left, top, right, bottom) of the ink of `text` drawn at (0, 0); (0, 0, 0, 0) for blank text
+    key = (font_key(font), text_shape(font, text))
+    extent = _extents.get(key)
+    if extent is None:
+        extent = font.getbbox(key[1], mode=MODE) if key[1].strip() else (0, 0, 0, 0)
+        extent = _extents[key] = tuple(int(value) for value in extent)
+    return extent
+
+
+def fit_text(font, text, width, x=0):
+    # The longest start of `text` that ends within `width` pixels when drawn at `x`
+    key = (font_key(font), text_shape(font, text), width - x)
+    length = _fitted.get(key)
+    if length is None:
+        length = len(text)
+        while length and text_extent(font, text[:length])[2] > width - x:
+            length -= 1
+        _fitted[key] = length
+    return text[:length]
+
+
+class StackedLines:
+    def __init__(self, device, fonts, spacing=None, x=0):
+        self.height = device.height
+        self.fonts = list(fonts)
+        self.spacing = spacing  # Gap between lines in pixels; None spreads the lines over the whole height
+        self.x = x
+        self.measured = 0  # How often the positions were computed
+        self._shapes = None
+        self._positions = None
+
+    def positions(self, texts):
+        # Top left (x, y) to draw each text at, as for draw.text()
+        shapes = [text_shape(font, text) for font, text in zip(self.fonts, texts)]
+        if shapes != self._shapes:
+            self._shapes = shapes
+            self._positions = self._stack(shapes)
+            self.measured += 1
+        return self._positions
+
+    def _stack(self, shapes):
+        extents = [text_extent(font, shape) for font, shape in zip(self.fonts, shapes)]
+        heights = [bottom - top for _, top, _, bottom in extents]
+        gaps = len(extents) - 1
+        free = max(self.height - sum(heights), 0)
+        if gaps == 0:
+            spacing = [0]
+        elif self.spacing is None or self.spacing * gaps > free:
+            # Spread the free rows evenly; the first gaps get the rows left over
+            spacing = [free // gaps + (gap < free % gaps) for gap in range(gaps)]
+        else:
+            spacing = [self.spacing] * gaps
+
+        positions = []
+        y = 0  # Top row of the ink of the next line
+        for (_, top, _, _), height, gap in zip(extents, heights, spacing + [0]):
+            positions.append((self.x, y - top))  # draw.text() puts the ink `top` rows below its y
+            y += height + gap
+        return positions
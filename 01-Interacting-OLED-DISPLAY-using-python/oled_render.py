@@ -0,0 +1,184 @@
+"""
+OLED Partial Refresh Module
+
+`with canvas(device)` hands the finished image to `ssd1306.display()`, which always sends the whole 128x64 frame
+(1024 data bytes). In a clock only the seconds digits change, so most of those bytes repeat what the display already
+shows. This module keeps a copy of the last frame sent, in the SSD1306's own memory layout (8 pages of 8 pixel rows,
+one byte per column and page), and only sends the parts that changed.
+
+Features:
+- `DirtyRegionRenderer(device)` can be used like the device itself: `with canvas(screen) as draw:`.
+- For every page, the first and last changed columns form a window. Windows of neighbouring pages are merged into one
+  rectangle when that sends fewer bytes than addressing them separately (each window costs 6 command bytes).
+- Every window is sent with the column/page address commands (0x21/0x22) followed by its data; the SSD1306 (in the
+  horizontal addressing mode luma sets up) fills exactly that rectangle.
+- Frame-hash gate: a frame whose image hashes the same as the last frame shown is skipped before any packing or
+  transfer. The first frame, and the frame after `invalidate()`, is sent in full.
+- Static frames: `showing(key)` returns True while the frame the caller drew under that key is still on the display,
+  so the caller can skip drawing it at all.
+- `prepare(image)` does all the work up to the transfer and `send(prepared)` only transfers, so a frame can be made
+  ready in advance and sent at a set time (`oled_ticks.py`). `display(image)` does both.
+- Counts frames sent and skipped, windows and bytes sent, and the bytes the same frames would have cost as full frames.
+- Other devices than the SSD1306 (e.g. SH1106, which uses page addressing) get full frames from their own `display()`.
+
+Dependencies:
+- luma.oled
+- Pillow (PIL)
+
+Usage:
+    device = ssd1306(serial)
+    screen = DirtyRegionRenderer(device)
+    with canvas(screen) as draw:  # Instead of canvas(device)
+        draw.text((10, 10), "Time: 12:00:00", fill="white")
+    print(screen.stats())
+
+    if not screen.showing("logo"):  # Draw a static frame only once
+        with canvas(screen) as draw:
+            draw.rectangle((10, 10, 50, 50), outline="white")
+"""
+
+import hashlib
+from PIL import Image
+from luma.oled.device import ssd1306
+
+WINDOW_OVERHEAD = 6  # Command bytes per window: COLUMNADDR start end, PAGEADDR start end
+
+
+def pack_pages(image, pages):
+    # SSD1306 page bytes of a 1-bit image: pages[p][x] holds rows 8p..8p+7 of column x (LSB at the top).
+    # Transposing makes every image column one row of `pages` bytes (bottom page first, highest row in the MSB),
+    # so each page is a strided slice of the result.
+    data = image.transpose(Image.Transpose.TRANSVERSE).tobytes()
+    return [data[pages - 1 - page::pages][::-1] for page in range(pages)]
+
+
+def changed_span(old, new):
+    # First and last differing column of two pages
+    first = 0
+    while old[first] == new[first]:
+        first += 1
+    last = len(new) - 1
+    while old[last] == new[last]:
+        last -= 1
+    return first, last
+
+
+class DirtyRegionRenderer:
+    def __init__(self, device, merge=True):
+        self.device = device
+        self.merge = merge
+        self.mode = device.mode
+        self.size = device.size
+        self.width = device.width
+        self.height = device.height
+        self.partial = isinstance(device, ssd1306)  # Needs horizontal addressing with COLUMNADDR/PAGEADDR
+        self._pages = device._h // 8 if self.partial else 0
+        self._last = None  # Page bytes of the last frame sent, None = unknown
+        self._digest = None  # Hash of the last frame shown
+        self._key = None  # Static frame key of the last frame shown
+        self._pending_key = None  # Key of the frame being drawn
+        # Statistics
+        self.frames = 0
+        self.sent = 0
+        self.skipped = 0
+        self.windows = 0
+        self.bytes_sent = 0
+        self.full_bytes = 0  # What the same frames would have cost as full frames
+        self._full_frame = WINDOW_OVERHEAD + device.width * device.height // 8
+
+    def display(self, image):
+        self.send(self.prepare(image))
+
+    def prepare(self, image):
+        # Everything display() does before the transfer, so a frame can be made ready ahead of time.
+        # Frames must be sent in the order they were prepared.
+        assert image.mode == self.mode
+        assert image.size == self.size
+        self.frames += 1
+        self.full_bytes += self._full_frame
+        self._key, self._pending_key = self._pending_key, None
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        if digest == self._digest:
+            self.skipped += 1
+            return None
+        self._digest = digest
+        self.sent += 1
+        if not self.partial:
+            return image
+
+        pages = pack_pages(self.device.preprocess(image), self._pages)
+        columns = len(pages[0])
+        if self._last is None:
+            windows = [(0, columns - 1, 0, self._pages - 1)]
+        else:
+            windows = self._windows(self._last, pages)
+        self._last = pages
+
+        colstart = self.device._colstart
+        const = self.device._const
+        transfers = []
+        for first, last, top, bottom in windows:
+            data = b"".join(page[first:last + 1] for page in pages[top:bottom + 1])
+            transfers.append(((const.COLUMNADDR, colstart + first, colstart + last, const.PAGEADDR, top, bottom),
+                              list(data)))
+            self.windows += 1
+            self.bytes_sent += WINDOW_OVERHEAD + len(data)
+        return transfers
+
+    def send(self, prepared):
+        # Transfer a frame returned by prepare()
+        if prepared is None:
+            return  # Already on the display
+        if not self.partial:
+            self.device.display(prepared)
+            return
+        for command, data in prepared:
+            self.device.command(*command)
+            self.device.data(data)
+
+    def showing(self, key):
+        # True if the static frame drawn under `key` is still on the display (counted as skipped).
+        # Otherwise the next display() is remembered under `key`.
+        if key is not None and key == self._key:
+            self.frames += 1
+            self.full_bytes += self._full_frame
+            self.skipped += 1
+            return True
+        self._pending_key = key
+        return False
+
+    def invalidate(self):
+        # Forget the last frame so the next one is sent in full, e.g. after device.clear()
+        self._last = None
+        self._digest = None
+        self._key = None
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "sent": self.sent,
+            "skipped": self.skipped,
+            "windows": self.windows,
+            "bytes_sent": self.bytes_sent,
+            "full_bytes": self.full_bytes,
+        }
+
+    def _windows(self, old_pages, new_pages):
+        # (first column, last column, first page, last page) of every rectangle to send
+        windows = []
+        for page, (old, new) in enumerate(zip(old_pages, new_pages)):
+            if old == new:
+                continue
+            first, last = changed_span(old, new)
+            if self.merge and windows:
+                prev_first, prev_last, top, bottom = windows[-1]
+                if bottom == page - 1:
+                    # One rectangle over both pages, if it is not more than the two windows
+                    union_first, union_last = min(first, prev_first), max(last, prev_last)
+                    merged = (union_last - union_first + 1) * (page - top + 1)
+                    separate = (prev_last - prev_first + 1) * (bottom - top + 1) + WINDOW_OVERHEAD + last - first + 1
+                    if merged <= separate:
+                        windows[-1] = (union_first, union_last, top, page)
+                        continue
+            windows.append((first, last, page, page))
+        return windows
@@ -0,0 +1,105 @@
+"""
+OLED Text Scroll Module
+
+The scroller drew the whole message with `draw.text()` for every 1-pixel step and sent a full frame each time. This
+module renders the message once and then either crops a display-sized window from it per step, or hands the scrolling
+to the SSD1306 itself.
+
+Features:
+- `TextScroller(device, font, text, y)` renders the text once into a 1-bit strip: one blank display width, the text
+  at its measured width (`oled_layout.py`), and another blank display width. `frame()` crops the window of the
+  current step and moves on by `step` pixels; nothing is rasterised again. The text starts at the left edge, scrolls
+  to the left until it has left the screen, and comes back in from the right. Sent through a `DirtyRegionRenderer`,
+  only the pages the text covers are transferred.
+- `HardwareScroll(device)` shows one frame and sets up the SSD1306's continuous horizontal scroll (commands 0x26/0x27)
+  for the pages with ink, then activates it (0x2F). The controller rotates those pages by one column every `interval`
+  of its own frames (about 107 per second on a 128x64 module), so the host sends nothing per step. `stop()`
+  deactivates it (0x2E).
+- The controller can only rotate what is in its 128 columns: text wider than the display is cut, and the end of the
+  text wraps round to the other side directly. Hardware scroll needs an SSD1306 at rotation 0 or 2, and the display
+  RAM must not be written while it runs; after `stop()` the RAM holds the shifted image, so a `DirtyRegionRenderer`
+  has to be `invalidate()`d.
+
+Dependencies:
+- luma.oled
+- Pillow (PIL)
+- oled_layout.py (in this folder)
+
+Usage:
+    scroller = TextScroller(device, font, "This is a scrolling text message!", y=10)
+    while True:
+        screen.display(scroller.frame())  # screen = DirtyRegionRenderer(device)
+        time.sleep(0.05)
+
+    scroll = HardwareScroll(device)
+    scroll.start(scroller.frame())  # The SSD1306 keeps scrolling on its own
+"""
+
+from PIL import Image, ImageDraw
+from luma.oled.device import ssd1306
+from oled_layout import text_extent
+
+# SSD1306 scroll commands
+RIGHT_HORIZONTAL_SCROLL = 0x26
+LEFT_HORIZONTAL_SCROLL = 0x27
+DEACTIVATE_SCROLL = 0x2E
+ACTIVATE_SCROLL = 0x2F
+
+# Scroll step interval codes, by the number of controller frames per step
+SCROLL_INTERVALS = {2: 0b111, 3: 0b100, 4: 0b101, 5: 0b000, 25: 0b110, 64: 0b001, 128: 0b010, 256: 0b011}
+
+
+class TextScroller:
+    def __init__(self, device, font, text, y=0, step=1):
+        self.width = device.width
+        self.height = device.height
+        self.step = step
+        self.text_width = text_extent(font, text)[2]  # Where the ink of the text ends
+        self.strip = Image.new(device.mode, (2 * self.width + self.text_width, self.height))
+        ImageDraw.Draw(self.strip).text((self.width, y), text, font=font, fill="white")
+        self.position = 0  # Screen x of the start of the text
+
+    def frame(self):
+        # The display-sized window of the current step, then move on
+        offset = self.width - self.position
+        image = self.strip.crop((offset, 0, offset + self.width, self.height))
+        self.position -= self.step
+        if self.position < -self.text_width:  # The text has left the screen
+            self.position = self.width
+        return image
+
+
+class HardwareScroll:
+    def __init__(self, device, interval=5):
+        if not isinstance(device, ssd1306):
+            raise TypeError("hardware scroll needs an SSD1306")
+        if device.rotate not in (0, 2):
+            raise ValueError("hardware scroll needs rotation 0 or 2")
+        if interval not in SCROLL_INTERVALS:
+            raise ValueError(f"interval must be one of {sorted(SCROLL_INTERVALS)} frames")
+        self.device = device
+        self.interval = interval  # Controller frames per 1-column step
+        self.active = False
+
+    def start(self, image, direction="left"):
+        # Show `image` and scroll the pages it has ink on to the left (or "right")
+        self.stop()  # The RAM must not be written while scrolling
+        self.device.display(image)
+        ink = self.device.preprocess(image).getbbox()
+        if ink is None:
+            return
+        # At rotation 2 the image is upside down in RAM, so the controller has to scroll the other way
+        left = (direction == "left") == (self.device.rotate == 0)
+        self.device.command(LEFT_HORIZONTAL_SCROLL if left else RIGHT_HORIZONTAL_SCROLL,
+                            0x00,  # Dummy byte
+                            ink[1] // 8,  # First page
+                            SCROLL_INTERVALS[self.interval],
+                            (ink[3] - 1) // 8,  # Last page
+                            0x00, 0xFF,  # Dummy bytes
+                            ACTIVATE_SCROLL)
+        self.active = True
+
+    def stop(self):
+        if self.active:
+            self.device.command(DEACTIVATE_SCROLL)
+            self.active = False
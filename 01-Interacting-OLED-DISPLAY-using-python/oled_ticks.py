@@ -0,0 +1,105 @@
+"""
+OLED Tick Scheduler Module
+
+The clock scripts drew the time and then called `time.sleep(1)`, so every loop took one second plus the time to
+render and send the frame. The shown second fell further behind the real one, and every so often a second was skipped
+on the display. This module runs the loop on the wall clock instead: it renders the frame of the next second in
+advance and sends it when that second begins.
+
+Features:
+- `TickScheduler(screen)` calls `render(now)` with the time of the next tick (a `datetime` on a whole second, or on a
+  multiple of `period`), prepares the frame with `screen.prepare()` (`oled_render.py`) and sleeps until the tick.
+  At the tick only the transfer is left (`screen.send()`). The current second is shown at once when `run()` starts.
+- Lateness: how long after its tick each frame was sent, for the last `history` ticks. `stats()` returns the number
+  of ticks, the mean and maximum lateness in milliseconds and the ticks missed because a frame was not ready in time;
+  a missed tick is left out rather than shown late.
+- `CachedLayer(device)` holds the part of a frame that changes rarely, like the date: `get(key, draw)` draws it again
+  only when `key` changes, and frames start from a copy of it.
+- `clock` and `sleep` can be replaced (e.g. by a simulated clock).
+
+Dependencies:
+- Pillow (PIL)
+- oled_render.py (in this folder), or any screen with prepare()/send()
+
+Usage:
+    date_layer = CachedLayer(device)
+
+    def render_frame(now):
+        frame = date_layer.get(now.date(), lambda draw: draw.text((0, 20), f"Date: {now:%Y-%m-%d}", fill="white"))
+        ImageDraw.Draw(frame).text((0, 0), f"Time: {now:%H:%M:%S}", fill="white")
+        return frame
+
+    scheduler = TickScheduler(DirtyRegionRenderer(device))
+    scheduler.run(render_frame)  # Until Ctrl+C
+"""
+
+import collections
+import math
+import time
+from datetime import datetime
+from PIL import Image, ImageDraw
+
+
+class TickScheduler:
+    def __init__(self, screen, period=1.0, clock=None, sleep=None, history=3600):
+        self.screen = screen
+        self.period = period  # Seconds between ticks; ticks fall on multiples of it
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.lateness = collections.deque(maxlen=history)  # Seconds between each tick and its frame being sent
+        self.ticks = 0
+        self.missed = 0
+
+    def run(self, render, ticks=None):
+        # Show render(now) at every tick, `ticks` times or until interrupted
+        tick = self._next_tick(self.clock())
+        # The current period at once, rather than a blank display until the first tick
+        self.screen.send(self.screen.prepare(render(datetime.fromtimestamp(tick - self.period))))
+        shown = 0
+        while ticks is None or shown < ticks:
+            prepared = self.screen.prepare(render(datetime.fromtimestamp(tick)))
+            wait = tick - self.clock()
+            if wait > 0:
+                self.sleep(wait)
+            self.screen.send(prepared)
+            self.lateness.append(self.clock() - tick)
+            self.ticks += 1
+            shown += 1
+
+            now = self.clock()
+            following = tick + self.period
+            if following <= now:  # Too late for the next tick already: go on with the one after now
+                tick = self._next_tick(now)
+                self.missed += round((tick - following) / self.period)
+            else:
+                tick = following
+
+    def stats(self):
+        lateness = self.lateness or [0.0]
+        return {
+            "ticks": self.ticks,
+            "missed": self.missed,
+            "mean_late_ms": sum(lateness) / len(lateness) * 1000,
+            "max_late_ms": max(lateness) * 1000,
+        }
+
+    def _next_tick(self, now):
+        return (math.floor(now / self.period) + 1) * self.period
+
+
+class CachedLayer:
+    def __init__(self, device):
+        self.mode = device.mode
+        self.size = device.size
+        self.key = None
+        self.image = None
+        self.renders = 0
+
+    def get(self, key, draw):
+        # A copy of the layer, drawn again with draw(ImageDraw) only if `key` changed
+        if self.image is None or key != self.key:
+            self.image = Image.new(self.mode, self.size)
+            draw(ImageDraw.Draw(self.image))
+            self.key = key
+            self.renders += 1
+        return self.image.copy()
@@ -0,0 +1,135 @@
+"""
+OLED Transport Module
+
+How the bytes get from the Raspberry Pi to the SSD1306: the bus (SPI or I2C), its clock and the largest single
+transfer. The scripts used luma's `spi()` defaults (8 MHz, 4096-byte transfers) with no way to change them, and
+nothing told how long a frame spends on the wire. This module opens the serial interface with the chosen settings and
+models the wire time of every transfer, so the frame budget can be worked out before writing an animation.
+
+Features:
+- `Transport("spi", speed=8_000_000, transfer_size=4096)` or `Transport("i2c", speed=400_000, address=0x3C)`;
+  `open()` returns luma's serial interface with these settings. luma only accepts the SPI speeds in `SPI_SPEEDS`
+  (and the Raspberry Pi rounds them down to its clock divider). The I2C clock is set by the kernel
+  (`dtparam=i2c_arm_baudrate=400000` in /boot/config.txt), so `speed` only feeds the model there.
+- `transfer_time(size)`, `command_time(size)` and `data_time(size)` model how long the bus is busy: SPI sends 8 clocks
+  per byte, data in chunks of `transfer_size`; I2C sends 9 clocks per byte (with the acknowledge bit) plus the address
+  and control bytes, data in chunks of 4096 bytes. Every transfer also pays `overhead` seconds for the system call
+  and the D/C pin (an estimate for a Raspberry Pi; measure your own and pass it in).
+- `transport_from_env(bus)` reads the settings from `OLED_SPI_SPEED`, `OLED_SPI_TRANSFER_SIZE`, `OLED_I2C_PORT` and
+  `OLED_I2C_ADDRESS`; `oled_device.py` uses it.
+- `SimulatedBus(transport)` is a capture of the interface (`oled_capture.py`) that takes as long as the real bus to
+  return from each transfer, and adds up the wire time it modelled.
+
+Dependencies:
+- luma.core
+- oled_capture.py (in this folder)
+
+Usage:
+    device = ssd1306(Transport("spi", speed=16_000_000).open())
+
+    bus = SimulatedBus(Transport("i2c", speed=400_000))
+    device = ssd1306(bus)
+"""
+
+import os
+from time import perf_counter, sleep  # Bound now: benchmarks replace time.sleep() with their clock
+from luma.core.interface.serial import i2c, spi
+from oled_capture import CaptureSerial
+
+SPI_SPEEDS = [int(mhz * 1_000_000) for mhz in [0.5, 1, 2, 4, 8, 16, 20, 24, 28, 32, 36, 40, 44, 48, 50, 52]]
+SPI_SPEED = 8_000_000  # luma's default
+TRANSFER_SIZE = 4096  # luma's default, the spidev buffer size
+I2C_SPEED = 400_000  # Fast mode, the most the SSD1306 datasheet specifies
+I2C_BLOCK = 4096  # luma sends I2C data in blocks of this size
+I2C_ADDRESS = 0x3C
+TRANSFER_OVERHEAD = 30e-6  # Seconds per transfer for the system call and the D/C pin (estimated)
+
+
+class Transport:
+    def __init__(self, bus="spi", speed=None, transfer_size=TRANSFER_SIZE, port=None, address=I2C_ADDRESS,
+                 overhead=TRANSFER_OVERHEAD):
+        if bus == "spi":
+            speed = speed or SPI_SPEED
+            if speed not in SPI_SPEEDS:
+                raise ValueError(f"SPI speed {speed} Hz is not one of luma's: {', '.join(map(str, SPI_SPEEDS))}")
+            port = 0 if port is None else port
+        elif bus == "i2c":
+            speed = speed or I2C_SPEED
+            transfer_size = I2C_BLOCK
+            port = 1 if port is None else port
+        else:
+            raise ValueError(f"Unknown OLED bus {bus!r}, expected spi or i2c")
+        if transfer_size < 1:
+            raise ValueError(f"Transfer size must be at least 1 byte, not {transfer_size}")
+        self.bus = bus
+        self.speed = speed  # Bus clock in Hz
+        self.transfer_size = transfer_size  # Most bytes in one transfer
+        self.port = port
+        self.address = address  # I2C only
+        self.overhead = overhead
+
+    def __str__(self):
+        speed = f"{self.speed / 1e6:g} MHz" if self.speed >= 1_000_000 else f"{self.speed / 1e3:g} kHz"
+        if self.bus == "spi":
+            return f"SPI {speed}, {self.transfer_size} B"
+        return f"I2C {speed}"
+
+    def open(self):
+        # luma's serial interface with these settings (DC on GPIO 24 and RST on GPIO 25 for SPI)
+        if self.bus == "spi":
+            return spi(device=0, port=self.port, gpio_DC=24, gpio_RST=25, bus_speed_hz=self.speed,
+                       transfer_size=self.transfer_size)
+        return i2c(port=self.port, address=self.address)
+
+    def transfer_time(self, size):
+        # Seconds one transfer of `size` bytes keeps the bus busy
+        if self.bus == "spi":
+            return self.overhead + size * 8 / self.speed
+        # Start, address and control byte, the data, stop; every byte is acknowledged
+        return self.overhead + ((2 + size) * 9 + 2) / self.speed
+
+    def command_time(self, size):
+        return self.transfer_time(size)
+
+    def data_time(self, size):
+        # Data longer than a transfer is sent in chunks, like luma does
+        chunks, rest = divmod(size, self.transfer_size)
+        return chunks * self.transfer_time(self.transfer_size) + (self.transfer_time(rest) if rest else 0.0)
+
+    def frame_time(self, width=128, height=64):
+        # Seconds a full frame takes: the column and page window, then the display RAM
+        return self.command_time(6) + self.data_time(width * height // 8)
+
+
+def transport_from_env(bus):
+    # The transport for `bus` with the settings from the environment
+    if bus == "spi":
+        return Transport("spi", speed=int(os.environ.get("OLED_SPI_SPEED", SPI_SPEED)),
+                         transfer_size=int(os.environ.get("OLED_SPI_TRANSFER_SIZE", TRANSFER_SIZE)))
+    return Transport("i2c", port=int(os.environ.get("OLED_I2C_PORT", 1)),
+                     address=int(os.environ.get("OLED_I2C_ADDRESS", hex(I2C_ADDRESS)), 0))
+
+
+class SimulatedBus(CaptureSerial):
+    # A capture that returns from each transfer only after the transport would have finished it
+    def __init__(self, transport, width=128, height=64):
+        super().__init__(width, height, model=False)
+        self.transport = transport
+        self.wire_time = 0.0  # Seconds modelled on the wire, in total
+
+    def command(self, *cmd):
+        super().command(*cmd)
+        self._wait(self.transport.command_time(len(cmd)))
+
+    def data(self, data):
+        super().data(data)
+        self._wait(self.transport.data_time(len(data)))
+
+    def _wait(self, seconds):
+        # Sleep most of the time, then spin for the rest: time.sleep() alone overshoots short waits
+        self.wire_time += seconds
+        end = perf_counter() + seconds
+        if seconds > 0.002:
+            sleep(seconds - 0.001)
+        while perf_counter() < end:
+            pass
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules live next to the numbered scripts, one folder up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
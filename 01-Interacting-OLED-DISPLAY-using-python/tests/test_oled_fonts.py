@@ -0,0 +1,29 @@
+"""
+Cache keys of oled_fonts.py.
+"""
+
+import os
+import shutil
+import pytest
+from PIL import ImageFont
+from oled_fonts import cache_path
+
+
+def installed_font(name="DejaVuSans.ttf", size=14):
+    try:
+        return ImageFont.truetype(name, size).path
+    except OSError:
+        pytest.skip(f"{name} is not installed")
+
+
+def test_font_name_uses_the_file_it_resolves_to():
+    assert cache_path("DejaVuSans.ttf", 14) == cache_path(installed_font(), 14)
+
+
+def test_replaced_font_gets_a_new_cache_file(tmp_path):
+    font = tmp_path / "Test.ttf"
+    shutil.copy(installed_font(), font)
+    os.utime(font, ns=(1, 1))
+    before = cache_path(str(font), 14)
+    os.utime(font, ns=(2, 2))  # Same name and size, new file
+    assert cache_path(str(font), 14) != before
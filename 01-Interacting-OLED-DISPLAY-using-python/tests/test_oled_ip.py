@@ -0,0 +1,58 @@
+"""
+Netlink watching of oled_ip.py, with a socket pair standing in for the netlink socket.
+"""
+
+import errno
+import socket
+import time
+import oled_ip
+from oled_ip import IPAddressProvider
+
+
+class FlakyWatcher:
+    # One end of a socket pair; recv() fails with ENOBUFS once, like a netlink socket after a burst of changes
+    def __init__(self, sock):
+        self.sock = sock
+        self.failed = False
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def recv(self, size):
+        if not self.failed:
+            self.failed = True
+            self.sock.recv(size)  # The pending message is lost, as with a real overflow
+            raise OSError(errno.ENOBUFS, "No buffer space available")
+        return self.sock.recv(size)
+
+    def close(self):
+        self.sock.close()
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_recv_error_keeps_the_watcher_running(monkeypatch):
+    addresses = iter(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+    monkeypatch.setattr(oled_ip, "lookup_address", lambda fallback: next(addresses))
+    watcher_end, kernel_end = socket.socketpair()
+    watcher_end.setblocking(False)
+    watcher = FlakyWatcher(watcher_end)
+    provider = IPAddressProvider(poll_interval=0.05)
+    monkeypatch.setattr(provider, "_open_netlink", lambda: watcher)
+
+    provider.start()
+    try:
+        assert provider.address == "10.0.0.1"
+        kernel_end.send(b"change")  # recv() fails: looked up anyway
+        assert wait_for(lambda: provider.address == "10.0.0.2")
+        kernel_end.send(b"change")  # The thread is still watching
+        assert wait_for(lambda: provider.address == "10.0.0.3")
+        assert watcher.failed and provider._thread.is_alive()
+    finally:
+        provider.stop()
+        kernel_end.close()
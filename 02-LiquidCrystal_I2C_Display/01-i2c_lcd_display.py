@@ -6,7 +6,7 @@ This program controls a 16x2 LCD display connected via I2C to a Raspberry Pi. It
 Steps:
 1. Initializes the I2C connection to the LCD using the specified I2C address and bus.
 2. Defines constants for LCD commands, line addresses, and timing.
-3. Provides functions to:
+3. Uses the `HD44780` driver from `lcd_driver.py`, which provides methods to:
    - Initialize the LCD (`lcd_init`).
    - Send data or commands to the LCD (`lcd_byte`).
    - Toggle the enable pin for communication (`lcd_toggle_enable`).
@@ -14,9 +14,16 @@ Steps:
 4. In the main loop, displays two sets of messages on the LCD, alternating every 3 seconds.
 5. Clears the LCD display when the program is interrupted or exits.
 
+Transport:
+- `TRANSPORT = "byte"` sends every PCF8574 state with its own `write_byte()` call (~100 transactions per line).
+- `TRANSPORT = "block"` builds the whole line in one buffer and sends it with `write_i2c_block_data()` (3 transactions per line).
+- `TRANSPORT = "rdwr"` sends the whole line as a single `i2c_rdwr` message (needs `smbus2`).
+- Run `08-i2c_lcd_transport_benchmark.py` to compare them without hardware.
+
 Dependencies:
 - smbus (for I2C communication)
 - time (for delays)
+- lcd_driver.py (in this folder)
 
 Hardware Requirements:
 - 16x2 LCD display with I2C interface.
@@ -32,88 +39,31 @@ Usage:
 
 import smbus
 import time
+from lcd_driver import HD44780, LCD_CMD, LCD_LINE_1, LCD_LINE_2
 
 # Define I2C address and bus
 I2C_ADDR = 0x3F  # Replace with your I2C address
 I2C_BUS = 1
-
-# LCD constants
-LCD_WIDTH = 16  # Characters per line
-LCD_CHR = 1  # Mode - Sending data
-LCD_CMD = 0  # Mode - Sending command
-
-LCD_LINE_1 = 0x80  # LCD RAM address for the 1st line
-LCD_LINE_2 = 0xC0  # LCD RAM address for the 2nd line
-
-LCD_BACKLIGHT = 0x08  # On
-# LCD_BACKLIGHT = 0x00  # Off
-
-ENABLE = 0b00000100  # Enable bit
-
-# Timing constants
-E_PULSE = 0.0005
-E_DELAY = 0.0005
+TRANSPORT = "block"  # "byte" (original, one write per state), "block" or "rdwr"
 
 # Open I2C interface
 bus = smbus.SMBus(I2C_BUS)
-
-def lcd_init():
-    # Initialise display
-    lcd_byte(0x33, LCD_CMD)  # 110011 Initialise
-    lcd_byte(0x32, LCD_CMD)  # 110010 Initialise
-    lcd_byte(0x06, LCD_CMD)  # 000110 Cursor move direction
-    lcd_byte(0x0C, LCD_CMD)  # 001100 Display On,Cursor Off, Blink Off
-    lcd_byte(0x28, LCD_CMD)  # 101000 Data length, number of lines, font size
-    lcd_byte(0x01, LCD_CMD)  # 000001 Clear display
-    time.sleep(E_DELAY)
-
-def lcd_byte(bits, mode):
-    # Send byte to data pins
-    # bits = the data
-    # mode = 1 for data, 0 for command
-
-    bits_high = mode | (bits & 0xF0) | LCD_BACKLIGHT
-    bits_low = mode | ((bits << 4) & 0xF0) | LCD_BACKLIGHT
-
-    # High bits
-    bus.write_byte(I2C_ADDR, bits_high)
-    lcd_toggle_enable(bits_high)
-
-    # Low bits
-    bus.write_byte(I2C_ADDR, bits_low)
-    lcd_toggle_enable(bits_low)
-
-def lcd_toggle_enable(bits):
-    # Toggle enable
-    time.sleep(E_DELAY)
-    bus.write_byte(I2C_ADDR, (bits | ENABLE))
-    time.sleep(E_PULSE)
-    bus.write_byte(I2C_ADDR, (bits & ~ENABLE))
-    time.sleep(E_DELAY)
-
-def lcd_string(message, line):
-    # Send string to display
-    message = message.ljust(LCD_WIDTH, " ")
-
-    lcd_byte(line, LCD_CMD)
-
-    for i in range(LCD_WIDTH):
-        lcd_byte(ord(message[i]), LCD_CHR)
+lcd = HD44780(bus, address=I2C_ADDR, transport=TRANSPORT)
 
 def main():
     # Main program block
-    lcd_init()
+    lcd.lcd_init()
 
     while True:
         # Send some test
-        lcd_string("Araham Aeddin!", LCD_LINE_1)
-        lcd_string("Raspberry Pi", LCD_LINE_2)
+        lcd.lcd_string("Araham Aeddin!", LCD_LINE_1)
+        lcd.lcd_string("Raspberry Pi", LCD_LINE_2)
 
         time.sleep(3)  # 3 second delay
 
         # Send some more text
-        lcd_string("I2C LCD Tutorial", LCD_LINE_1)
-        lcd_string("Araham Aeddin", LCD_LINE_2)
+        lcd.lcd_string("I2C LCD Tutorial", LCD_LINE_1)
+        lcd.lcd_string("Araham Aeddin", LCD_LINE_2)
 
         time.sleep(3)
 
@@ -123,4 +73,4 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         pass
     finally:
-        lcd_byte(0x01, LCD_CMD)
+        lcd.lcd_byte(0x01, LCD_CMD)
@@ -4,18 +4,19 @@ I2C LCD with Backlight Control Script
 This program controls a 16x2 LCD display connected via I2C to a Raspberry Pi. It demonstrates how to:
 1. Initialize the LCD using the `RPLCD` library.
 2. Display alternating messages on the LCD.
-3. Manually control the LCD backlight using the `smbus` library.
+3. Control the LCD backlight through the same driver, and turn it off when the display is idle.
 
 Steps:
 1. Initializes the LCD with the I2C address `0x3F` and sets it up for 16 columns and 2 rows.
-2. Uses the `smbus` library to manually control the backlight by sending commands to the I2C address.
+2. Controls the backlight through the driver's own expander state (`lcd_backlight.py`), so the backlight bit stays
+   the same in every byte sent to the I2C backpack.
 3. Displays two sets of messages on the LCD, alternating every 3 seconds.
-4. Turns off the backlight after displaying each set of messages (optional).
+4. Turns off the backlight after each set of messages has been shown for `IDLE_TIMEOUT` seconds (optional).
 5. Handles a KeyboardInterrupt (Ctrl+C) to gracefully clear the LCD and turn off the backlight before exiting.
 
 Dependencies:
 - RPLCD (for LCD control)
-- smbus (for I2C communication)
+- lcd_backlight.py (in this folder, for backlight control)
 - time (for delays)
 
 Hardware Requirements:
@@ -32,25 +33,25 @@ Usage:
 
 
 from RPLCD.i2c import CharLCD  # Import the CharLCD class from the RPLCD library
-import smbus  # Import the smbus library for I2C communication
-import time  # Import the time library for delays
+from lcd_backlight import Backlight  # Import the backlight controller (lcd_backlight.py)
 
 # Initialize the LCD
 lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)  # Set up the LCD with I2C address 0x3F
 
-# Initialize I2C bus for manual backlight control
-bus = smbus.SMBus(1)  # Use I2C bus 1 (for newer Raspberry Pi models)
+# Control the backlight through the LCD driver (no second I2C bus object writing to the backpack)
+IDLE_TIMEOUT = 2  # Seconds a set of messages is shown before the backlight turns off (None = keep it on)
+backlight = Backlight(lcd, idle_timeout=IDLE_TIMEOUT)
 
 def turn_off_backlight():
-    bus.write_byte(0x3F, 0x00)  # Send command to turn off the backlight (I2C address 0x3F)
+    backlight.turn_off()  # One write to the backpack; the driver keeps the backlight bit off in later writes
 
 def turn_on_backlight():
-    bus.write_byte(0x3F, 0x08)  # Send command to turn on the backlight (I2C address 0x3F)
+    backlight.turn_on()  # One write to the backpack; the driver keeps the backlight bit on in later writes
 
 try:  # Start a try block to handle exceptions
     while True:  # Run an infinite loop
         lcd.clear()  # Clear the LCD screen to remove any previous content
-        turn_off_backlight()  # Turn off the backlight after writing the text (optional)
+        backlight.touch()  # New messages: turn the backlight on and restart the idle timer
 
         message1 = "Hello, World!"  # Define the first message to display on the LCD
         message2 = "Raspberry Pi"  # Define the second message to display on the LCD (next line)
@@ -61,10 +62,10 @@ try:  # Start a try block to handle exceptions
         print(f"Sending message: {message2}")  # Print the second message to the console for debugging
         lcd.write_string(message2)  # Write the second message to the LCD screen
 
-        time.sleep(3)  # Wait for 3 seconds before proceeding to the next step
+        backlight.wait(3)  # Wait for 3 seconds; the backlight turns off after IDLE_TIMEOUT (optional)
 
         lcd.clear()  # Clear the LCD screen again to prepare for the next set of messages
-        turn_off_backlight()  # Turn off the backlight after writing the text (optional)
+        backlight.touch()  # New messages: turn the backlight on and restart the idle timer
 
         message3 = "I2C LCD Demo"  # Define the third message to display on the LCD
         message4 = "By Araham!"  # Define the fourth message to display on the LCD (next line)
@@ -75,9 +76,9 @@ try:  # Start a try block to handle exceptions
         print(f"Sending message: {message4}")  # Print the fourth message to the console for debugging
         lcd.write_string(message4)  # Write the fourth message to the LCD screen
 
-        time.sleep(3)  # Wait for 3 seconds before repeating the loop
+        backlight.wait(3)  # Wait for 3 seconds before repeating the loop; the backlight turns off after IDLE_TIMEOUT
 
 except KeyboardInterrupt:  # Handle a KeyboardInterrupt (Ctrl+C) to gracefully exit the program
     lcd.clear()  # Clear the LCD screen before exiting
     turn_off_backlight()  # Turn off the backlight before exiting (optional)
-    print("Program stopped. LCD cleared and backlight turned on.")  # Print a message to the console
+    print("Program stopped. LCD cleared and backlight turned off.")  # Print a message to the console
@@ -4,18 +4,19 @@ I2C LCD with Backlight Control Script
 This program controls a 16x2 LCD display connected via I2C to a Raspberry Pi. It demonstrates how to:
 1. Initialize the LCD using the `RPLCD` library.
 2. Display alternating messages on the LCD.
-3. Manually control the LCD backlight using the `smbus` library.
+3. Control the LCD backlight through the same driver, and turn it off when the display is idle.
 
 Steps:
 1. Initializes the LCD with the I2C address `0x3F` and sets it up for 16 columns and 2 rows.
-2. Uses the `smbus` library to manually control the backlight by sending commands to the I2C address.
+2. Controls the backlight through the driver's own expander state (`lcd_backlight.py`), so the backlight bit stays
+   the same in every byte sent to the I2C backpack.
 3. Displays two sets of messages on the LCD, alternating every 3 seconds.
-4. Turns off the backlight after displaying each set of messages (optional).
+4. Turns off the backlight after each set of messages has been shown for `IDLE_TIMEOUT` seconds (optional).
 5. Handles a KeyboardInterrupt (Ctrl+C) to gracefully clear the LCD and turn on the backlight before exiting.
 
 Dependencies:
 - RPLCD (for LCD control)
-- smbus (for I2C communication)
+- lcd_backlight.py (in this folder, for backlight control)
 - time (for delays)
 
 Hardware Requirements:
@@ -31,24 +32,25 @@ Usage:
 """
 
 from RPLCD.i2c import CharLCD
-import smbus
-import time
+from lcd_backlight import Backlight
 
 # Initialize the LCD
 # Replace `0x3F` with your I2C address if it's different
 # Replace `i2c_expander='PCF8574'` if your I2C expander is different (e.g., 'PCF8574A')
 lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)
 
-# Initialize I2C bus for manual backlight control
-bus = smbus.SMBus(1)  # Use 1 for newer Raspberry Pi models, 0 for older ones
+# Control the backlight through the LCD driver, so no second I2C bus object overwrites its pins
+# Set IDLE_TIMEOUT to None to keep the backlight on
+IDLE_TIMEOUT = 2  # Seconds before the backlight turns off
+backlight = Backlight(lcd, idle_timeout=IDLE_TIMEOUT)
 
 def turn_off_backlight():
-    # Send command to turn off the backlight
-    bus.write_byte(0x3F, 0x00)  # Replace 0x3F with your I2C address
+    # One write; the driver keeps the backlight bit off in everything it sends afterwards
+    backlight.turn_off()
 
 def turn_on_backlight():
-    # Send command to turn on the backlight
-    bus.write_byte(0x3F, 0x08)  # Replace 0x3F with your I2C address
+    # One write; the driver keeps the backlight bit on in everything it sends afterwards
+    backlight.turn_on()
 
 try:
     # Keep the program running until manually stopped
@@ -57,33 +59,30 @@ try:
         # Clear the LCD screen
         lcd.clear()
 
-        # Turn off the backlight after writing the text
-        turn_off_backlight()
+        # New text: turn the backlight on and restart the idle timer
+        backlight.touch()
 
         # Write a message to the LCD
         lcd.write_string("Hello, World!")
         lcd.crlf()  # Move to the next line
         lcd.write_string("Raspberry Pi")
 
-        # Wait for 3 seconds
-        time.sleep(3)
+        # Wait for 3 seconds; the backlight turns off after IDLE_TIMEOUT
+        backlight.wait(3)
 
         # Clear the screen again
         lcd.clear()
 
-        # Turn off the backlight after writing the text
-        turn_off_backlight()
+        # New text: turn the backlight on and restart the idle timer
+        backlight.touch()
 
         # Write another message
         lcd.write_string("I2C LCD Demo")
         lcd.crlf()
         lcd.write_string("By Your Name")
 
-        # Turn off the backlight after writing the text
-        # turn_off_backlight()
-
-        # Wait for 3 seconds
-        time.sleep(3)
+        # Wait for 3 seconds; the backlight turns off after IDLE_TIMEOUT
+        backlight.wait(3)
 
 except KeyboardInterrupt:
     # When you press Ctrl+C, clear the screen and turn on the backlight
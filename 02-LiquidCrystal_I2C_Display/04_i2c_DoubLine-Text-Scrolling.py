@@ -9,7 +9,10 @@ This program controls a 16x2 LCD display connected via I2C to a Raspberry Pi. It
 Key Features:
 - The text on the first line (line 0) scrolls completely before the text on the second line (line 1) starts scrolling.
 - The scrolling effect is achieved by adding padding (spaces) to the text and displaying a 16-character substring at a time.
+- The padded frames of each message are built once and cached (`lcd_frames.py`), so repeating a message builds no new strings.
 - The scrolling speed can be adjusted using the `delay` parameter in the `scroll_text` function.
+- With `HARDWARE_SCROLL = True`, the message is loaded into the LCD's memory once and scrolled with the display-shift
+  command (`lcd_scroll.py`): one command per frame instead of rewriting 16 characters.
 
 Steps:
 1. Initializes the LCD with the I2C address `0x3F` and sets it up for 16 columns and 2 rows.
@@ -20,6 +23,7 @@ Steps:
 Dependencies:
 - RPLCD (for LCD control)
 - time (for delays)
+- lcd_scroll.py and lcd_frames.py (in this folder)
 
 Hardware Requirements:
 - 16x2 LCD display with I2C interface.
@@ -40,16 +44,24 @@ Usage:
 
 from RPLCD.i2c import CharLCD  # Import the CharLCD class from the RPLCD library
 import time  # Import the time library for delays
+from lcd_scroll import ShiftScroller  # Scrolling with the LCD's display-shift command
+from lcd_frames import frame_table  # Cached scroll frames
 
 # Initialize the LCD
 lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)  # Set up the LCD with I2C address 0x3F
+HARDWARE_SCROLL = True  # Scroll with display-shift commands; False rewrites 16 characters per frame
 
 def scroll_text(text, line=0, delay=0.3):  # Function to scroll text on a specific line
-    padding = " " * 16  # Add 16 spaces to the text to create a scrolling effect
-    text_with_padding = padding + text + padding  # Combine the text with padding
-    for i in range(len(text_with_padding) - 15):  # Loop through the text
+    if HARDWARE_SCROLL:
+        texts = ["", ""]
+        texts[line] = text  # The shift moves both lines, the other line stays blank
+        for _ in ShiftScroller(lcd, texts).frames():  # One display-shift command per frame
+            time.sleep(delay)  # Add a delay to control the scrolling speed
+        return
+
+    for frame in frame_table(text, 16):  # Padded 16-character frames, built once per message
         lcd.cursor_pos = (line, 0)  # Move cursor to the specified line
-        lcd.write_string(text_with_padding[i:i+16])  # Display a 16-character substring
+        lcd.write_string(frame)  # Display a 16-character substring
         time.sleep(delay)  # Add a delay to control the scrolling speed
 
 try:  # Start a try block to handle exceptions
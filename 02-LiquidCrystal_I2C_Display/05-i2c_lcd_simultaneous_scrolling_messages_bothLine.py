@@ -9,19 +9,26 @@ This program controls a 16x2 LCD display connected via I2C to a Raspberry Pi. It
 Key Features:
 - The text on both lines scrolls simultaneously, creating a dynamic display effect.
 - The scrolling effect is achieved by adding padding (spaces) to the text and displaying a 16-character substring at a time.
-- The scrolling speed can be adjusted using the `delay` parameter in the `scroll_text` function.
+- The padded frames of each message are built once and cached (`lcd_frames.py`), so repeating a message builds no new strings.
+- The scrolling speed can be adjusted using the `delay` parameter (and `delay2` for the second line) of `scroll_both_lines`.
+- When stopped, the program prints the frames, missed frame deadlines and achieved frames per second of each line.
+- With `HARDWARE_SCROLL = True`, the messages are loaded into the LCD's memory once and scrolled with the display-shift
+  command (`lcd_scroll.py`): one command per frame instead of rewriting both lines. Both lines then run until the
+  longer message has scrolled through.
 - The program repeats the scrolling effect continuously until interrupted.
 
 Steps:
 1. Initializes the LCD with the I2C address `0x3F` and sets it up for 16 columns and 2 rows.
 2. Defines a `scroll_text` function to scroll text on a specific line of the LCD using a generator.
-3. Defines a `scroll_both_lines` function to scroll two lines simultaneously using generators.
+3. Defines a `scroll_both_lines` function that runs both generators on fixed frame deadlines (`lcd_scheduler.py`),
+   so the write time does not slow the scrolling down, and the longer message is not cut off.
 4. Uses an infinite loop to continuously scroll two messages on the LCD.
 5. Handles a KeyboardInterrupt (Ctrl+C) to gracefully clear the LCD and exit the program.
 
 Dependencies:
 - RPLCD (for LCD control)
 - time (for delays)
+- lcd_scroll.py, lcd_frames.py and lcd_scheduler.py (in this folder)
 
 Hardware Requirements:
 - 16x2 LCD display with I2C interface.
@@ -42,31 +49,30 @@ Usage:
 
 from RPLCD.i2c import CharLCD  # Import the CharLCD class from the RPLCD library
 import time  # Import the time library for delays
+from lcd_scroll import ShiftScroller  # Scrolling with the LCD's display-shift command
+from lcd_frames import frame_table  # Cached scroll frames
+from lcd_scheduler import FrameScheduler  # Drift-free frame timing
 
 # Initialize the LCD
 lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)  # Set up the LCD with I2C address 0x3F
+HARDWARE_SCROLL = True  # Scroll with display-shift commands; False rewrites 16 characters per line per frame
+scheduler = FrameScheduler()  # Shows frames on fixed deadlines and counts missed ones
 
 def scroll_text(text, line, delay=0.3):  # Function to scroll text on a specific line
-    padding = " " * 16  # Add 16 spaces to the text to create a scrolling effect
-    text_with_padding = padding + text + padding  # Combine the text with padding
-    for i in range(len(text_with_padding) - 15):  # Loop through the text
+    for frame in frame_table(text, 16):  # Padded 16-character frames, built once per message
         lcd.cursor_pos = (line, 0)  # Move cursor to the specified line
-        lcd.write_string(text_with_padding[i:i+16])  # Display a 16-character substring
-        yield  # Pause execution and return control to the caller
+        lcd.write_string(frame)  # Display a 16-character substring
+        yield frame  # Pause execution and return control to the caller
 
-def scroll_both_lines(text1, text2, delay=0.3):  # Function to scroll two lines simultaneously
-    # Create generators for scrolling each line
-    scroll_line1 = scroll_text(text1, line=0, delay=delay)
-    scroll_line2 = scroll_text(text2, line=1, delay=delay)
-
-    # Loop until both lines finish scrolling
-    while True:
-        try:
-            next(scroll_line1)  # Scroll the first line
-            next(scroll_line2)  # Scroll the second line
-            time.sleep(delay)  # Add a delay to control the scrolling speed
-        except StopIteration:  # Exit when both lines finish scrolling
-            break
+def scroll_both_lines(text1, text2, delay=0.3, delay2=None):  # Function to scroll two lines simultaneously
+    # Each line gets its own frame deadlines; the second line can scroll at its own speed (delay2)
+    if HARDWARE_SCROLL:
+        # One display-shift command per frame; the shift moves both lines, so both use `delay`
+        scheduler.add_line(0, ShiftScroller(lcd, [text1, text2]).frames(), delay)
+    else:
+        scheduler.add_line(0, scroll_text(text1, line=0), delay)
+        scheduler.add_line(1, scroll_text(text2, line=1), delay2 or delay)
+    scheduler.run()  # Runs until both lines have finished scrolling
 
 try:  # Start a try block to handle exceptions
     while True:  # Run an infinite loop
@@ -76,3 +82,5 @@ try:  # Start a try block to handle exceptions
 except KeyboardInterrupt:  # Handle a KeyboardInterrupt (Ctrl+C) to gracefully exit the program
     lcd.clear()  # Clear the LCD screen before exiting
     print("Program stopped. LCD cleared.")  # Print a message to the console
+    for row, stats in scheduler.report().items():  # Achieved scrolling speed per line
+        print(f"Line {row + 1}: {stats['frames']} frames, {stats['missed']} missed deadlines, {stats['fps']:.2f} fps")
@@ -11,18 +11,29 @@ Key Features:
 - Different messages are displayed on the first and second lines of the LCD.
 - Each message scrolls simultaneously on its respective line.
 - The program cycles through a predefined list of messages, creating a dynamic and engaging display.
-- The scrolling speed can be adjusted using the `delay` parameter in the `scroll_text` function.
+- The messages are read from `playlist.txt` (`PLAYLIST_PATH`) if it exists. Changes to the file are picked up while the
+  program runs and take effect at the next message, without restarting or re-initialising the display
+  (`lcd_playlist.py`).
+- Each message is translated to the LCD's character ROM once (`lcd_charmap.py`, accents and symbols get fallbacks),
+  and the scroll loop only writes the encoded bytes.
+- The scrolling speed can be adjusted using the `delay` parameter (and `delay2` for the second line) of `scroll_both_lines`.
+- When stopped, the program prints the frames, missed frame deadlines and achieved frames per second of each line.
+- With `HARDWARE_SCROLL = True`, the messages are loaded into the LCD's memory once and scrolled with the display-shift
+  command (`lcd_scroll.py`): one command per frame instead of rewriting both lines. Both lines then run until the
+  longer message has scrolled through.
 
 Steps:
 1. Initializes the LCD with the I2C address `0x3F` and sets it up for 16 columns and 2 rows.
 2. Defines a `scroll_text` function to scroll text on a specific line of the LCD using a generator.
-3. Defines a `scroll_both_lines` function to scroll two lines simultaneously using generators.
-4. Uses a predefined list of messages to display dynamic content on the LCD.
+3. Defines a `scroll_both_lines` function that runs both generators on fixed frame deadlines (`lcd_scheduler.py`),
+   so the write time does not slow the scrolling down, and the longer message is not cut off.
+4. Uses the playlist file (or the predefined list of messages) to display dynamic content on the LCD.
 5. Handles a KeyboardInterrupt (Ctrl+C) to gracefully clear the LCD and exit the program.
 
 Dependencies:
 - RPLCD (for LCD control)
 - time (for delays)
+- lcd_scroll.py, lcd_frames.py, lcd_scheduler.py, lcd_playlist.py and lcd_charmap.py (in this folder)
 
 Hardware Requirements:
 - 16x2 LCD display with I2C interface.
@@ -43,31 +54,38 @@ Usage:
 
 from RPLCD.i2c import CharLCD  # Import the CharLCD class from the RPLCD library
 import time  # Import the time library for delays
+import itertools  # For repeating the built-in messages
+import os  # For finding the playlist file
+from lcd_scroll import ShiftScroller  # Scrolling with the LCD's display-shift command
+from lcd_frames import frame_table  # Cached scroll frames
+from lcd_scheduler import FrameScheduler  # Drift-free frame timing
+from lcd_playlist import Playlist  # Messages from a file, reloaded when it changes
+from lcd_charmap import charmap, write_encoded  # Unicode to LCD character ROM
 
 # Initialize the LCD
 lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)  # Set up the LCD with I2C address 0x3F
+HARDWARE_SCROLL = True  # Scroll with display-shift commands; False rewrites 16 characters per line per frame
+scheduler = FrameScheduler()  # Shows frames on fixed deadlines and counts missed ones
+ROM = charmap("A02")  # Character ROM of the LCD, must match CharLCD's charmap (default "A02")
+# Playlist file ("line 1 | line 2" per line) or a directory of *.txt playlists; edit it while the script runs.
+# Without it, the `messages` list below is used.
+PLAYLIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "playlist.txt")
 
 def scroll_text(text, line, delay=0.3):  # Function to scroll text on a specific line
-    padding = " " * 16  # Add 16 spaces to the text to create a scrolling effect
-    text_with_padding = padding + text + padding  # Combine the text with padding
-    for i in range(len(text_with_padding) - 15):  # Loop through the text
+    for frame in frame_table(text, 16, ROM):  # Padded 16-character frames as ROM codes, built once per message
         lcd.cursor_pos = (line, 0)  # Move cursor to the specified line
-        lcd.write_string(text_with_padding[i:i+16])  # Display a 16-character substring
-        yield  # Pause execution and return control to the caller
-
-def scroll_both_lines(text1, text2, delay=0.3):  # Function to scroll two lines simultaneously
-    # Create generators for scrolling each line
-    scroll_line1 = scroll_text(text1, line=0, delay=delay)
-    scroll_line2 = scroll_text(text2, line=1, delay=delay)
-
-    # Loop until both lines finish scrolling
-    while True:
-        try:
-            next(scroll_line1)  # Scroll the first line
-            next(scroll_line2)  # Scroll the second line
-            time.sleep(delay)  # Add a delay to control the scrolling speed
-        except StopIteration:  # Exit when both lines finish scrolling
-            break
+        write_encoded(lcd, frame)  # Display a 16-character substring
+        yield frame  # Pause execution and return control to the caller
+
+def scroll_both_lines(text1, text2, delay=0.3, delay2=None):  # Function to scroll two lines simultaneously
+    # Each line gets its own frame deadlines; the second line can scroll at its own speed (delay2)
+    if HARDWARE_SCROLL:
+        # One display-shift command per frame; the shift moves both lines, so both use `delay`
+        scheduler.add_line(0, ShiftScroller(lcd, [text1, text2], charmap=ROM).frames(), delay)
+    else:
+        scheduler.add_line(0, scroll_text(text1, line=0), delay)
+        scheduler.add_line(1, scroll_text(text2, line=1), delay2 or delay)
+    scheduler.run()  # Runs until both lines have finished scrolling
 
 # Cool and inspiring messages
 messages = [
@@ -82,14 +100,20 @@ messages = [
 ]
 
 try:  # Start a try block to handle exceptions
-    while True:  # Run an infinite loop
-        for message1, message2 in messages:  # Loop through the messages
-            # Scroll two lines simultaneously
-            scroll_both_lines(message1, message2, delay=0.3)
-            time.sleep(1)  # Pause between messages
+    if os.path.exists(PLAYLIST_PATH):
+        playlist = Playlist(PLAYLIST_PATH, charmap=ROM)  # Re-read while running when the file changes
+        playlist.start()
+    else:
+        playlist = itertools.cycle(messages)  # Built-in messages, repeated forever
+    for message1, message2 in playlist:  # Loop through the messages
+        # Scroll two lines simultaneously
+        scroll_both_lines(message1, message2, delay=0.3)
+        time.sleep(1)  # Pause between messages
 
 except KeyboardInterrupt:  # Handle a KeyboardInterrupt (Ctrl+C) to gracefully exit the program
     lcd.clear()  # Clear the LCD screen before exiting
     print("Program stopped. LCD cleared.")  # Print a message to the console
+    for row, stats in scheduler.report().items():  # Achieved scrolling speed per line
+        print(f"Line {row + 1}: {stats['frames']} frames, {stats['missed']} missed deadlines, {stats['fps']:.2f} fps")
 
 
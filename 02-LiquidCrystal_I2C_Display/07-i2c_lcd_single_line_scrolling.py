@@ -8,8 +8,13 @@ This program controls a 16x2 LCD display connected via I2C to a Raspberry Pi. It
 
 Key Features:
 - The text scrolls horizontally on the first line of the LCD.
+- The line is overwritten in place every frame (`LineScroller` in `lcd_scroll.py`) instead of clearing the display, so
+  there is no flicker and the second line can show static text (`SECOND_LINE`).
 - The scrolling effect is achieved by adding padding (spaces) to the text and displaying a 16-character substring at a time.
-- The scrolling speed can be adjusted using the `delay` parameter in the `scroll_text` function.
+- The scrolling speed can be adjusted using the `delay` parameter in the `scroll_text` function. Frames are shown on
+  fixed deadlines (`lcd_scheduler.py`).
+- Symbols the LCD's character ROM doesn't have (like "😴") are drawn as custom characters by `GlyphCache`
+  (`lcd_glyphs.py`), which keeps them in the LCD's 8 CGRAM slots and only uploads a glyph when it is not loaded yet.
 
 Steps:
 1. Initializes the LCD with the I2C address `0x3F` and sets it up for 16 columns and 2 rows.
@@ -19,7 +24,7 @@ Steps:
 
 Dependencies:
 - RPLCD (for LCD control)
-- time (for delays)
+- lcd_glyphs.py, lcd_scroll.py, lcd_frames.py and lcd_scheduler.py (in this folder)
 
 Hardware Requirements:
 - 16x2 LCD display with I2C interface.
@@ -35,23 +40,29 @@ Usage:
 
 
 from RPLCD.i2c import CharLCD  # Import the CharLCD class from the RPLCD library
-import time  # Import the time library for delays
+from lcd_glyphs import GlyphCache  # Custom characters for symbols like 😴
+from lcd_scroll import LineScroller  # Scrolls one row without clearing the display
+from lcd_scheduler import FrameScheduler  # Drift-free frame timing
 
 # Initialize the LCD
 lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)  # Set up the LCD with I2C address 0x3F
+glyphs = GlyphCache.for_charlcd(lcd)  # Keeps special characters in the LCD's CGRAM slots
+scroller = LineScroller(lcd, row=0, glyphs=glyphs)  # Only ever writes the first row
+scheduler = FrameScheduler()  # Shows frames on fixed deadlines
+
+SECOND_LINE = ""  # Static text for the second row, e.g. "Pi: online"; the scroller never touches it
 
 # note :---
 # (1). set > ```delay=0.2``` for ``Faster scrolling``.
 # (2. set > ````delay=0.5``` for ``Slower scrolling``.
 def scroll_text(text, delay=0.2):  # Function to scroll text on the LCD
-    padding = " " * 16  # Add 16 spaces to the text to create a scrolling effect
-    text_with_padding = padding + text + padding  # Combine the text with padding
-    for i in range(len(text_with_padding) - 15):  # Loop through the text
-        lcd.clear()  # Clear the LCD screen
-        lcd.write_string(text_with_padding[i:i+16])  # Display a 16-character substring
-        time.sleep(delay)  # Add a delay to control the scrolling speed
+    scheduler.add_line(0, scroller.frames(text), delay)  # Overwrites the row in place, no lcd.clear()
+    scheduler.run()  # Shows one 16-character substring every `delay` seconds
 
 try:  # Start a try block to handle exceptions
+    if SECOND_LINE:
+        lcd.cursor_pos = (1, 0)
+        lcd.write_string(SECOND_LINE[:16])  # Written once
     while True:  # Run an infinite loop
         # Scroll a long message on the LCD
         scroll_text("Error 404: Sleep Not Found! 😴")  # Call the scroll_text function
@@ -0,0 +1,81 @@
+"""
+I2C LCD Transport Benchmark Script
+
+This program compares the transport modes of the raw HD44780 driver (`lcd_driver.py`) without any hardware.
+The driver is connected to a `FakeSMBus`, which records every I2C transaction instead of sending it.
+
+Steps:
+1. Creates one driver per transport mode ("byte", "block" and, if `smbus2` is installed, "rdwr").
+2. Initializes the LCD and discards the init traffic.
+3. Calls `lcd_string()` repeatedly and measures the wall time (including the driver's sleeps).
+4. Does the same for a whole-screen update (both lines inside one `batch()`).
+5. Updates a counter (1-3 changed cells per call) with the shadow DDRAM diff turned off and on.
+6. Prints I2C transactions, bytes, modeled wire time at 100 kHz and wall time per call.
+
+Dependencies:
+- time (for measuring)
+- lcd_driver.py and fake_smbus.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 08-i2c_lcd_transport_benchmark.py`
+"""
+
+import time
+from lcd_driver import HD44780, LCD_LINE_1, LCD_LINE_2, TRANSPORTS, TRANSPORT_RDWR
+from fake_smbus import FakeSMBus
+
+ROUNDS = 20  # Number of calls to average over
+
+def available_transports():
+    for transport in TRANSPORTS:
+        if transport == TRANSPORT_RDWR:
+            try:
+                import smbus2  # noqa: F401
+            except ImportError:
+                continue
+        yield transport
+
+def measure(transport, update):
+    bus = FakeSMBus()
+    lcd = HD44780(bus, address=0x3F, transport=transport)
+    lcd.lcd_init()
+    bus.reset()  # Only count the updates
+
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        update(lcd, i)
+    elapsed = time.perf_counter() - start
+
+    return (bus.transaction_count / ROUNDS, bus.byte_count / ROUNDS,
+            bus.wire_time / ROUNDS * 1000, elapsed / ROUNDS * 1000)
+
+def one_line(lcd, i):
+    lcd.lcd_string("I2C LCD Tutorial" if i % 2 else "Araham Aeddin!", LCD_LINE_1, diff=False)
+
+def whole_screen(lcd, i):
+    with lcd.batch():
+        lcd.lcd_string("I2C LCD Tutorial" if i % 2 else "Araham Aeddin!", LCD_LINE_1, diff=False)
+        lcd.lcd_string("Raspberry Pi", LCD_LINE_2, diff=False)
+
+def counter_full(lcd, i):
+    lcd.lcd_string(f"Count: {i + 98:04d}", LCD_LINE_1, diff=False)
+
+def counter_diff(lcd, i):
+    lcd.lcd_string(f"Count: {i + 98:04d}", LCD_LINE_1)
+
+WORKLOADS = (
+    ("lcd_string", one_line),
+    ("whole screen", whole_screen),
+    ("counter full", counter_full),
+    ("counter diff", counter_diff),
+)
+
+def main():
+    print(f"{'workload':<14}{'transport':<11}{'transactions':>13}{'bytes':>8}{'wire ms':>10}{'wall ms':>10}")
+    for name, update in WORKLOADS:
+        for transport in available_transports():
+            transactions, nbytes, wire_ms, wall_ms = measure(transport, update)
+            print(f"{name:<14}{transport:<11}{transactions:>13.0f}{nbytes:>8.0f}{wire_ms:>10.2f}{wall_ms:>10.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+I2C LCD Timing Benchmark and Calibration Script
+
+This program shows how much of a screen refresh is spent waiting, and finds the fastest timing a real LCD module
+tolerates. The waits of the raw driver (`lcd_driver.py`) come from a timing profile (`lcd_timing.py`).
+
+Modes:
+- Benchmark (default): Runs on any computer. Refreshes both lines of a fake LCD (`fake_smbus.py`) with the legacy
+  profile (fixed 0.5 ms sleeps), the datasheet profile and, if it exists, the calibrated profile file. Prints the
+  refresh time as host time (waits) plus the modeled I2C wire time at 100 kHz.
+- Calibration (`--calibrate`): Runs on the Raspberry Pi with the LCD connected. Writes random text with faster and
+  faster timing, reads it back from the LCD and saves the fastest setting that still works (plus a 25% margin) to
+  the profile file. Each check clears the display and reads it back first; the wait after clear and home stays at
+  the datasheet 1.52 ms in every profile.
+
+Dependencies:
+- smbus (only for `--calibrate`)
+- lcd_driver.py, lcd_timing.py and fake_smbus.py (in this folder)
+
+Hardware Requirements (calibration only):
+- 16x2 LCD display with a PCF8574 I2C backpack that has RW wired to P1 (most do).
+- Correct I2C address (default is 0x3F, but this may vary depending on the LCD module).
+
+Usage:
+    python3 09-i2c_lcd_timing.py                    # Benchmark the timing profiles
+    python3 09-i2c_lcd_timing.py --calibrate        # Calibrate the connected LCD
+    python3 09-i2c_lcd_timing.py --profile my.json  # Use another profile file
+"""
+
+import argparse
+import os
+import random
+import string
+import time
+from lcd_driver import HD44780, LCD_LINE_1, LCD_LINE_2, TRANSPORT_BYTE, TRANSPORT_BLOCK
+from lcd_timing import DATASHEET_TIMING, LEGACY_TIMING, TimingProfile, calibrate
+from fake_smbus import FakeSMBus
+
+I2C_ADDR = 0x3F  # Replace with your I2C address
+I2C_BUS = 1
+PROFILE_FILE = "lcd_timing.json"
+ROUNDS = 10
+
+def refresh(lcd, i):
+    # Rewrite the whole screen
+    with lcd.batch():
+        lcd.lcd_string(f"Refresh {i:8d}", LCD_LINE_1, diff=False)
+        lcd.lcd_string("Raspberry Pi", LCD_LINE_2, diff=False)
+
+def benchmark(profiles):
+    print(f"{'profile':<12}{'transport':<11}{'host ms':>10}{'wire ms':>10}{'refresh ms':>12}")
+    for transport in (TRANSPORT_BYTE, TRANSPORT_BLOCK):
+        for name, timing in profiles:
+            bus = FakeSMBus()
+            lcd = HD44780(bus, address=I2C_ADDR, transport=transport, timing=timing)
+            lcd.lcd_init()
+            bus.reset()
+
+            start = time.perf_counter()
+            for i in range(ROUNDS):
+                refresh(lcd, i)
+            host_ms = (time.perf_counter() - start) / ROUNDS * 1000
+            wire_ms = bus.wire_time / ROUNDS * 1000
+            print(f"{name:<12}{transport:<11}{host_ms:>10.2f}{wire_ms:>10.2f}{host_ms + wire_ms:>12.2f}")
+
+def check_pattern(lcd):
+    # Clear the display and check it is blank, then write random text to both lines and read it back
+    lcd.lcd_byte(0x01, 0)  # Clear display: fails if the wait after it is too short
+    blank = b" " * lcd.width
+    if lcd.read_ddram(LCD_LINE_1 & 0x7F, lcd.width) != blank or lcd.read_ddram(LCD_LINE_2 & 0x7F, lcd.width) != blank:
+        return False
+    lines = ["".join(random.choice(string.ascii_letters) for _ in range(lcd.width)) for _ in range(2)]
+    with lcd.batch():
+        lcd.lcd_string(lines[0], LCD_LINE_1, diff=False)
+        lcd.lcd_string(lines[1], LCD_LINE_2, diff=False)
+    return (lcd.read_ddram(LCD_LINE_1 & 0x7F, lcd.width) == lines[0].encode() and
+            lcd.read_ddram(LCD_LINE_2 & 0x7F, lcd.width) == lines[1].encode())
+
+def run_calibration(path):
+    import smbus
+
+    bus = smbus.SMBus(I2C_BUS)
+    lcd = HD44780(bus, address=I2C_ADDR, transport=TRANSPORT_BYTE, timing=DATASHEET_TIMING)
+    lcd.lcd_init()
+    try:
+        timing = calibrate(lcd, check_pattern)
+    finally:
+        lcd.lcd_byte(0x01, 0)  # Clear display
+
+    if timing is None:
+        print("The LCD did not read back correctly even with datasheet timing. Is RW wired to P1?")
+        return
+    timing.save(path)
+    print(f"Saved {timing} to {path}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calibrate", action="store_true", help="calibrate the connected LCD")
+    parser.add_argument("--profile", default=PROFILE_FILE, help="timing profile file")
+    args = parser.parse_args()
+
+    if args.calibrate:
+        run_calibration(args.profile)
+        return
+
+    profiles = [("legacy", LEGACY_TIMING), ("datasheet", DATASHEET_TIMING)]
+    if os.path.exists(args.profile):
+        profiles.append(("calibrated", TimingProfile.load(args.profile)))
+    benchmark(profiles)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+I2C LCD Asyncio Dashboard Script
+
+This program shows a sensor value and a clock on a 16x2 LCD without ever blocking the event loop. It demonstrates how to:
+1. Wrap the LCD in `AsyncLCD` (`lcd_async.py`), so `await display.set_line()` returns immediately.
+2. Read a sensor and update the clock in separate coroutines that share one event loop with the display writer.
+3. Let the write queue merge fast sensor updates, so only the newest value is sent to the LCD.
+
+Steps:
+1. Initializes the LCD with the RPLCD library (or a fake raw driver with `--fake`).
+2. Starts a sensor coroutine that reads a (simulated) sensor 10 times per second and updates line 1.
+3. Starts a clock coroutine that updates line 2 once per second.
+4. Prints how many line updates were sent and how many were merged when the program stops.
+
+Dependencies:
+- RPLCD (for LCD control)
+- asyncio
+- lcd_async.py, lcd_driver.py and fake_smbus.py (in this folder)
+
+Hardware Requirements:
+- 16x2 LCD display with I2C interface.
+- Raspberry Pi with I2C enabled.
+- Correct I2C address (default is 0x3F, but this may vary depending on the LCD module).
+
+Usage:
+1. Run the script: `python3 10-i2c_lcd_asyncio_dashboard.py`
+2. Without hardware, run it against a fake bus for 5 seconds: `python3 10-i2c_lcd_asyncio_dashboard.py --fake`
+3. The program will continue running until interrupted (e.g., by pressing Ctrl+C).
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from lcd_async import AsyncLCD
+
+async def read_sensor():
+    # Simulated sensor read; replace with a real (async) sensor driver
+    await asyncio.sleep(0.02)
+    return 24 + random.random() * 2
+
+async def sensor_task(display):
+    while True:
+        temperature = await read_sensor()
+        await display.set_line(0, f"Temp: {temperature:5.2f} C")
+        await asyncio.sleep(0.1)
+
+async def clock_task(display):
+    while True:
+        await display.set_line(1, time.strftime("Time: %H:%M:%S"))
+        await asyncio.sleep(1 - time.time() % 1)  # Wake up at the next full second
+
+async def run(lcd, duration=None):
+    async with AsyncLCD(lcd) as display:
+        tasks = [asyncio.create_task(sensor_task(display)), asyncio.create_task(clock_task(display))]
+        try:
+            await asyncio.wait(tasks, timeout=duration)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await display.clear()
+            print(f"Lines sent: {display.lines_sent}, merged: {display.lines_coalesced}, "
+                  f"failed: {display.write_errors}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Asyncio LCD dashboard")
+    parser.add_argument("--fake", action="store_true", help="run for 5 seconds against a fake I2C bus")
+    args = parser.parse_args()
+
+    if args.fake:
+        from fake_smbus import FakeSMBus
+        from lcd_driver import HD44780
+
+        bus = FakeSMBus()
+        lcd = HD44780(bus, address=0x3F, transport="block")
+        lcd.lcd_init()
+        asyncio.run(run(lcd, duration=5))
+        print(f"I2C transactions: {bus.transaction_count}, bytes: {bus.byte_count}")
+        return
+
+    from RPLCD.i2c import CharLCD  # Import the CharLCD class from the RPLCD library
+
+    lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)
+    try:
+        asyncio.run(run(lcd))
+    except KeyboardInterrupt:
+        lcd.clear()
+        print("Program stopped. LCD cleared.")
+
+if __name__ == '__main__':
+    main()
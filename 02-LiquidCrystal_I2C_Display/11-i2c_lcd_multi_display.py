@@ -0,0 +1,84 @@
+"""
+I2C Multi-LCD Script
+
+This program drives several 16x2 LCDs with PCF8574 backpacks on one I2C bus through `LCDBusManager`
+(`lcd_bus_manager.py`). It demonstrates how to:
+1. Register several displays by I2C address on one shared `smbus.SMBus(1)`.
+2. Update them from one program while the manager interleaves their I2C transactions fairly.
+3. Report the refresh latency of each display.
+
+Steps:
+1. Opens the I2C bus (or a fake bus that models 100 kHz wire time with `--fake`).
+2. Registers the displays listed in `DISPLAY_ADDRESSES` and starts the manager's background thread.
+3. Every 100 ms, fully rewrites both lines of the first display (a long refresh) and updates a counter on the others.
+4. Prints the per-display refresh latency when the program stops.
+
+Dependencies:
+- smbus (for I2C communication)
+- time (for delays)
+- lcd_bus_manager.py, lcd_driver.py, lcd_timing.py and fake_smbus.py (in this folder)
+
+Hardware Requirements:
+- Two or more 16x2 LCD displays with I2C backpacks, each set to a different I2C address (A0-A2 jumpers).
+- Raspberry Pi with I2C enabled.
+
+Usage:
+1. Set `DISPLAY_ADDRESSES` to the addresses shown by `sudo i2cdetect -y 1`.
+2. Run the script: `python3 11-i2c_lcd_multi_display.py` (or add `--fake` to run it for 5 seconds without hardware).
+3. The program will continue running until interrupted (e.g., by pressing Ctrl+C).
+"""
+
+import argparse
+import time
+from lcd_bus_manager import LCDBusManager
+from lcd_driver import LCD_LINE_1, LCD_LINE_2
+
+DISPLAY_ADDRESSES = [0x3F, 0x27, 0x26]  # Replace with your I2C addresses
+I2C_BUS = 1
+
+def print_latency(manager):
+    for address, stats in manager.latency_stats().items():
+        print(f"0x{address:02X}: {stats['updates']} updates, mean {stats['mean_ms']:.2f} ms, "
+              f"max {stats['max_ms']:.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Several LCDs on one I2C bus")
+    parser.add_argument("--fake", action="store_true", help="run for 5 seconds against a fake I2C bus")
+    args = parser.parse_args()
+
+    if args.fake:
+        from fake_smbus import FakeSMBus
+        bus = FakeSMBus(realtime=True)
+        duration = 5
+    else:
+        import smbus
+        bus = smbus.SMBus(I2C_BUS)
+        duration = None
+
+    manager = LCDBusManager(bus)
+    for address in DISPLAY_ADDRESSES:
+        manager.add_display(address)
+    manager.start()
+
+    main_display, *counters = DISPLAY_ADDRESSES
+    start = time.monotonic()
+    count = 0
+    try:
+        while duration is None or time.monotonic() - start < duration:
+            # Long refresh on the first display (both lines rewritten)
+            manager.update(main_display, time.strftime("Time: %H:%M:%S"), LCD_LINE_1, diff=False)
+            manager.update(main_display, f"Frame {count}", LCD_LINE_2, diff=False)
+            # Short updates on the others (only the changed digits are sent)
+            for address in counters:
+                manager.update(address, f"Count: {count:6d}", LCD_LINE_1)
+
+            count += 1
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.stop()
+        print_latency(manager)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+I2C LCD Glyph Cache Benchmark Script
+
+This program counts the CGRAM writes needed to scroll text with special characters (like the "😴" in
+`07-i2c_lcd_single_line_scrolling.py`) across a 16x2 LCD, without any hardware. The raw driver (`lcd_driver.py`) is
+connected to a `FakeSMBus`.
+
+Steps:
+1. Scrolls each test message across line 1 several times, one character per frame.
+2. "naive": uploads the bitmaps of every special character in the frame, every frame.
+3. "cached": uses `GlyphCache` (`lcd_glyphs.py`), which only uploads glyphs that are not loaded yet and evicts the
+   least recently used glyph when all 8 CGRAM slots are full.
+4. Prints frames, glyph uploads, CGRAM bytes and total I2C bytes for both.
+
+Dependencies:
+- lcd_driver.py, lcd_glyphs.py and fake_smbus.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 12-i2c_lcd_glyph_cache_benchmark.py`
+"""
+
+from lcd_driver import HD44780, LCD_LINE_1, LCD_WIDTH
+from lcd_glyphs import GLYPHS, GlyphCache
+from fake_smbus import FakeSMBus
+
+LOOPS = 5  # How many times each message scrolls through
+
+MESSAGES = [
+    "Error 404: Sleep Not Found! 😴",  # From 07-i2c_lcd_single_line_scrolling.py
+    "Battery 🔋 ↑ 80% ✓  Temp 🌡 ↓ 21C ♥ Price 5€ 😊 🌟 😴",  # 10 different glyphs, more than the 8 slots
+]
+
+def frames(text):
+    padding = " " * LCD_WIDTH
+    text_with_padding = padding + text + padding
+    for _ in range(LOOPS):
+        for i in range(len(text_with_padding) - LCD_WIDTH + 1):
+            yield text_with_padding[i:i + LCD_WIDTH]
+
+def run_naive(text):
+    bus = FakeSMBus()
+    lcd = HD44780(bus, transport="block")
+    lcd.lcd_init()
+    bus.reset()
+
+    count = uploads = 0
+    for frame in frames(text):
+        chars = [char for char in dict.fromkeys(frame) if char in GLYPHS][:8]
+        for slot, char in enumerate(chars):
+            lcd.write_cgram(slot, [GLYPHS[char]])  # Re-send the bitmap every frame
+        frame = frame.translate({ord(char): chr(slot) for slot, char in enumerate(chars)})
+        lcd.lcd_string(frame, LCD_LINE_1)
+        count += 1
+        uploads += len(chars)
+    return count, uploads, uploads * 8, bus.byte_count
+
+def run_cached(text):
+    bus = FakeSMBus()
+    lcd = HD44780(bus, transport="block")
+    lcd.lcd_init()
+    bus.reset()
+
+    glyphs = GlyphCache.for_driver(lcd)
+    count = 0
+    for frame in frames(text):
+        lcd.lcd_string(glyphs.encode(frame), LCD_LINE_1)
+        count += 1
+    return count, glyphs.glyph_uploads, glyphs.cgram_bytes, bus.byte_count
+
+def main():
+    print(f"{'message':<24}{'mode':<8}{'frames':>8}{'uploads':>9}{'CGRAM bytes':>13}{'I2C bytes':>11}")
+    for text in MESSAGES:
+        for mode, run in (("naive", run_naive), ("cached", run_cached)):
+            count, uploads, cgram_bytes, i2c_bytes = run(text)
+            print(f"{text[:22]:<24}{mode:<8}{count:>8}{uploads:>9}{cgram_bytes:>13}{i2c_bytes:>11}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+I2C LCD Emulator Benchmark Script
+
+This program runs the LCD scripts of this folder unchanged against the HD44780 + PCF8574 emulator (`lcd_emulator.py`)
+and measures the I2C traffic of their workloads, without any hardware:
+- static text (`01-i2c_lcd_display.py`)
+- backlight cycling (`02-...` and `03-...`)
+- scrolling (`04-...` to `07-...`)
+
+Steps:
+1. Replaces `smbus.SMBus` and RPLCD's I2C bus with an `EmulatedSMBus`.
+2. Runs each script with `runpy`. Every `time.sleep()` of 50 ms or longer ends a frame: it returns at once and the
+   I2C transactions, bytes and elapsed time since the previous frame are recorded. Shorter sleeps (the drivers' own
+   waits) are kept.
+3. The elapsed time of a frame is the host time plus the modeled 100 kHz wire time of its transfers.
+4. After `--frames` frames the script gets a KeyboardInterrupt, so it runs its own cleanup code.
+5. Prints per-script results: the first frame (including display initialisation) and the mean of the other frames,
+   plus the controller timing violations and backlight changes seen by the emulator.
+
+Dependencies:
+- RPLCD (for the scripts that use CharLCD)
+- lcd_emulator.py, fake_smbus.py and the modules the scripts import (in this folder)
+
+Usage:
+Run the script on any computer: `python3 13-i2c_lcd_emulator_benchmark.py`
+- `--frames 40` runs more frames per script.
+- `--show` prints the emulated screen at the end of the last frame of each script.
+- `--json results.json` also writes the results as JSON.
+- Pass script names to run only some of them, e.g. `python3 13-i2c_lcd_emulator_benchmark.py 01-i2c_lcd_display.py`
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import runpy
+import time
+from lcd_emulator import EmulatedSMBus, emulated_rplcd
+
+LCD_ADDRESS = 0x3F
+FRAME_SLEEP = 0.05  # Sleeps this long or longer are frame delays, not driver waits
+
+WORKLOADS = [
+    ("01-i2c_lcd_display.py", "static text"),
+    ("02-i2c_lcd_backlight_control.py", "backlight cycling"),
+    ("03-i2c_lcd_with_backlight_control.py", "backlight cycling"),
+    ("04_i2c_DoubLine-Text-Scrolling.py", "scrolling"),
+    ("05-i2c_lcd_simultaneous_scrolling_messages_bothLine.py", "scrolling"),
+    ("06-i2c_lcd_dynamic_scrolling_messages_bothLine.py", "scrolling"),
+    ("07-i2c_lcd_single_line_scrolling.py", "scrolling"),
+]
+
+class FrameRecorder:
+    # Replacement for time.sleep() that splits the run into frames
+    def __init__(self, bus, max_frames):
+        self.bus = bus
+        self.max_frames = max_frames
+        self.frames = []  # (transactions, bytes, seconds) per frame
+        self.screen = []  # Emulated screen at the end of the last frame
+        self._sleep = time.sleep
+        self._mark = (0, 0, time.perf_counter())
+
+    def sleep(self, seconds):
+        if seconds < FRAME_SLEEP:
+            self._sleep(seconds)
+            return
+        self.end_frame()
+        if len(self.frames) >= self.max_frames:
+            raise KeyboardInterrupt
+        self._mark = (self.bus.transaction_count, self.bus.byte_count, time.perf_counter())
+
+    def end_frame(self):
+        transactions, byte_count, start = self._mark
+        transactions = self.bus.transaction_count - transactions
+        if transactions:  # Pauses between messages do not count as frames
+            # Host time plus the wire time the fake bus did not spend
+            wire_time = sum(self.bus.transaction_time(data) for _, data in self.bus.transactions[-transactions:])
+            elapsed = time.perf_counter() - start + wire_time
+            self.frames.append((transactions, self.bus.byte_count - byte_count, elapsed))
+            self.screen = self.bus.display(LCD_ADDRESS).screen()
+
+def run_script(name, max_frames):
+    bus = EmulatedSMBus()
+    recorder = FrameRecorder(bus, max_frames)
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+    time.sleep = recorder.sleep
+    try:
+        with emulated_rplcd(bus), contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(path, run_name="__main__")
+    except KeyboardInterrupt:
+        pass  # Scripts without their own handler
+    finally:
+        time.sleep = recorder._sleep
+    return bus, recorder
+
+def summarize(name, workload, bus, recorder):
+    frames = recorder.frames
+    model = bus.display(LCD_ADDRESS)
+    first = frames[0] if frames else (0, 0, 0.0)
+    rest = frames[1:] or frames
+    count = max(len(rest), 1)
+    return {
+        "script": name,
+        "workload": workload,
+        "frames": len(frames),
+        "first_frame": {"transactions": first[0], "bytes": first[1], "ms": first[2] * 1000},
+        "per_frame": {
+            "transactions": sum(frame[0] for frame in rest) / count,
+            "bytes": sum(frame[1] for frame in rest) / count,
+            "ms": sum(frame[2] for frame in rest) / count * 1000,
+        },
+        "total": {"transactions": bus.transaction_count, "bytes": bus.byte_count, "wire_ms": bus.wire_time * 1000},
+        "timing_violations": model.timing_violations,
+        "backlight_changes": model.backlight_changes,
+        "clears": model.clears,
+        "screen": recorder.screen,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the LCD scripts against the HD44780 emulator")
+    parser.add_argument("scripts", nargs="*", help="scripts to run (default: 01-07)")
+    parser.add_argument("--frames", type=int, default=20, help="frames per script")
+    parser.add_argument("--show", action="store_true", help="print the emulated screen after the last frame")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    workloads = [(name, workload) for name, workload in WORKLOADS if not args.scripts or name in args.scripts]
+
+    print(f"{'script':<28}{'workload':<19}{'frames':>7}{'first tx':>9}{'tx/frame':>9}{'B/frame':>9}"
+          f"{'ms/frame':>9}{'violations':>11}{'backlight':>10}")
+    results = []
+    for name, workload in workloads:
+        bus, recorder = run_script(name, args.frames)
+        result = summarize(name, workload, bus, recorder)
+        results.append(result)
+        per_frame = result["per_frame"]
+        print(f"{name[:26]:<28}{workload:<19}{result['frames']:>7}{result['first_frame']['transactions']:>9}"
+              f"{per_frame['transactions']:>9.1f}{per_frame['bytes']:>9.1f}{per_frame['ms']:>9.2f}"
+              f"{result['timing_violations']:>11}{result['backlight_changes']:>10}")
+        if args.show:
+            for row in result["screen"]:
+                print(f"    |{row}|")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+I2C LCD Scroll Frame Table Benchmark Script
+
+This program measures the CPU time and memory allocations of building the scroll frames for the playlist in
+`06-i2c_lcd_dynamic_scrolling_messages_bothLine.py`, without any hardware and without writing to an LCD.
+
+Steps:
+1. Reads the `messages` list from the 06 script (with `ast`, the script itself is not run).
+2. "slicing": builds `padding + text + padding` and slices a new 16-character string for every frame, like the
+   original `scroll_text()`.
+3. "frame table": takes the frames from `frame_table()` (`lcd_frames.py`). The first pass compiles every message, the
+   following passes replay the cached tables.
+4. Prints, per method, the CPU time per frame (`time.process_time()`), the memory allocated per frame (`tracemalloc`)
+   and how many different string objects were handed out as frames.
+
+Dependencies:
+- lcd_frames.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 14-i2c_lcd_frame_table_benchmark.py`
+"""
+
+import ast
+import os
+import time
+import tracemalloc
+from lcd_frames import frame_table
+
+PLAYLIST_SCRIPT = "06-i2c_lcd_dynamic_scrolling_messages_bothLine.py"
+WIDTH = 16
+PASSES = 200  # Times the whole playlist is played
+
+def load_messages():
+    # The `messages = [...]` literal of the playlist script
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), PLAYLIST_SCRIPT)
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "messages" for target in node.targets):
+            return [text for pair in ast.literal_eval(node.value) for text in pair]
+    raise ValueError(f"No messages list in {PLAYLIST_SCRIPT}")
+
+def slicing_frames(text):
+    padding = " " * WIDTH
+    text_with_padding = padding + text + padding
+    for i in range(len(text_with_padding) - WIDTH + 1):
+        yield text_with_padding[i:i + WIDTH]
+
+def table_frames(text):
+    return frame_table(text, WIDTH)
+
+def play(messages, frames, passes, keep=None):
+    count = 0
+    for _ in range(passes):
+        for text in messages:
+            for frame in frames(text):
+                if keep is not None:
+                    keep[count] = frame  # Keep every frame alive so its allocation shows up in the trace
+                count += 1
+    return count
+
+def measure(messages, frames, passes, compile_first):
+    # CPU time per frame, then the memory allocated for the frames in a second (traced) run
+    if compile_first:
+        frame_table.cache_clear()
+    start = time.process_time()
+    count = play(messages, frames, passes)
+    cpu = time.process_time() - start
+
+    if compile_first:
+        frame_table.cache_clear()
+    keep = [None] * count  # Allocated before the trace starts
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    play(messages, frames, passes, keep)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    new_frames = len({id(frame) for frame in keep})
+    return count, cpu / count * 1e6, allocated / count, new_frames
+
+def main():
+    messages = load_messages()
+    print(f"{len(messages)} messages from {PLAYLIST_SCRIPT}, {PASSES} passes")
+    print(f"{'method':<24}{'frames':>8}{'us/frame':>10}{'bytes/frame':>13}{'distinct frame objects':>24}")
+
+    rows = [
+        ("slicing", slicing_frames, PASSES, False),
+        ("frame table (compile)", table_frames, 1, True),  # Every message is compiled
+        ("frame table (replay)", table_frames, PASSES, False),  # The tables are already cached
+    ]
+    for name, frames, passes, compile_first in rows:
+        count, us_per_frame, bytes_per_frame, objects = measure(messages, frames, passes, compile_first)
+        print(f"{name:<24}{count:>8}{us_per_frame:>10.3f}{bytes_per_frame:>13.1f}{objects:>24}")
+
+if __name__ == '__main__':
+    main()
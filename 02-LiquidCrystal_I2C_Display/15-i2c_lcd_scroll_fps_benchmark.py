@@ -0,0 +1,69 @@
+"""
+I2C LCD Scroll Frame Rate Benchmark Script
+
+This program measures the highest frame rate `07-i2c_lcd_single_line_scrolling.py` can scroll at, without any
+hardware. It drives RPLCD's `CharLCD` on the HD44780 emulator (`lcd_emulator.py`) with `realtime=True`, so every I2C
+transfer takes as long as on a 100 kHz bus, and RPLCD's own sleeps are kept.
+
+Steps:
+1. "clear + write": the old 07 loop, `lcd.clear()` and then the 16-character frame, every frame.
+2. "in place": `LineScroller` (`lcd_scroll.py`), which never clears and only rewrites the changed part of row 0.
+3. Both scroll the 07 message with no delay between frames; the achieved frames per second is the frame rate the mode
+   can sustain.
+4. Also prints I2C transactions per frame, and whether the static text on row 1 survived.
+
+Dependencies:
+- RPLCD
+- lcd_emulator.py, lcd_scroll.py, lcd_frames.py, lcd_glyphs.py and fake_smbus.py (in this folder)
+
+Usage:
+Run the script on any computer: `python3 15-i2c_lcd_scroll_fps_benchmark.py`
+"""
+
+import time
+from lcd_emulator import EmulatedSMBus, emulated_rplcd
+from lcd_frames import frame_table
+from lcd_glyphs import GlyphCache
+from lcd_scroll import LineScroller
+
+MESSAGE = "Error 404: Sleep Not Found! 😴"  # From 07-i2c_lcd_single_line_scrolling.py
+STATIC_TEXT = "Pi: online"  # Written to row 1 before scrolling
+LCD_ADDRESS = 0x3F
+
+def make_lcd():
+    bus = EmulatedSMBus(realtime=True)
+    with emulated_rplcd(bus):
+        from RPLCD.i2c import CharLCD
+        lcd = CharLCD(i2c_expander='PCF8574', address=LCD_ADDRESS, port=1, cols=16, rows=2, dotsize=8)
+    lcd.cursor_pos = (1, 0)
+    lcd.write_string(STATIC_TEXT)
+    return bus, lcd
+
+def run_clear():
+    bus, lcd = make_lcd()
+    glyphs = GlyphCache.for_charlcd(lcd)
+    bus.reset()
+    start = time.perf_counter()
+    for frame in frame_table(MESSAGE, 16):
+        lcd.clear()
+        lcd.write_string(glyphs.encode(frame))
+    return bus, len(frame_table(MESSAGE, 16)), time.perf_counter() - start
+
+def run_in_place():
+    bus, lcd = make_lcd()
+    scroller = LineScroller(lcd, row=0, glyphs=GlyphCache.for_charlcd(lcd))
+    bus.reset()
+    start = time.perf_counter()
+    count = sum(1 for _ in scroller.frames(MESSAGE))
+    return bus, count, time.perf_counter() - start
+
+def main():
+    print(f"{'mode':<16}{'frames':>8}{'fps':>9}{'tx/frame':>10}{'clears':>8}  row 1")
+    for name, run in (("clear + write", run_clear), ("in place", run_in_place)):
+        bus, count, seconds = run()
+        model = bus.display(LCD_ADDRESS)
+        print(f"{name:<16}{count:>8}{count / seconds:>9.1f}{bus.transaction_count / count:>10.1f}"
+              f"{model.clears:>8}  |{model.text(1)}|")
+
+if __name__ == '__main__':
+    main()
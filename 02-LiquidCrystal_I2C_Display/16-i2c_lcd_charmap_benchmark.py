@@ -0,0 +1,68 @@
+"""
+I2C LCD Character Map Benchmark Script
+
+This program measures how fast the messages of the `06-i2c_lcd_dynamic_scrolling_messages_bothLine.py` playlist can
+be turned into LCD character codes, without any hardware.
+
+Steps:
+1. Reads the `messages` list from the 06 script (with `ast`, the script itself is not run).
+2. Encodes every message `PASSES` times with each method:
+   - "ord & 0xFF": the old raw driver (`[ord(char) & 0xFF for char in message]`, no real translation).
+   - "RPLCD codec": RPLCD's A02 codec, as `write_string()` uses it (only if RPLCD is installed).
+   - "charmap": `CharMap` (`lcd_charmap.py`) with its compiled `str.translate` table, without the message cache.
+   - "charmap (cached)": `charmap("A02").encode()`, which returns the cached bytes of messages it has seen.
+3. Prints messages and characters per second for each method.
+
+Dependencies:
+- lcd_charmap.py (in this folder)
+- RPLCD (optional)
+
+Usage:
+Run the script on any computer: `python3 16-i2c_lcd_charmap_benchmark.py`
+"""
+
+import ast
+import os
+import time
+from lcd_charmap import charmap
+
+PLAYLIST_SCRIPT = "06-i2c_lcd_dynamic_scrolling_messages_bothLine.py"
+PASSES = 5000  # Times the whole playlist is encoded
+
+def load_messages():
+    # The `messages = [...]` literal of the playlist script
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), PLAYLIST_SCRIPT)
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "messages" for target in node.targets):
+            return [text for pair in ast.literal_eval(node.value) for text in pair]
+    raise ValueError(f"No messages list in {PLAYLIST_SCRIPT}")
+
+def encoders():
+    rom = charmap("A02")
+    methods = [("ord & 0xFF", lambda text: [ord(char) & 0xFF for char in text])]
+    try:
+        from RPLCD.codecs import A02Codec
+        methods.append(("RPLCD codec", A02Codec().encode))
+    except ImportError:
+        pass
+    methods.append(("charmap", rom._encode))
+    methods.append(("charmap (cached)", rom.encode))
+    return methods
+
+def main():
+    messages = load_messages()
+    chars = sum(len(text) for text in messages)
+    print(f"{len(messages)} messages ({chars} characters) from {PLAYLIST_SCRIPT}, {PASSES} passes")
+    print(f"{'method':<20}{'messages/s':>14}{'chars/s':>14}")
+    for name, encode in encoders():
+        start = time.perf_counter()
+        for _ in range(PASSES):
+            for text in messages:
+                encode(text)
+        seconds = time.perf_counter() - start
+        print(f"{name:<20}{len(messages) * PASSES / seconds:>14,.0f}{chars * PASSES / seconds:>14,.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Fake SMBus Module
+
+This module provides `FakeSMBus`, a stand-in for `smbus.SMBus` that records every I2C transaction instead of talking to
+hardware. It lets the LCD drivers and benchmarks run on any Linux box without a Raspberry Pi.
+
+Features:
+- Records each transaction as an `(address, bytes)` tuple in `transactions`.
+- Counts transactions and payload bytes.
+- Models the time the transfers would take on the wire (`wire_time`) for a given I2C clock speed,
+  without actually sleeping.
+- With `realtime=True`, every transaction also blocks for its modeled wire time, so latency measurements
+  behave like on a real bus.
+
+Usage:
+    bus = FakeSMBus()
+    lcd = HD44780(bus, address=0x3F)
+    ...
+    print(bus.transaction_count, bus.byte_count, bus.wire_time)
+"""
+
+from lcd_timing import wait_ns
+
+# Bits on the wire per byte: 8 data bits + ACK
+BITS_PER_BYTE = 9
+# START + address byte + STOP per transaction
+TRANSACTION_OVERHEAD_BITS = 2 + BITS_PER_BYTE
+
+
+class FakeSMBus:
+    def __init__(self, bus=1, bus_speed_hz=100000, realtime=False):
+        self.bus = bus
+        self.bus_speed_hz = bus_speed_hz
+        self.realtime = realtime
+        self.transactions = []  # (address, bytes) for every transfer
+
+    def _record(self, address, data):
+        data = bytes(data)
+        self.transactions.append((address, data))
+        if self.realtime:
+            wait_ns(self.transaction_time(data) * 1e9)
+
+    def transaction_time(self, data):
+        # Seconds one transaction with this payload occupies the bus
+        return (TRANSACTION_OVERHEAD_BITS + BITS_PER_BYTE * len(data)) / self.bus_speed_hz
+
+    # smbus.SMBus API
+
+    def write_byte(self, address, value):
+        self._record(address, (value,))
+
+    def write_byte_data(self, address, register, value):
+        self._record(address, (register, value))
+
+    def write_i2c_block_data(self, address, register, data):
+        if len(data) > 32:
+            raise ValueError("SMBus block writes are limited to 32 data bytes")
+        self._record(address, [register] + list(data))
+
+    def i2c_rdwr(self, *messages):
+        # smbus2 style combined transfer, one entry per message
+        for message in messages:
+            self._record(message.addr, bytes(message))
+
+    def read_byte(self, address):
+        return 0xFF  # Nothing is driving the bus
+
+    def close(self):
+        pass
+
+    # Statistics
+
+    @property
+    def transaction_count(self):
+        return len(self.transactions)
+
+    @property
+    def byte_count(self):
+        return sum(len(data) for _, data in self.transactions)
+
+    @property
+    def wire_time(self):
+        # Seconds the recorded transfers would occupy the bus
+        return sum(self.transaction_time(data) for _, data in self.transactions)
+
+    def data_for(self, address):
+        # All bytes sent to one address, in order
+        return b"".join(data for addr, data in self.transactions if addr == address)
+
+    def reset(self):
+        self.transactions.clear()
@@ -0,0 +1,168 @@
+"""
+Asyncio LCD Module
+
+This module provides `AsyncLCD`, an asyncio front end for the 16x2 LCD. Callers `await display.set_line(row, text)`
+and return at once; a single writer task sends the text to the display in a worker thread, so sensor reads and other
+coroutines keep running while the (slow) I2C writes happen.
+
+Features:
+- Coalescing write queue: if a line is updated again before it was sent, only the newest text is written.
+- Works with the raw `HD44780` driver from `lcd_driver.py` and with the RPLCD `CharLCD` used in scripts 02-07.
+- All bus access happens in one worker thread, so writes never overlap.
+- Counts sent and coalesced (skipped) line updates.
+- A bus error (OSError) loses only the update that failed; it is counted (`write_errors`, `last_write_error`) and
+  the writer carries on. Any other error stops the writer and is raised by the next `set_line()`, `flush()` or
+  `close()`.
+
+Dependencies:
+- asyncio
+- concurrent.futures (for the worker thread)
+
+Usage:
+    lcd = CharLCD(i2c_expander='PCF8574', address=0x3F, port=1, cols=16, rows=2, dotsize=8)
+
+    async def main():
+        async with AsyncLCD(lcd) as display:
+            await display.set_line(0, "Temp: 24.5 C")
+            await display.set_line(1, "Humidity: 40%")
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from lcd_driver import LCD_CMD, LCD_LINE_1, LCD_LINE_2
+
+
+class RawLCDBackend:
+    # Adapter for the raw HD44780 driver
+    LINES = (LCD_LINE_1, LCD_LINE_2)
+
+    def __init__(self, lcd):
+        self.lcd = lcd
+        self.rows = len(self.LINES)
+
+    def write_line(self, row, text):
+        self.lcd.lcd_string(text, self.LINES[row])
+
+    def clear(self):
+        self.lcd.lcd_byte(0x01, LCD_CMD)  # Clear display
+
+
+class CharLCDBackend:
+    # Adapter for RPLCD's CharLCD
+    def __init__(self, lcd):
+        self.lcd = lcd
+        self.rows = lcd.lcd.rows
+        self.cols = lcd.lcd.cols
+
+    def write_line(self, row, text):
+        self.lcd.cursor_pos = (row, 0)
+        self.lcd.write_string(text[:self.cols].ljust(self.cols))
+
+    def clear(self):
+        self.lcd.clear()
+
+
+def make_backend(lcd):
+    # Pick the adapter for a raw driver or an RPLCD CharLCD
+    if hasattr(lcd, "write_line"):
+        return lcd  # Already a backend
+    if hasattr(lcd, "lcd_string"):
+        return RawLCDBackend(lcd)
+    return CharLCDBackend(lcd)
+
+
+class AsyncLCD:
+    def __init__(self, lcd):
+        self.backend = make_backend(lcd)
+        self.lines_sent = 0
+        self.lines_coalesced = 0
+        self.write_errors = 0
+        self.last_write_error = None
+
+        self._pending = {}  # row -> newest text not yet sent
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lcd")
+        self._wakeup = None
+        self._idle = None
+        self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def start(self):
+        # Start the writer task on the running event loop
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = asyncio.create_task(self._writer())
+
+    async def set_line(self, row, text):
+        # Queue `text` for line `row` and return immediately
+        self._check_writer()
+        if not 0 <= row < self.backend.rows:
+            raise ValueError(f"Row {row} is not on a {self.backend.rows}-line display")
+        if row in self._pending:
+            self.lines_coalesced += 1  # The older text is never sent
+        self._pending[row] = text
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def flush(self):
+        # Wait until every queued line has been written
+        self._check_writer()
+        await self._idle.wait()
+        self._check_writer()
+
+    async def clear(self):
+        self._pending.clear()
+        await self._run(self.backend.clear)
+
+    async def close(self):
+        if self._task is None:
+            return
+        try:
+            await self.flush()  # Raises the error that stopped the writer, if any
+        finally:
+            task, self._task = self._task, None
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            self._executor.shutdown(wait=True)
+
+    def _check_writer(self):
+        # Raise the error that stopped the writer task, instead of queueing lines nobody sends
+        if self._task is not None and self._task.done() and not self._task.cancelled():
+            error = self._task.exception()
+            if error is not None:
+                raise error
+
+    async def _run(self, function, *args):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, function, *args)
+
+    async def _writer(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            try:
+                while self._pending:
+                    # Oldest row first, with the newest text queued for it
+                    row = next(iter(self._pending))
+                    text = self._pending.pop(row)
+                    try:
+                        await self._run(self.backend.write_line, row, text)
+                    except OSError as error:
+                        # I2C error (loose wire, display reset): skip this update, the next one is sent again
+                        self.write_errors += 1
+                        self.last_write_error = error
+                        continue
+                    self.lines_sent += 1
+            finally:
+                self._idle.set()  # Also on errors, so flush() never hangs
@@ -0,0 +1,86 @@
+"""
+LCD Backlight Control Module
+
+The PCF8574 backpack has a single output byte: RS, RW, E, the backlight (P3) and the four data lines. The backlight
+scripts used to open a second `smbus.SMBus(1)` and write `0x00`/`0x08` to it behind the driver's back. That byte also
+resets the data and enable lines, and the driver's next write sets the backlight bit back to its own value, so the
+backlight flickers on again (the emulator in `lcd_emulator.py` counts these changes). This module switches the
+backlight through the driver's own expander state instead: RPLCD's `backlight_enabled`, or the `backlight` bit of the
+raw driver (`lcd_driver.py`). Both keep the bit in every byte they send afterwards.
+
+Features:
+- `turn_on()`/`turn_off()`: one expander write, only when the state changes. With the raw driver, `turn_on(write=False)`
+  only sets the bit, and the next character or command carries it.
+- Idle-off: with `idle_timeout`, the backlight goes off when nothing was shown for that many seconds, and `touch()`
+  turns it on again. The timeout is checked in `poll()`/`wait()`, which only compare times: there is no bus traffic
+  while the display is idle, apart from the single write that turns the backlight off.
+- The PCF8574 backlight pin is on/off only, so there is no dimming; idle-off is the "dim" step.
+- Counts the backlight writes (`writes`).
+
+Dependencies:
+- time
+
+Usage:
+    backlight = Backlight(lcd, idle_timeout=10)  # RPLCD CharLCD or lcd_driver.HD44780
+    backlight.touch()  # Something new is shown: backlight on, idle timer restarts
+    lcd.write_string("Hello")
+    backlight.wait(3)  # Sleep; the backlight goes off once the display was idle for 10 s
+"""
+
+import time
+
+
+class Backlight:
+    def __init__(self, lcd, idle_timeout=None, clock=None, sleep=None):
+        self.lcd = lcd
+        self.idle_timeout = idle_timeout
+        self.clock = clock or time.monotonic
+        self.sleep = sleep or time.sleep
+        self.last_activity = self.clock()
+        self.writes = 0
+
+    @property
+    def on(self):
+        if hasattr(self.lcd, "backlight_enabled"):
+            return self.lcd.backlight_enabled  # RPLCD
+        return bool(self.lcd.backlight)  # Raw driver
+
+    def turn_on(self, write=True):
+        if not self.on:
+            self._set(True, write)
+
+    def turn_off(self):
+        if self.on:
+            self._set(False, True)
+
+    def touch(self):
+        # Call when new content is shown
+        self.last_activity = self.clock()
+        self.turn_on(write=False)
+
+    def poll(self):
+        # Turn the backlight off if the display has been idle long enough; returns True if it did
+        if self.idle_timeout is None or not self.on:
+            return False
+        if self.clock() - self.last_activity < self.idle_timeout:
+            return False
+        self.turn_off()
+        return True
+
+    def wait(self, seconds):
+        # Sleep for `seconds`, turning the backlight off at the idle deadline if it falls inside
+        end = self.clock() + seconds
+        if self.idle_timeout is not None and self.on:
+            deadline = self.last_activity + self.idle_timeout
+            if deadline < end:
+                self.sleep(max(0.0, deadline - self.clock()))
+                self.poll()
+        self.sleep(max(0.0, end - self.clock()))
+
+    def _set(self, on, write):
+        if hasattr(self.lcd, "backlight_enabled"):
+            self.lcd.backlight_enabled = on  # RPLCD writes the new state once
+            self.writes += 1
+            return
+        self.lcd.set_backlight(on, write=write)
+        self.writes += write
@@ -0,0 +1,212 @@
+"""
+Multi-LCD Bus Manager Module
+
+This module lets several 16x2 LCDs with PCF8574 backpacks share one I2C bus. The `LCDBusManager` owns the bus and
+creates one raw `HD44780` driver (`lcd_driver.py`) per display address. The drivers do not write to the bus directly:
+each one writes into its own transaction queue, and the manager sends the queued transactions round-robin, one
+transaction per display per turn. A long full-screen refresh on one panel therefore never stalls a short update on
+another.
+
+Features:
+- Registers any number of displays by I2C address (`add_display()`).
+- Fair, interleaved scheduling of I2C transactions between displays.
+- Clear/home execution times are scheduled as per-display holds, so other displays keep using the bus meanwhile.
+- Reports per-display refresh latency (time from `update()` to the last transaction being sent).
+- Runs in the caller's thread (`run_pending()`) or in a background thread (`start()`/`stop()`).
+- Write-only: reading a managed display back (`read_ddram()`) raises `OSError` before anything is queued.
+
+Dependencies:
+- threading, collections, time
+- lcd_driver.py and lcd_timing.py (in this folder)
+
+Usage:
+    manager = LCDBusManager(smbus.SMBus(1))
+    manager.add_display(0x27)
+    manager.add_display(0x3F)
+    manager.update(0x27, "Temp: 24.5 C", LCD_LINE_1)
+    manager.update(0x3F, "Hello, World!", LCD_LINE_1)
+    manager.run_pending()
+    print(manager.latency_stats())
+"""
+
+from collections import deque
+import threading
+import time
+from lcd_driver import HD44780, LCD_WIDTH, TRANSPORT_BLOCK
+from lcd_timing import DATASHEET_TIMING, wait_ns
+
+# Queue entries
+OP_WRITE = "write"  # (OP_WRITE, method name, args)
+OP_HOLD = "hold"  # (OP_HOLD, nanoseconds) - the display is busy, skip it for a while
+OP_DONE = "done"  # (OP_DONE, start time) - end of one update(), used for latency
+
+
+class DisplayChannel:
+    # Bus stand-in given to one HD44780 driver; queues its transactions instead of sending them
+    can_read = False  # read_ddram() refuses to start, see read_byte()
+
+    def __init__(self, address):
+        self.address = address
+        self.queue = deque()
+        self.hold_until = 0.0
+        # Latency of the finished update() calls, in seconds; running totals, as updates never stop
+        self.updates = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.latency_last = 0.0
+
+    def record_latency(self, seconds):
+        self.updates += 1
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        self.latency_last = seconds
+
+    def write_byte(self, address, value):
+        self.queue.append((OP_WRITE, "write_byte", (address, value)))
+
+    def write_byte_data(self, address, register, value):
+        self.queue.append((OP_WRITE, "write_byte_data", (address, register, value)))
+
+    def write_i2c_block_data(self, address, register, data):
+        self.queue.append((OP_WRITE, "write_i2c_block_data", (address, register, list(data))))
+
+    def i2c_rdwr(self, *messages):
+        self.queue.append((OP_WRITE, "i2c_rdwr", messages))
+
+    def read_byte(self, address):
+        # A read needs its answer now, but the transactions before it are still queued
+        raise OSError(f"Reads are not supported on a managed display (0x{address:02X})")
+
+    def wait_ns(self, nanoseconds):
+        # Called by the driver instead of waiting itself
+        if nanoseconds > 0:
+            self.queue.append((OP_HOLD, nanoseconds))
+
+
+class LCDBusManager:
+    def __init__(self, bus, transport=TRANSPORT_BLOCK, timing=DATASHEET_TIMING):
+        self.bus = bus
+        self.transport = transport
+        self.timing = timing
+
+        self.displays = {}  # address -> HD44780
+        self._channels = {}  # address -> DisplayChannel
+        self._order = deque()  # Round-robin order of addresses
+        self._lock = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def add_display(self, address, width=LCD_WIDTH, init=True):
+        # Register a display and return its driver
+        with self._lock:
+            if address in self.displays:
+                raise ValueError(f"A display is already registered at 0x{address:02X}")
+            start = time.perf_counter()
+            channel = DisplayChannel(address)
+            lcd = HD44780(channel, address=address, width=width, transport=self.transport, timing=self.timing)
+            self._channels[address] = channel
+            self.displays[address] = lcd
+            self._order.append(address)
+            if init:
+                lcd.lcd_init()
+                channel.queue.append((OP_DONE, start))
+            self._lock.notify()
+        return lcd
+
+    def update(self, address, message, line, diff=True):
+        # Queue `message` for one line of one display
+        with self._lock:
+            start = time.perf_counter()
+            self.displays[address].lcd_string(message, line, diff=diff)
+            self._channels[address].queue.append((OP_DONE, start))
+            self._lock.notify()
+
+    def pending(self):
+        return any(channel.queue for channel in self._channels.values())
+
+    def step(self):
+        # Send at most one transaction per display; returns the number sent
+        sent = 0
+        with self._lock:
+            order = list(self._order)
+        for address in order:
+            with self._lock:
+                operation = self._next_operation(self._channels[address])
+            if operation is not None:
+                method, args = operation
+                getattr(self.bus, method)(*args)
+                sent += 1
+                with self._lock:
+                    self._finish_updates(self._channels[address])
+        with self._lock:
+            self._order.rotate(-1)  # The next round starts with another display
+        return sent
+
+    def run_pending(self):
+        # Send everything queued so far (in the caller's thread)
+        while self.pending():
+            if not self.step():
+                self._wait_for_hold()
+
+    def start(self):
+        # Send queued transactions from a background thread
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="lcd-bus-manager", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+            self._lock.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.run_pending()
+
+    def latency_stats(self):
+        # Per-display refresh latency in milliseconds
+        stats = {}
+        for address, channel in self._channels.items():
+            if channel.updates:
+                stats[address] = {
+                    "updates": channel.updates,
+                    "mean_ms": channel.latency_sum / channel.updates * 1000,
+                    "max_ms": channel.latency_max * 1000,
+                    "last_ms": channel.latency_last * 1000,
+                }
+        return stats
+
+    def _next_operation(self, channel):
+        # Pop queue entries until a transaction is found; None if the display is idle or busy
+        now = time.perf_counter()
+        while channel.queue and channel.hold_until <= now:
+            entry = channel.queue.popleft()
+            if entry[0] == OP_WRITE:
+                return entry[1], entry[2]
+            if entry[0] == OP_HOLD:
+                channel.hold_until = now + entry[1] / 1e9
+            elif entry[0] == OP_DONE:
+                channel.record_latency(now - entry[1])
+        return None
+
+    def _finish_updates(self, channel):
+        # Record the latency of every update() whose last transaction was just sent
+        now = time.perf_counter()
+        while channel.queue and channel.queue[0][0] == OP_DONE:
+            channel.record_latency(now - channel.queue.popleft()[1])
+
+    def _wait_for_hold(self):
+        # Every display with work is busy; wait for the first one to become ready
+        holds = [channel.hold_until for channel in self._channels.values() if channel.queue]
+        if holds:
+            wait_ns((min(holds) - time.perf_counter()) * 1e9)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while self._running and not self.pending():
+                    self._lock.wait()
+                if not self._running:
+                    return
+            if not self.step():
+                self._wait_for_hold()
@@ -0,0 +1,107 @@
+"""
+LCD Character Map Module
+
+The HD44780 character ROM is not Unicode. The raw driver sent `ord(char) & 0xFF`, which turns characters like "é"
+or "€" into unrelated symbols, and RPLCD's `write_string()` looks up every character of every frame in its codec
+again. This module compiles a Unicode-to-ROM translation table once and caches the encoded form of each message, so
+the scroll loops can work on ready-made `bytes`.
+
+Features:
+- Tables for the two common ROMs: "A00" (Japanese, with katakana) and "A02" (European). They are built from RPLCD's
+  codec tables when RPLCD is installed, otherwise only ASCII is mapped.
+- Characters the ROM does not have fall back to a replacement from `FALLBACKS`, then to their Unicode decomposition
+  without accents ("é" -> "e", "ﬁ" -> "fi"), then to `fallback` ("?"). Each fallback is worked out once and stored
+  in the table.
+- The CGRAM character codes "\\x00"-"\\x07" (see `lcd_glyphs.py`) pass through unchanged.
+- `encode(text)` returns the ROM codes as `bytes` and caches the result per message.
+- `write_encoded(lcd, data)` writes pre-encoded bytes to RPLCD's `CharLCD` without going through its codec again.
+
+Dependencies:
+- unicodedata, functools
+- RPLCD (optional, for the full ROM tables)
+
+Usage:
+    rom = charmap("A02")  # Must match the charmap of the display (CharLCD's default is "A02")
+    data = rom.encode("Café 5€")  # b"Caf\\xe9 5E"
+    lcd = HD44780(bus, charmap=rom)  # The raw driver encodes every lcd_string() message with it
+"""
+
+from functools import lru_cache
+import unicodedata
+
+try:
+    from RPLCD.codecs import hd44780_a00, hd44780_a02
+    ROM_TABLES = {"A00": hd44780_a00.encoding_table, "A02": hd44780_a02.encoding_table}
+except ImportError:
+    ROM_TABLES = {}
+
+# Printable ASCII that both ROMs share (A00 has "¥" at 0x5C and arrows at 0x7E/0x7F)
+ASCII_TABLE = {chr(code): code for code in range(0x20, 0x7E) if code != 0x5C}
+CGRAM_CODES = range(8)  # Custom characters
+
+# Replacements for characters that are missing from a ROM (the result is encoded again)
+FALLBACKS = {
+    "‘": "'", "’": "'", "‚": ",",  # Single quotes
+    "“": '"', "”": '"', "„": '"',  # Double quotes
+    "…": "...",  # Ellipsis
+    "€": "E",  # Euro sign
+    "°": "o",  # Degree sign
+    "×": "x",  # Multiplication sign
+    "ß": "ss",  # Sharp s
+    "•": "*",  # Bullet
+    "\\": "/",  # A00 has no backslash
+    "\t": " ",
+}
+
+ENCODE_CACHE_SIZE = 256  # Messages kept encoded
+
+
+class TranslationTable(dict):
+    # str.translate() table: ordinal -> ROM code(s) as a str of code points below 256.
+    # Missing characters are resolved once by the CharMap and stored.
+    def __init__(self, charmap, entries):
+        super().__init__(entries)
+        self.charmap = charmap
+
+    def __missing__(self, ordinal):
+        value = self.charmap.resolve(chr(ordinal))
+        self[ordinal] = value
+        return value
+
+
+class CharMap:
+    def __init__(self, rom="A02", fallback="?"):
+        self.rom = rom
+        self.codes = dict(ROM_TABLES.get(rom, ASCII_TABLE))  # char -> ROM code
+        self.fallback = fallback
+        entries = {ord(char): chr(code) for char, code in self.codes.items()}
+        entries.update({code: chr(code) for code in CGRAM_CODES})
+        self.table = TranslationTable(self, entries)
+        self.encode = lru_cache(maxsize=ENCODE_CACHE_SIZE)(self._encode)
+
+    def _encode(self, text):
+        return text.translate(self.table).encode("latin-1")
+
+    def resolve(self, char):
+        # ROM codes for a character that is not in the table
+        replacement = FALLBACKS.get(char)
+        if replacement is None:
+            # Decompose and keep what the ROM has ("é" -> "e" + combining accent -> "e")
+            decomposed = unicodedata.normalize("NFKD", char)
+            if decomposed != char:
+                replacement = "".join(part for part in decomposed if part in self.codes)
+        if not replacement:
+            replacement = self.fallback
+        return "".join(chr(self.codes.get(part, self.codes.get(self.fallback, 0x3F))) for part in replacement)
+
+
+@lru_cache(maxsize=None)
+def charmap(rom="A02"):
+    # Shared CharMap per ROM, so the table and the message cache are built once
+    return CharMap(rom)
+
+
+def write_encoded(lcd, data):
+    # Write ROM codes to RPLCD's CharLCD at the cursor, without its codec
+    for code in data:
+        lcd.write(code)
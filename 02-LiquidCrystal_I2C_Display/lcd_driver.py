@@ -0,0 +1,329 @@
+"""
+HD44780 I2C LCD Driver Module
+
+This module contains the raw HD44780 driver from `01-i2c_lcd_display.py`, wrapped in a class so that it can be shared
+by other scripts and run against a fake bus (see `fake_smbus.py`). The LCD is connected through a PCF8574 I2C backpack,
+so every HD44780 byte is sent as two 4-bit nibbles, and each nibble is latched by pulsing the Enable (E) pin.
+
+PCF8574 pin mapping:
+- P0 = RS (0 = command, 1 = data)
+- P1 = RW (always 0, write)
+- P2 = E (enable)
+- P3 = Backlight
+- P4..P7 = D4..D7
+
+Transport Modes:
+- "byte"  : The original behaviour. Every expander state is a separate `bus.write_byte()` call, with the waits of the
+            timing profile around every enable pulse (6 transactions per character).
+- "block" : The expander states for a whole line (or screen) are built in one buffer and sent with
+            `bus.write_i2c_block_data()`, 33 states per transfer. The I2C clock itself provides the enable pulse width
+            and the HD44780 execution time (37 us), so the only waits are after clear/home and during initialisation.
+- "rdwr"  : Like "block", but the whole buffer is sent as one `i2c_rdwr` message (needs the `smbus2` library).
+
+Shadow DDRAM:
+- The driver keeps a copy of the display's DDRAM (`ddram`) and tracks the cursor address.
+- `lcd_string()` only sends the cells that differ from the shadow copy. Between two changed cells it either jumps
+  with a "set DDRAM address" command (`0x80 | addr`) or rewrites the unchanged cells in between, whichever costs
+  fewer expander states on the bus.
+- Pass `diff=False` (or call `invalidate()`) to force a full rewrite, e.g. after another program used the display.
+
+Character Map:
+- Without a `charmap`, each character is sent as `ord(char) & 0xFF`. Pass `charmap=charmap("A00")` (or "A02", see
+  `lcd_charmap.py`) to translate text to the display's character ROM. Messages can also be given as `bytes` of ROM
+  codes.
+
+Backlight:
+- The backlight is the P3 bit of every expander state (`backlight`). `set_backlight()` changes it with one write
+  (or none, with `write=False`), so no second bus object has to write to the backpack. See `lcd_backlight.py` for
+  idle-off.
+
+Custom Characters:
+- `write_cgram()` uploads 5x8 bitmaps into the 8 CGRAM slots; `lcd_glyphs.py` decides which symbols live there.
+
+Timing:
+- The waits come from a `TimingProfile` (see `lcd_timing.py`). The default is `DATASHEET_TIMING`; pass
+  `timing=LEGACY_TIMING` for the old fixed 0.5 ms sleeps, or a calibrated profile loaded from a file.
+- `lcd_init()` always waits 4.1 ms and 100 us after the first two function sets (`INIT_WAITS_NS`), whatever the
+  profile.
+- `read_ddram()` reads characters back from the display (RW must be wired to P1, as on common backpacks), which is
+  what the calibration uses to check that a profile works.
+
+Dependencies:
+- lcd_timing.py (in this folder), lcd_charmap.py for `charmap`
+- smbus2 (only for the "rdwr" transport)
+
+Usage:
+    bus = smbus.SMBus(1)
+    lcd = HD44780(bus, address=0x3F, transport="block")
+    lcd.lcd_init()
+    lcd.lcd_string("Hello, World!", LCD_LINE_1)
+
+    with lcd.batch():  # Send both lines in the same transfer(s)
+        lcd.lcd_string("Line one", LCD_LINE_1)
+        lcd.lcd_string("Line two", LCD_LINE_2)
+"""
+
+from contextlib import contextmanager
+from lcd_timing import DATASHEET_TIMING, INIT_WAITS_NS, SLOW_INSTRUCTIONS, wait_ns
+
+# LCD constants
+LCD_WIDTH = 16  # Characters per line
+LCD_CHR = 1  # Mode - Sending data
+LCD_CMD = 0  # Mode - Sending command
+
+LCD_LINE_1 = 0x80  # LCD RAM address for the 1st line
+LCD_LINE_2 = 0xC0  # LCD RAM address for the 2nd line
+
+DDRAM_SIZE = 0x68  # Two 40-character lines at 0x00-0x27 and 0x40-0x67
+
+LCD_BACKLIGHT = 0x08  # On
+LCD_NOBACKLIGHT = 0x00  # Off
+
+ENABLE = 0b00000100  # Enable bit
+LCD_RW = 0b00000010  # Read/Write bit (1 = read)
+
+# Transport modes
+TRANSPORT_BYTE = "byte"
+TRANSPORT_BLOCK = "block"
+TRANSPORT_RDWR = "rdwr"
+TRANSPORTS = (TRANSPORT_BYTE, TRANSPORT_BLOCK, TRANSPORT_RDWR)
+
+I2C_BLOCK_MAX = 32  # SMBus block writes carry at most 32 data bytes (plus the "command" byte)
+
+
+class HD44780:
+    def __init__(self, bus, address=0x3F, width=LCD_WIDTH, transport=TRANSPORT_BYTE, backlight=LCD_BACKLIGHT,
+                 timing=DATASHEET_TIMING, charmap=None):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport {transport!r}, expected one of {TRANSPORTS}")
+
+        self.bus = bus
+        self.address = address
+        self.width = width
+        self.transport = transport
+        self.backlight = backlight
+        self.timing = timing
+        self.charmap = charmap  # CharMap (lcd_charmap.py) for messages given as str
+        # A bus that schedules its own transfers (see lcd_bus_manager.py) also takes over the waits
+        self._wait_ns = getattr(bus, "wait_ns", wait_ns)
+
+        self._buffer = bytearray()  # Pending expander states (block/rdwr transports)
+        self._batch_depth = 0
+        self._last_mode = None  # RS level of the last state sent, None = unknown
+
+        self.ddram = None  # Shadow copy of the display RAM, None until the display is cleared
+        self._cursor = None  # DDRAM address the next data byte goes to, None = unknown
+
+        if transport == TRANSPORT_RDWR:
+            from smbus2 import i2c_msg  # Only needed for this transport
+            self._i2c_msg = i2c_msg
+
+    def lcd_init(self):
+        # Initialise display
+        # 0x33, 0x32 as single nibbles: function set (8-bit) three times, then 4-bit mode. The controller needs
+        # more than 4.1 ms after the first and 100 us after the second; these waits do not depend on the profile.
+        for wait in INIT_WAITS_NS:
+            self._nibble(0x30, LCD_CMD)
+            self.flush()
+            self._wait_ns(wait)
+        with self.batch():
+            for bits in (0x30, 0x20):  # Third function set, then switch to 4-bit mode
+                self._nibble(bits, LCD_CMD)
+                if self.transport == TRANSPORT_BYTE:
+                    self._wait_ns(self.timing.exec_ns)
+            self.lcd_byte(0x06, LCD_CMD)  # 000110 Cursor move direction
+            self.lcd_byte(0x0C, LCD_CMD)  # 001100 Display On,Cursor Off, Blink Off
+            self.lcd_byte(0x28, LCD_CMD)  # 101000 Data length, number of lines, font size
+            self.lcd_byte(0x01, LCD_CMD)  # 000001 Clear display
+
+    def lcd_byte(self, bits, mode):
+        # Send byte to data pins
+        # bits = the data
+        # mode = 1 for data, 0 for command
+
+        self._track(bits, mode)
+
+        self._nibble(bits, mode)  # High bits
+        self._nibble(bits << 4, mode)  # Low bits
+
+        if self.transport == TRANSPORT_BYTE:
+            self._wait_ns(self.timing.exec_time_ns(bits, mode))
+            return
+
+        if mode == LCD_CMD and bits in SLOW_INSTRUCTIONS:
+            self.flush()
+            self._wait_ns(self.timing.slow_exec_ns)
+        elif not self._batch_depth:
+            self.flush()
+
+    def _nibble(self, bits, mode):
+        # Send the upper 4 bits of `bits` with one enable pulse
+        state = mode | (bits & 0xF0) | self.backlight
+        if self.transport == TRANSPORT_BYTE:
+            self.bus.write_byte(self.address, state)
+            self.lcd_toggle_enable(state)
+            return
+
+        if mode != self._last_mode:
+            # RS must settle before the first enable pulse of a new mode
+            self._buffer.append(state)
+            self._last_mode = mode
+        # Data is latched on the falling edge of E, so one "E high" and one "E low" state per nibble is enough
+        self._buffer += bytes((state | ENABLE, state))
+
+    def lcd_toggle_enable(self, bits):
+        # Toggle enable
+        self._wait_ns(self.timing.setup_ns)
+        self.bus.write_byte(self.address, (bits | ENABLE))
+        self._wait_ns(self.timing.pulse_ns)
+        self.bus.write_byte(self.address, (bits & ~ENABLE))
+        self._wait_ns(self.timing.hold_ns)
+
+    def lcd_string(self, message, line, diff=True):
+        # Send string to display (str, or bytes that are already ROM codes)
+        if isinstance(message, str) and self.charmap is not None:
+            message = self.charmap.encode(message)  # Cached per message
+        if isinstance(message, (bytes, bytearray)):
+            data = message[:self.width].ljust(self.width, b" ")
+        else:
+            message = message.ljust(self.width, " ")
+            data = [ord(message[i]) & 0xFF for i in range(self.width)]  # Only the low byte reaches the LCD
+        base = line & 0x7F  # DDRAM address of the first cell
+
+        with self.batch():
+            if not diff or self.ddram is None:
+                self.lcd_byte(line, LCD_CMD)
+                for value in data:
+                    self.lcd_byte(value, LCD_CHR)
+                return
+
+            for i, value in enumerate(data):
+                address = base + i
+                if self.ddram[address] == value:
+                    continue  # Cell already shows this character
+
+                if self._cursor != address:
+                    cursor = self._cursor
+                    if cursor is not None and base <= cursor < address and \
+                            self._rewrite_cost(address - cursor) < self._jump_cost():
+                        # Cheaper to rewrite the unchanged cells than to move the cursor
+                        for j in range(cursor - base, i):
+                            self.lcd_byte(data[j], LCD_CHR)
+                    else:
+                        self.lcd_byte(0x80 | address, LCD_CMD)
+
+                self.lcd_byte(value, LCD_CHR)
+
+    def write_cgram(self, first_slot, bitmaps):
+        # Write 5x8 custom characters into consecutive CGRAM slots (0-7) with one address command
+        with self.batch():
+            self.lcd_byte(0x40 | (first_slot << 3), LCD_CMD)  # Set CGRAM address
+            for bitmap in bitmaps:
+                for row in bitmap:
+                    self.lcd_byte(row & 0x1F, LCD_CHR)
+
+    def read_ddram(self, address, count):
+        # Read `count` characters back from the display RAM, starting at `address`
+        if not getattr(self.bus, "can_read", True):
+            # Checked before anything is sent: a half-done read leaves the display in read mode
+            raise OSError(f"The bus of the display at 0x{self.address:02X} cannot read")
+        self.lcd_byte(0x80 | address, LCD_CMD)
+        self.flush()
+
+        # Data pins must be high so that the LCD can pull them low (PCF8574 quasi-bidirectional I/O)
+        state = 0xF0 | LCD_RW | LCD_CHR | self.backlight
+        self.bus.write_byte(self.address, state)
+        data = bytearray()
+        for _ in range(count):
+            value = 0
+            for shift in (0, 4):  # High nibble, then low nibble
+                self.bus.write_byte(self.address, state | ENABLE)
+                self._wait_ns(self.timing.pulse_ns)
+                value |= (self.bus.read_byte(self.address) & 0xF0) >> shift
+                self.bus.write_byte(self.address, state)
+                self._wait_ns(self.timing.hold_ns)
+            data.append(value)
+            self._wait_ns(self.timing.exec_ns)
+
+        self._cursor = None  # The address counter moved on, and the bus is left in read mode
+        self._last_mode = None
+        return bytes(data)
+
+    def invalidate(self):
+        # Forget the shadow copy so the next lcd_string() rewrites every cell
+        self.ddram = None
+        self._cursor = None
+
+    def set_backlight(self, on, write=True):
+        # Switch the backlight bit that every expander state carries.
+        # write=False only changes the bit; it reaches the backpack with the next character or command.
+        self.backlight = LCD_BACKLIGHT if on else LCD_NOBACKLIGHT
+        if not write:
+            return
+        if self.transport == TRANSPORT_BYTE:
+            self.bus.write_byte(self.address, self.backlight)  # E low, so the display ignores it
+            return
+        self._buffer.append(self.backlight)
+        self._last_mode = LCD_CMD  # RS is low in this state
+        if not self._batch_depth:
+            self.flush()
+
+    def _track(self, bits, mode):
+        # Keep the shadow DDRAM and cursor address in step with what is sent
+        if mode == LCD_CHR:
+            if self._cursor is not None:
+                if self.ddram is not None:
+                    self.ddram[self._cursor] = bits
+                # Address counter runs 0x00-0x27 then 0x40-0x67 and wraps around
+                self._cursor = {0x27: 0x40, 0x67: 0x00}.get(self._cursor, self._cursor + 1)
+        elif bits & 0x80:
+            self._cursor = bits & 0x7F  # Set DDRAM address
+        elif bits == 0x01:
+            self.ddram = bytearray(b" " * DDRAM_SIZE)  # Clear display
+            self._cursor = 0
+        elif bits in (0x02, 0x03):
+            self._cursor = 0  # Return home
+        elif bits & 0x40 or bits & 0xF0 == 0x10:
+            self._cursor = None  # CGRAM address or cursor/display shift
+
+    def _jump_cost(self):
+        # Expander states needed to move the cursor and switch back to data mode
+        if self.transport == TRANSPORT_BYTE:
+            return 6
+        return 4 + (self._last_mode != LCD_CMD) + 1
+
+    def _rewrite_cost(self, count):
+        # Expander states needed to rewrite `count` unchanged cells
+        if self.transport == TRANSPORT_BYTE:
+            return 6 * count
+        return 4 * count + (self._last_mode != LCD_CHR)
+
+    @contextmanager
+    def batch(self):
+        # Collect everything sent inside the block and flush it once at the end
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        # Send the pending expander states in as few I2C transfers as possible
+        buffer = self._buffer
+        if not buffer:
+            return
+
+        if self.transport == TRANSPORT_RDWR:
+            self.bus.i2c_rdwr(self._i2c_msg.write(self.address, bytes(buffer)))
+        else:
+            # The "command" byte of a block write is latched by the PCF8574 like any other byte
+            for start in range(0, len(buffer), I2C_BLOCK_MAX + 1):
+                chunk = buffer[start:start + I2C_BLOCK_MAX + 1]
+                if len(chunk) == 1:
+                    self.bus.write_byte(self.address, chunk[0])
+                else:
+                    self.bus.write_i2c_block_data(self.address, chunk[0], list(chunk[1:]))
+
+        buffer.clear()
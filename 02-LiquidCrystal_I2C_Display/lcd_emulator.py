@@ -0,0 +1,323 @@
+"""
+HD44780 + PCF8574 Emulator Module
+
+This module emulates a 16x2 HD44780 LCD behind a PCF8574 I2C backpack, so the LCD scripts can run and be measured on a
+plain Linux box. `EmulatedSMBus` stands in for `smbus.SMBus`: it records every transaction like `FakeSMBus` and also
+feeds each byte to an `HD44780Model` per I2C address, which decodes the nibble/enable protocol exactly the way
+`lcd_byte()`/`lcd_toggle_enable()` and RPLCD emit it.
+
+Features:
+- Decodes enable pulses (data is latched on the falling edge of E), 8-bit start-up and 4-bit mode, RS and RW.
+- Models DDRAM (2 x 40 characters), CGRAM (8 glyphs), the address counter, entry mode, display shift, display/cursor
+  on/off and the backlight bit.
+- Supports reads (busy flag, address counter and RAM), as used by the timing calibration.
+- Records timing on a modeled clock (I2C wire time plus the host's own waits) and counts instructions that arrive
+  while the controller is still busy (`timing_violations`): 37 us for most instructions, 1.52 ms for clear and home,
+  and 4.1 ms and 100 us after the first two function sets of the initialisation.
+- `emulated_rplcd()` and `emulated_smbus()` make RPLCD's `CharLCD` and `smbus.SMBus(1)` use the emulator, so the
+  original scripts run unchanged (see `13-i2c_lcd_emulator_benchmark.py`).
+
+Dependencies:
+- time, sys, types, contextlib
+- fake_smbus.py (in this folder)
+
+Usage:
+    bus = EmulatedSMBus()
+    lcd = HD44780(bus, address=0x3F, transport="block")
+    lcd.lcd_init()
+    lcd.lcd_string("Hello", LCD_LINE_1)
+    print(bus.display(0x3F).text(0))  # "Hello           "
+"""
+
+from contextlib import contextmanager
+import sys
+import time
+import types
+from fake_smbus import BITS_PER_BYTE, TRANSACTION_OVERHEAD_BITS, FakeSMBus
+
+# PCF8574 pins
+PIN_RS = 0x01
+PIN_RW = 0x02
+PIN_E = 0x04
+PIN_BACKLIGHT = 0x08
+
+LINE_LENGTH = 40  # DDRAM characters per line
+EXEC_TIME = 37e-6  # Seconds for most instructions
+SLOW_EXEC_TIME = 1.52e-3  # Clear display / return home
+INIT_EXEC_TIMES = (4.1e-3, 100e-6)  # First and second function set after power-on
+
+
+class HD44780Model:
+    def __init__(self, cols=16, rows=2):
+        self.cols = cols
+        self.rows = rows
+
+        self.pins = 0  # Last PCF8574 output byte
+        self.backlight = False
+        self.four_bit = False  # The controller starts in 8-bit mode
+        self._high_nibble = None  # First half of a 4-bit transfer
+        self._read_phase = 0  # 0 = high nibble, 1 = low nibble
+
+        self.ddram = bytearray(b" " * (0x40 + LINE_LENGTH))  # 0x00-0x27 and 0x40-0x67
+        self.cgram = bytearray(64)
+        self.address = 0  # Address counter
+        self.cgram_mode = False  # Data goes to CGRAM after "set CGRAM address"
+        self.increment = True
+        self.shift_on_write = False
+        self.shift = 0  # Display shift in characters
+        self.display_on = False
+        self.cursor_on = False
+        self.blink_on = False
+        self.two_lines = False
+        self._function_sets = 0  # Function sets received so far, for the initialisation waits
+
+        self.busy_until = 0.0
+        # Statistics
+        self.instructions = 0
+        self.data_writes = 0
+        self.cgram_writes = 0
+        self.clears = 0
+        self.display_shifts = 0
+        self.backlight_changes = 0
+        self.timing_violations = 0
+
+    # Pin level
+
+    def write(self, value, now):
+        # One byte written to the PCF8574 at model time `now`
+        previous = self.pins
+        self.pins = value
+
+        backlight = bool(value & PIN_BACKLIGHT)
+        if backlight != self.backlight:
+            self.backlight = backlight
+            self.backlight_changes += 1
+
+        if previous & PIN_E and not value & PIN_E:
+            # Falling edge of E: the LCD latches D4-D7 (from the state while E was high)
+            if previous & PIN_RW:
+                self._read_done()
+            else:
+                self._latch(previous >> 4, bool(previous & PIN_RS), now)
+
+    def read(self):
+        # PCF8574 input byte; while reading, the LCD drives D4-D7
+        if not (self.pins & PIN_RW and self.pins & PIN_E):
+            return self.pins
+        if self.pins & PIN_RS:
+            value = self.cgram[self.address & 0x3F] if self.cgram_mode else self.ddram[self._ddram_index()]
+        else:
+            value = self.address & 0x7F  # Busy flag is never set: the model executes instantly
+        nibble = value >> 4 if self._read_phase == 0 else value & 0x0F
+        return (nibble << 4) | (self.pins & 0x0F)
+
+    def _read_done(self):
+        if self._read_phase == 0:
+            self._read_phase = 1
+            return
+        self._read_phase = 0
+        if self.pins & PIN_RS:
+            self._advance()
+
+    def _latch(self, nibble, rs, now):
+        if not self.four_bit:
+            # 8-bit mode: only D4-D7 are wired, the low bits read as 0
+            self._execute(nibble << 4, rs, now)
+            return
+        if self._high_nibble is None:
+            self._high_nibble = nibble
+            return
+        value = (self._high_nibble << 4) | nibble
+        self._high_nibble = None
+        self._execute(value, rs, now)
+
+    # Instruction level
+
+    def _execute(self, value, rs, now):
+        if now < self.busy_until:
+            self.timing_violations += 1
+        exec_time = EXEC_TIME
+
+        if rs:
+            self._write_data(value)
+        else:
+            self.instructions += 1
+            if value & 0x80:
+                self.cgram_mode = False  # Set DDRAM address
+                self.address = value & 0x7F
+            elif value & 0x40:
+                self.cgram_mode = True  # Set CGRAM address
+                self.address = value & 0x3F
+            elif value & 0x20:
+                # Function set: DL (8-bit) and N (two lines)
+                if self._function_sets < len(INIT_EXEC_TIMES):
+                    exec_time = INIT_EXEC_TIMES[self._function_sets]
+                self._function_sets += 1
+                self.four_bit = not value & 0x10
+                self.two_lines = bool(value & 0x08)
+            elif value & 0x10:
+                self._shift(value)
+            elif value & 0x08:
+                self.display_on = bool(value & 0x04)
+                self.cursor_on = bool(value & 0x02)
+                self.blink_on = bool(value & 0x01)
+            elif value & 0x04:
+                self.increment = bool(value & 0x02)
+                self.shift_on_write = bool(value & 0x01)
+            elif value & 0x02:
+                self._home()
+                exec_time = SLOW_EXEC_TIME
+            elif value & 0x01:
+                self.ddram[:] = b" " * len(self.ddram)
+                self._home()
+                self.increment = True
+                self.clears += 1
+                exec_time = SLOW_EXEC_TIME
+
+        self.busy_until = now + exec_time
+
+    def _write_data(self, value):
+        if self.cgram_mode:
+            self.cgram[self.address & 0x3F] = value & 0x1F
+            self.cgram_writes += 1
+            self.address = (self.address + (1 if self.increment else -1)) & 0x3F
+            return
+        self.ddram[self._ddram_index()] = value
+        self.data_writes += 1
+        self._advance()
+        if self.shift_on_write:
+            self.shift = (self.shift + (1 if self.increment else -1)) % LINE_LENGTH
+
+    def _shift(self, value):
+        step = 1 if value & 0x04 else -1  # R/L bit
+        if value & 0x08:
+            # Display shift: the window moves the other way than the text
+            self.shift = (self.shift - step) % LINE_LENGTH
+            self.display_shifts += 1
+        else:
+            self.address = self._wrap(self.address + step)
+
+    def _home(self):
+        self.cgram_mode = False
+        self.address = 0
+        self.shift = 0
+
+    def _advance(self):
+        if self.cgram_mode:
+            self.address = (self.address + (1 if self.increment else -1)) & 0x3F
+        else:
+            self.address = self._wrap(self.address + (1 if self.increment else -1))
+
+    @staticmethod
+    def _wrap(address):
+        # DDRAM address counter: 0x00-0x27, then 0x40-0x67, then back to 0x00
+        if address == 0x28:
+            return 0x40
+        if address == 0x68:
+            return 0x00
+        if address == -1:
+            return 0x67
+        if address == 0x3F:
+            return 0x27
+        return address
+
+    def _ddram_index(self):
+        return self.address if self.address < 0x68 else 0
+
+    # Display content
+
+    def visible(self, row):
+        # Character codes currently shown on `row`
+        base = 0x40 * row
+        return bytes(self.ddram[base + (self.shift + col) % LINE_LENGTH] for col in range(self.cols))
+
+    def text(self, row):
+        # Printable view of `row`; custom characters show as "#", other non-ASCII codes as "?"
+        chars = []
+        for code in self.visible(row):
+            if code < 8:
+                chars.append("#")
+            elif 0x20 <= code < 0x7E:
+                chars.append(chr(code))
+            else:
+                chars.append("?")
+        return "".join(chars)
+
+    def screen(self):
+        return [self.text(row) for row in range(self.rows)]
+
+    def glyph(self, slot):
+        # 5x8 bitmap stored in a CGRAM slot
+        return tuple(self.cgram[slot * 8:slot * 8 + 8])
+
+
+class EmulatedSMBus(FakeSMBus):
+    def __init__(self, bus=1, bus_speed_hz=100000, realtime=False):
+        super().__init__(bus, bus_speed_hz=bus_speed_hz, realtime=realtime)
+        self.displays = {}  # address -> HD44780Model
+        self.clock = 0.0  # Model time in seconds
+        self._start = time.perf_counter()
+        self._wire_elapsed = 0.0  # Modeled wire time of all transfers so far
+
+    def display(self, address=0x3F):
+        if address not in self.displays:
+            self.displays[address] = HD44780Model()
+        return self.displays[address]
+
+    def _record(self, address, data):
+        model = self.display(address)
+        # A real SMBus call blocks for the wire time, so without `realtime` the host's clock is behind by the wire
+        # time sent so far
+        self.clock = time.perf_counter() - self._start + self._wire_elapsed
+        if not self.realtime:
+            self._wire_elapsed += self.transaction_time(data)
+        super()._record(address, data)
+        self.clock += TRANSACTION_OVERHEAD_BITS / self.bus_speed_hz
+        for value in bytes(data):
+            self.clock += BITS_PER_BYTE / self.bus_speed_hz
+            model.write(value, self.clock)
+
+    def write_byte_data(self, address, register, value):
+        # Register writes belong to MCP230xx expanders; record them without decoding
+        FakeSMBus._record(self, address, (register, value))
+
+    def read_byte(self, address):
+        self.transactions.append((address, b""))
+        return self.display(address).read()
+
+    def reset(self):
+        super().reset()
+        for model in self.displays.values():
+            for name in ("instructions", "data_writes", "cgram_writes", "clears", "display_shifts",
+                         "backlight_changes", "timing_violations"):
+                setattr(model, name, 0)
+
+
+@contextmanager
+def emulated_smbus(bus):
+    # Make `import smbus; smbus.SMBus(1)` return the emulated bus
+    module = types.ModuleType("smbus")
+    module.SMBus = lambda port=1: bus
+    saved = sys.modules.get("smbus")
+    sys.modules["smbus"] = module
+    try:
+        yield bus
+    finally:
+        if saved is None:
+            del sys.modules["smbus"]
+        else:
+            sys.modules["smbus"] = saved
+
+
+@contextmanager
+def emulated_rplcd(bus):
+    # Make RPLCD's CharLCD (and smbus.SMBus) talk to the emulated bus
+    import RPLCD.i2c
+
+    saved = RPLCD.i2c.SMBus
+    RPLCD.i2c.SMBus = lambda port=1: bus
+    try:
+        with emulated_smbus(bus):
+            yield bus
+    finally:
+        RPLCD.i2c.SMBus = saved
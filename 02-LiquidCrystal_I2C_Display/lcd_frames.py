@@ -0,0 +1,56 @@
+"""
+LCD Scroll Frame Table Module
+
+The software `scroll_text()` rebuilds `padding + text + padding` and slices a new 16-character string for every frame,
+every time a message is shown again. This module compiles a message once into a table of its scroll frames and keeps
+the tables in a cache keyed by message and width, so replaying a message (like the playlist in
+`06-i2c_lcd_dynamic_scrolling_messages_bothLine.py`) only hands out strings that already exist.
+
+Features:
+- `frame_table(text, width)` returns a `FrameTable`: one padded buffer plus the frame strings, built once.
+- Tables are cached (least recently used tables are dropped after `FRAME_CACHE_SIZE` messages).
+- With a `CharMap` (`lcd_charmap.py`), the message is encoded to ROM codes once and the frames are `bytes`.
+
+Dependencies:
+- functools
+
+Usage:
+    for frame in frame_table("Dream big, work hard!", 16):
+        lcd.cursor_pos = (0, 0)
+        lcd.write_string(frame)
+        time.sleep(0.3)
+"""
+
+from functools import lru_cache
+
+FRAME_CACHE_SIZE = 64  # Messages kept compiled
+
+
+class FrameTable:
+    def __init__(self, text, width, charmap=None):
+        self.text = text
+        self.width = width
+        if charmap is None:
+            padding = " " * width
+            self.buffer = padding + text + padding  # The message as it passes the display
+        else:
+            padding = b" " * width
+            self.buffer = padding + charmap.encode(text) + padding  # Encoded once, frames are bytes
+        count = len(self.buffer) - width + 1
+        # Frame i shows buffer[i:i + width]
+        self.frames = tuple(self.buffer[i:i + width] for i in range(count))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        return iter(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def frame_table(text, width=16, charmap=None):
+    # Compiled scroll frames of `text` on a `width` character line (cached)
+    return FrameTable(text, width, charmap)
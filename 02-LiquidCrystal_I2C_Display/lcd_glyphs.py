@@ -0,0 +1,139 @@
+"""
+LCD Custom Glyph Cache Module
+
+The HD44780 character ROM has no emoji or symbols like "😴", "♥" or "€", and the raw driver's `ord(message[i])` sends
+junk for them. The controller does have 8 CGRAM slots for user-defined 5x8 characters. This module maps Unicode
+characters to 5x8 bitmaps and keeps the ones currently needed in those slots.
+
+Features:
+- `GLYPHS` holds 5x8 bitmaps for common symbols; add your own with `GlyphCache(glyphs={...})`.
+- `encode(text, row)` replaces each known symbol with the CGRAM character code ("\\x00"-"\\x07") of its slot,
+  uploading the bitmap first if it is not loaded yet. The result can be passed to RPLCD's `write_string()` or to the
+  raw driver's `lcd_string()`.
+- Least-recently-used eviction: when all 8 slots are taken, the glyph unused for the longest time is replaced. Glyphs
+  that are visible on the display (on any row) are never evicted.
+- Glyphs that are already loaded are never uploaded again, and new glyphs in neighbouring slots are uploaded together
+  with a single CGRAM address command (raw driver).
+- If a text needs more than 8 different glyphs at once, the extra ones are shown as `fallback`.
+- Counts uploaded glyphs, CGRAM address commands and CGRAM data bytes.
+
+Dependencies:
+- collections
+
+Usage:
+    glyphs = GlyphCache.for_charlcd(lcd)  # RPLCD CharLCD, or GlyphCache.for_driver(lcd) for lcd_driver.HD44780
+    lcd.write_string(glyphs.encode("Sleep Not Found! 😴"))
+"""
+
+from collections import OrderedDict
+
+CGRAM_SLOTS = 8
+
+# 5x8 bitmaps, one number per pixel row (5 bits wide)
+GLYPHS = {
+    "😴": (0b00000, 0b01110, 0b10001, 0b11011, 0b10001, 0b10101, 0b01110, 0b00000),  # Sleeping face
+    "😊": (0b00000, 0b01010, 0b01010, 0b00000, 0b10001, 0b01110, 0b00000, 0b00000),  # Smiling face
+    "🌟": (0b00100, 0b00100, 0b11111, 0b01110, 0b01110, 0b11011, 0b10001, 0b00000),  # Star
+    "♥": (0b00000, 0b01010, 0b11111, 0b11111, 0b01110, 0b00100, 0b00000, 0b00000),  # Heart
+    "✓": (0b00000, 0b00001, 0b00011, 0b10110, 0b11100, 0b01000, 0b00000, 0b00000),  # Check mark
+    "€": (0b00110, 0b01001, 0b11100, 0b01000, 0b11100, 0b01001, 0b00110, 0b00000),  # Euro sign
+    "↑": (0b00100, 0b01110, 0b10101, 0b00100, 0b00100, 0b00100, 0b00100, 0b00000),  # Up arrow
+    "↓": (0b00100, 0b00100, 0b00100, 0b00100, 0b10101, 0b01110, 0b00100, 0b00000),  # Down arrow
+    "🔋": (0b01110, 0b11011, 0b10001, 0b10001, 0b11111, 0b11111, 0b11111, 0b00000),  # Battery
+    "🌡": (0b00100, 0b01010, 0b01010, 0b01110, 0b01110, 0b11111, 0b11111, 0b01110),  # Thermometer
+}
+
+
+class GlyphCache:
+    def __init__(self, upload, glyphs=GLYPHS, fallback="?", batch_uploads=True):
+        # upload(first_slot, bitmaps) writes one or more glyphs into consecutive CGRAM slots
+        self.upload = upload
+        self.batch_uploads = batch_uploads
+        self.glyphs = glyphs
+        self.fallback = fallback
+
+        self.slots = OrderedDict()  # char -> slot, least recently used first
+        self._visible = {}  # row -> glyph chars currently shown on that row
+
+        self.glyph_uploads = 0  # Glyphs written to CGRAM
+        self.upload_batches = 0  # CGRAM address commands
+        self.cgram_bytes = 0  # Bitmap rows written to CGRAM
+
+    @classmethod
+    def for_driver(cls, lcd, **kwargs):
+        # Glyph cache for the raw HD44780 driver (lcd_driver.py), with batched uploads
+        return cls(lcd.write_cgram, **kwargs)
+
+    @classmethod
+    def for_charlcd(cls, lcd, **kwargs):
+        # Glyph cache for RPLCD's CharLCD
+        def upload(first_slot, bitmaps):
+            for offset, bitmap in enumerate(bitmaps):
+                lcd.create_char(first_slot + offset, bitmap)
+        return cls(upload, batch_uploads=False, **kwargs)  # create_char() sends one glyph at a time
+
+    def encode(self, text, row=0):
+        # Replace known glyphs in `text` with their CGRAM character codes
+        needed = [char for char in dict.fromkeys(text) if char in self.glyphs]
+        if not needed:
+            self._visible[row] = set()
+            return text
+
+        # Glyphs on this frame and on the other rows must stay loaded
+        pinned = set(needed)
+        for other_row, chars in self._visible.items():
+            if other_row != row:
+                pinned |= chars
+
+        mapping = {}
+        new_slots = {}
+        for char in needed:
+            slot = self.slots.get(char)
+            if slot is None:
+                slot = self._allocate(pinned)
+                if slot is None:
+                    mapping[ord(char)] = self.fallback  # More than 8 glyphs at once
+                    continue
+                self.slots[char] = slot
+                new_slots[slot] = self.glyphs[char]
+            self.slots.move_to_end(char)  # Most recently used
+            mapping[ord(char)] = chr(slot)
+
+        self._upload(new_slots)
+        self._visible[row] = {char for char in needed if char in self.slots}
+        return text.translate(mapping)
+
+    def forget(self):
+        # Call after the display was re-initialised (CGRAM content is lost)
+        self.slots.clear()
+        self._visible.clear()
+
+    def _allocate(self, pinned):
+        # Free slot, or the least recently used slot whose glyph is not pinned
+        used = set(self.slots.values())
+        for slot in range(CGRAM_SLOTS):
+            if slot not in used:
+                return slot
+        for char, slot in self.slots.items():
+            if char not in pinned:
+                del self.slots[char]
+                return slot
+        return None
+
+    def _upload(self, new_slots):
+        # Upload runs of consecutive slots with one call each
+        run = []
+        for slot in sorted(new_slots):
+            if run and (slot != run[0] + len(run) or not self.batch_uploads):
+                self._upload_run(run, new_slots)
+                run = []
+            run.append(slot)
+        if run:
+            self._upload_run(run, new_slots)
+
+    def _upload_run(self, run, new_slots):
+        bitmaps = [new_slots[slot] for slot in run]
+        self.upload(run[0], bitmaps)
+        self.glyph_uploads += len(run)
+        self.upload_batches += 1
+        self.cgram_bytes += 8 * len(run)
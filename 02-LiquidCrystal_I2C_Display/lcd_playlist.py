@@ -0,0 +1,191 @@
+"""
+LCD Message Playlist Module
+
+This module reads the message pairs for the scrolling scripts from a playlist file (or a directory of playlist files)
+instead of a hard-coded list, and picks up changes while the display keeps running.
+
+Playlist format (UTF-8 text, one entry per line, `#` starts a comment line):
+    Dream big, work hard! | Stay focused, win big!
+    Raspberry Pi rocks!   | I2C LCD is awesome!
+
+Features:
+- A background thread polls the modification time of the file (or of the directory and its `*.txt` files) every
+  `poll_interval` seconds and re-indexes the playlist when it changed.
+- The new index is swapped in between two messages, so the display never stops; playback continues at the same
+  position (or starts over if the playlist got shorter).
+- Lazy loading: the index only holds the file offset of every entry, and is built while playing: the files are
+  scanned only as far as the next entries, so the first message shows without reading the whole playlist. An entry
+  is read when it is about to be shown, and only the next `lookahead` entries are compiled into scroll frames
+  (`lcd_frames.py`) ahead of time, in the background thread. Start-up time does not grow with the playlist size;
+  memory grows by one offset per entry.
+- Frames shown as ROM codes: pass the display's `charmap` (`lcd_charmap.py`), so the precompiled frame tables are the
+  ones the display loop asks for.
+
+Dependencies:
+- os, threading, time
+- lcd_frames.py (in this folder)
+
+Usage:
+    playlist = Playlist("playlist.txt")
+    playlist.start()
+    for message1, message2 in playlist:  # Loops forever
+        scroll_both_lines(message1, message2)
+"""
+
+import os
+import threading
+import time
+from lcd_frames import frame_table
+
+SEPARATOR = "|"  # Between the texts of line 1 and line 2
+PLAYLIST_SUFFIX = ".txt"  # Files read from a playlist directory
+
+
+class Playlist:
+    def __init__(self, path, width=16, poll_interval=1.0, lookahead=2, charmap=None):
+        self.path = path
+        self.width = width
+        self.charmap = charmap  # The charmap the display loop passes to frame_table()
+        self.poll_interval = poll_interval
+        self.lookahead = lookahead
+
+        self.index = []  # (file, byte offset) per entry, as far as the files were scanned
+        self._scanner = None  # Yields the locations of the entries not indexed yet; None when all files were scanned
+        self.position = 0  # Next entry to show
+        self.reloads = 0
+        self._stamp = None  # Modification times of the last index
+        self._pending = None  # (stamp, index) waiting to be swapped in
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._running = False
+
+        self.check()
+        self._swap()
+        self.reloads = 0  # Count changes after the first load only
+
+    def start(self):
+        # Poll for changes and precompile upcoming entries in a background thread
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="lcd-playlist", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __iter__(self):
+        while True:
+            entry = self.next_entry()
+            if entry is None:
+                time.sleep(self.poll_interval)  # Empty playlist: wait for entries
+                continue
+            yield entry
+
+    def next_entry(self):
+        # The next (line 1, line 2) pair; None if the playlist is empty
+        self._swap()  # Message boundary: a new index can be used from here on
+        with self._lock:
+            location = self._location(self.position)
+            if location is None:
+                self.position = 0  # Past the last entry: start over
+                location = self._location(0)
+                if location is None:
+                    return None
+            self.position += 1
+        self._wake.set()  # Let the background thread compile the following entries
+        return self._read(location)
+
+    def check(self):
+        # Re-index the playlist if a file changed; the new index waits for the next message boundary
+        stamp = self._stamp_files()
+        with self._lock:
+            if stamp == self._stamp or (self._pending and stamp == self._pending[0]):
+                return False
+            self._pending = (stamp, self._scan(sorted(stamp)))  # Nothing is read yet
+        return True
+
+    def _swap(self):
+        with self._lock:
+            if self._pending is None:
+                return
+            self._stamp, self._scanner = self._pending
+            self.index = []
+            self._pending = None
+            self.reloads += 1
+
+    def _files(self):
+        if os.path.isdir(self.path):
+            return [os.path.join(self.path, name) for name in os.listdir(self.path)
+                    if name.endswith(PLAYLIST_SUFFIX)]
+        return [self.path] if os.path.exists(self.path) else []
+
+    def _stamp_files(self):
+        # file -> modification time
+        stamp = {}
+        for name in self._files():
+            try:
+                stamp[name] = os.stat(name).st_mtime_ns
+            except FileNotFoundError:
+                pass  # Removed while listing
+        return stamp
+
+    def _scan(self, names):
+        # Locations of the entry lines of the files, one file line read per step (the text itself is not kept)
+        for name in names:
+            offset = 0
+            try:
+                with open(name, "rb") as f:
+                    for raw in f:
+                        text = raw.strip()
+                        if text and not text.startswith(b"#"):
+                            yield name, offset
+                        offset += len(raw)
+            except FileNotFoundError:
+                pass
+
+    def _location(self, position):
+        # Location of entry `position`, scanning further if needed; None past the last entry. Hold self._lock.
+        while position >= len(self.index) and self._scanner is not None:
+            location = next(self._scanner, None)
+            if location is None:
+                self._scanner = None  # All files scanned, the index is complete
+            else:
+                self.index.append(location)
+        return self.index[position] if position < len(self.index) else None
+
+    def _read(self, location):
+        name, offset = location
+        try:
+            with open(name, "rb") as f:
+                f.seek(offset)
+                line = f.readline().decode("utf-8", errors="replace").strip()
+        except FileNotFoundError:
+            return ("", "")  # Deleted; the next check() drops it
+        text1, _, text2 = line.partition(SEPARATOR)
+        return text1.strip(), text2.strip()
+
+    def _precompile(self):
+        # Build the scroll frames of the next entries, so the display loop finds them cached
+        upcoming = []
+        with self._lock:
+            for i in range(self.lookahead):
+                location = self._location(self.position + i)
+                if location is None:
+                    if not self.index:
+                        break
+                    location = self.index[(self.position + i) % len(self.index)]  # Wraps around to the start
+                upcoming.append(location)
+        for location in upcoming:
+            for text in self._read(location):
+                frame_table(text, self.width, self.charmap)
+
+    def _run(self):
+        while self._running:
+            self.check()
+            self._precompile()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
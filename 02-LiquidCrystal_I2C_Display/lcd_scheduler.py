@@ -0,0 +1,126 @@
+"""
+LCD Frame Scheduler Module
+
+`scroll_both_lines()` used to write both lines and then `time.sleep(delay)`, so every frame took `delay` plus the I2C
+write time and the scrolling slowed down over time. It also stopped both lines as soon as the shorter message was done.
+This module schedules frames on absolute `time.monotonic()` deadlines instead: frame n of a line is due at
+`start + n * period`, however long the writes took.
+
+Features:
+- Every line has its own frames and period (seconds per frame), and runs until its own frames are done.
+- Lines can loop (`loop=True`); `run()` returns when all non-looping lines are done, or after `duration` seconds
+  (needed if every line loops).
+- A frame that could not be shown before the next one was due counts as a missed deadline; the line then continues
+  from the current time instead of rushing to catch up.
+- Reports frames, missed deadlines and the achieved frames per second of every line (summed over all runs).
+
+Dependencies:
+- time
+
+Usage:
+    scheduler = FrameScheduler(show_frame)  # show_frame(row, frame) writes one frame
+    scheduler.add_line(0, frame_table("Dream big, work hard!", 16), period=0.3)
+    scheduler.add_line(1, frame_table("Stay focused, win big!", 16), period=0.2)
+    scheduler.run()
+    print(scheduler.report())
+"""
+
+import time
+
+DONE = object()  # Returned by next_frame() when a line has no more frames
+
+
+class ScheduledLine:
+    def __init__(self, row, frames, period, loop):
+        self.row = row
+        self.frames = frames
+        self.period = period
+        self.loop = loop
+        self.deadline = 0.0
+        self.started = 0.0
+        self._iterator = iter(frames)
+        # Statistics
+        self.shown = 0
+        self.missed = 0
+        self.elapsed = 0.0  # Seconds from the start of the run until the line was done
+
+    def next_frame(self):
+        # Next frame, or DONE when the line is done
+        for _ in range(2):
+            try:
+                return next(self._iterator)
+            except StopIteration:
+                if not self.loop:
+                    return DONE
+                self._iterator = iter(self.frames)  # Start over (frames must be re-iterable)
+        return DONE
+
+
+class FrameScheduler:
+    def __init__(self, render=None, clock=None, sleep=None):
+        # render(row, frame) shows a frame; without it, taking the next frame is the work (e.g. a generator)
+        self.render = render
+        self.clock = clock or time.monotonic
+        self.sleep = sleep or time.sleep
+        self.lines = []
+        self.totals = {}  # row -> frames, missed deadlines and seconds of the finished lines
+
+    def add_line(self, row, frames, period, loop=False):
+        line = ScheduledLine(row, frames, period, loop)
+        self.lines.append(line)
+        return line
+
+    def run(self, duration=None):
+        start = self.clock()
+        for line in self.lines:
+            line.deadline = line.started = start
+        end = None if duration is None else start + duration
+        has_end = any(not line.loop for line in self.lines)  # Otherwise loop until `duration`
+
+        try:
+            while self.lines:
+                if has_end and all(line.loop for line in self.lines):
+                    break
+                line = min(self.lines, key=lambda line: line.deadline)
+                if end is not None and line.deadline >= end:
+                    break
+                now = self.clock()
+                if line.deadline > now:
+                    self.sleep(line.deadline - now)
+                    now = self.clock()
+
+                late = int((now - line.deadline) / line.period)
+                if late:
+                    # The next frame was due already: skip the missed slots instead of bursting
+                    line.missed += late
+                    line.deadline += late * line.period
+
+                frame = line.next_frame()
+                if frame is DONE:
+                    self._finish(line)
+                    continue
+                if self.render is not None:
+                    self.render(line.row, frame)
+                line.shown += 1
+                line.deadline += line.period
+        finally:
+            # Also when interrupted, so report() covers the lines that were running
+            for line in list(self.lines):
+                self._finish(line)
+
+    def _finish(self, line):
+        line.elapsed = self.clock() - line.started
+        self.lines.remove(line)
+        # Only the sums are kept, so scripts that add lines forever do not keep every line
+        totals = self.totals.setdefault(line.row, {"frames": 0, "missed": 0, "seconds": 0.0})
+        totals["frames"] += line.shown
+        totals["missed"] += line.missed
+        totals["seconds"] += line.elapsed
+
+    def report(self):
+        # Statistics per row, summed over all finished lines
+        stats = {}
+        for row, totals in self.totals.items():
+            stats[row] = dict(totals)
+            stats[row]["fps"] = totals["frames"] / totals["seconds"] if totals["seconds"] else 0.0
+        return stats
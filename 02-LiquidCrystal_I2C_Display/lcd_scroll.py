@@ -0,0 +1,127 @@
+"""
+LCD Scrolling Module
+
+`scroll_text()` in the scrolling scripts rewrites a 16-character slice of the message for every step, which is 16 data
+writes per line per frame. The HD44780 keeps 40 characters per line in DDRAM and can slide the visible window over them
+with a single "display shift" command (0x18). This module loads the messages into DDRAM once and then scrolls them
+with shift commands, for RPLCD's `CharLCD`. For a single scrolling row next to static text, `LineScroller` overwrites
+that row in place instead of clearing the display every frame.
+
+Features:
+- `ShiftScroller`: one shift command per frame instead of rewriting both lines.
+- Messages longer than the 40-character DDRAM line are refilled in chunks, into columns that are not visible.
+- The display shift moves both lines together, so all lines scroll at the same speed; a shorter line is padded with
+  spaces until the longest one has scrolled through.
+- Leaves the display cleared and unshifted when done (or when interrupted).
+- `LineScroller`: never clears, only rewrites the changed part of the scrolling row (the other row keeps its text),
+  and can draw custom characters through a `GlyphCache` (`lcd_glyphs.py`).
+- Both take an optional `charmap` (`lcd_charmap.py`): the text is then encoded to ROM codes once and written as bytes.
+
+Dependencies:
+- RPLCD (CharLCD)
+- lcd_frames.py and lcd_charmap.py (in this folder)
+
+Usage:
+    for _ in ShiftScroller(lcd, ["Dream big, work hard!", "Stay focused, win big!"]).frames():
+        time.sleep(0.3)
+
+    for _ in LineScroller(lcd, row=0).frames("Error 404: Sleep Not Found!"):
+        time.sleep(0.2)
+"""
+
+from lcd_charmap import write_encoded
+from lcd_frames import frame_table
+
+DDRAM_COLUMNS = 40  # DDRAM characters per line
+REFILL_MARGIN = 8  # Refill when fewer off-screen characters than this are loaded ahead
+
+
+def write_text(lcd, data):
+    # Write at the cursor: str through RPLCD's codec, bytes (already ROM codes) as they are
+    if isinstance(data, bytes):
+        write_encoded(lcd, data)
+    else:
+        lcd.write_string(data)
+
+
+class ShiftScroller:
+    def __init__(self, lcd, texts, cols=None, charmap=None):
+        self.lcd = lcd
+        self.cols = cols or lcd.lcd.cols
+        # Same frames as scroll_text(): the message enters from the right and leaves on the left
+        lines = [frame_table(text, self.cols, charmap).buffer for text in texts]
+        self.length = max(len(line) for line in lines)
+        self.lines = [line.ljust(self.length) for line in lines]
+        self.frame_count = self.length - self.cols + 1
+        self.loaded = 0  # Characters of every line written to DDRAM so far
+
+    def frames(self):
+        # Yields the frame number each time a new frame is visible
+        lcd = self.lcd
+        auto_linebreaks = lcd.auto_linebreaks
+        lcd.auto_linebreaks = False  # Allow writes to the off-screen columns 16-39
+        try:
+            lcd.home()  # Reset any display shift
+            self.loaded = 0
+            self._load(min(self.length, DDRAM_COLUMNS))
+            yield 0
+            for position in range(1, self.frame_count):
+                if self.loaded < self.length and self.loaded - position - self.cols < REFILL_MARGIN:
+                    # Everything up to the column left of the visible window is off-screen
+                    self._load(min(self.length, position - 1 + DDRAM_COLUMNS))
+                lcd.shift_display(-1)  # Window moves one column to the right, text moves left
+                yield position
+        finally:
+            lcd.clear()  # Also resets the display shift
+            lcd.auto_linebreaks = auto_linebreaks
+
+    def _load(self, end):
+        # Write characters self.loaded..end-1 of every line, wrapping around the 40 DDRAM columns
+        start = self.loaded
+        for row, line in enumerate(self.lines):
+            position = start
+            while position < end:
+                column = position % DDRAM_COLUMNS
+                stop = min(end, position + DDRAM_COLUMNS - column)
+                self.lcd.cursor_pos = (row, column)
+                write_text(self.lcd, line[position:stop])
+                position = stop
+        self.loaded = end
+
+
+class LineScroller:
+    def __init__(self, lcd, row=0, cols=None, glyphs=None, charmap=None):
+        self.lcd = lcd
+        self.row = row
+        self.cols = cols or lcd.lcd.cols
+        self.glyphs = glyphs  # Optional GlyphCache for symbols outside the character ROM
+        self.charmap = charmap  # Optional CharMap; frames are then written as ROM codes
+        self._shown = None  # Text on the row; None if unknown
+
+    def reset(self):
+        # Call after the display was cleared by someone else
+        self._shown = None
+
+    def show(self, frame):
+        # Overwrite the changed part of the row in place
+        if self.glyphs is not None:
+            frame = self.glyphs.encode(frame, row=self.row)
+            if self.charmap is not None:
+                frame = self.charmap.encode(frame)  # Cached per frame
+        first, last = 0, len(frame)
+        if self._shown is not None and len(self._shown) == len(frame):
+            while first < last and frame[first] == self._shown[first]:
+                first += 1
+            while last > first and frame[last - 1] == self._shown[last - 1]:
+                last -= 1
+        if first < last:
+            self.lcd.cursor_pos = (self.row, first)
+            write_text(self.lcd, frame[first:last])
+        self._shown = frame
+
+    def frames(self, text):
+        # Shows each scroll frame of `text` and yields it
+        # Glyph slots depend on what is on screen, so with glyphs the frames are encoded when shown
+        for frame in frame_table(text, self.cols, None if self.glyphs else self.charmap):
+            self.show(frame)
+            yield frame
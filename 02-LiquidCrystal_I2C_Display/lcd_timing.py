@@ -0,0 +1,122 @@
+"""
+HD44780 Timing Profiles Module
+
+This module describes how long the raw driver (`lcd_driver.py`) has to wait around each enable pulse and after each
+command. The original script slept a fixed 0.5 ms three times around every nibble (`E_DELAY`/`E_PULSE`), but the
+HD44780 datasheet only needs about 1 us around the enable pulse and 37 us for most instructions. Only clear display
+and return home are slow (1.52 ms), and the first two function sets of the initialisation (4.1 ms and 100 us).
+
+Features:
+- `TimingProfile` holds the setup, pulse and hold times around an enable pulse and the execution time of normal and
+  slow (clear/home) instructions, all in nanoseconds.
+- Waits shorter than `SPIN_THRESHOLD_NS` busy-wait on `time.perf_counter_ns()`, because `time.sleep()` cannot sleep
+  for a few microseconds. Longer waits sleep and only spin for the remainder.
+- `LEGACY_TIMING` reproduces the old fixed sleeps, `DATASHEET_TIMING` uses the HD44780 datasheet values.
+- Profiles can be scaled, saved to and loaded from a JSON profile file. `09-i2c_lcd_timing.py --calibrate` finds the
+  fastest scale a module tolerates and saves it. Only the enable pulse and normal execution times are scaled: clear
+  and home keep the datasheet 1.52 ms (`MIN_SLOW_EXEC_NS`, also enforced when loading a file), and the
+  initialisation waits (`INIT_WAITS_NS`) are not part of a profile at all.
+
+Dependencies:
+- json (for profile files)
+- time (for delays)
+
+Usage:
+    timing = TimingProfile.load("lcd_timing.json")  # Or DATASHEET_TIMING
+    lcd = HD44780(bus, address=0x3F, timing=timing)
+"""
+
+import json
+import time
+
+SPIN_THRESHOLD_NS = 1_000_000  # Busy-wait below 1 ms, sleep above
+SLOW_INSTRUCTIONS = (0x01, 0x02, 0x03)  # Clear display, return home
+MIN_SLOW_EXEC_NS = 1_520_000  # Clear display / return home, never shortened
+INIT_WAITS_NS = (4_100_000, 100_000)  # After the first and second function set of the initialisation
+
+
+class TimingProfile:
+    FIELDS = ("setup_ns", "pulse_ns", "hold_ns", "exec_ns", "slow_exec_ns")
+
+    def __init__(self, setup_ns, pulse_ns, hold_ns, exec_ns, slow_exec_ns):
+        self.setup_ns = int(setup_ns)  # Before E goes high (RS/data setup)
+        self.pulse_ns = int(pulse_ns)  # E high
+        self.hold_ns = int(hold_ns)  # After E goes low
+        self.exec_ns = int(exec_ns)  # After a normal instruction or data byte
+        self.slow_exec_ns = int(slow_exec_ns)  # After clear display / return home
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)}" for name in self.FIELDS)
+        return f"TimingProfile({values})"
+
+    def __eq__(self, other):
+        return isinstance(other, TimingProfile) and self.as_dict() == other.as_dict()
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def scaled(self, factor):
+        # Same profile with the enable pulse and execution times multiplied by `factor`; clear/home are kept
+        values = {name: value * factor for name, value in self.as_dict().items()}
+        values["slow_exec_ns"] = self.slow_exec_ns
+        return TimingProfile(**values)
+
+    def exec_time_ns(self, bits, mode):
+        # Execution time of one byte sent to the LCD (mode 0 = command, 1 = data)
+        if mode == 0 and bits in SLOW_INSTRUCTIONS:
+            return self.slow_exec_ns
+        return self.exec_ns
+
+    def save(self, path):
+        with open(path, "w") as profile_file:
+            json.dump(self.as_dict(), profile_file, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as profile_file:
+            values = json.load(profile_file)
+        # Clear and home cannot be calibrated (the check pattern would not notice), so never go below the datasheet
+        values["slow_exec_ns"] = max(values.get("slow_exec_ns", 0), MIN_SLOW_EXEC_NS)
+        return cls(**values)
+
+
+def wait_ns(nanoseconds):
+    # Wait for at least `nanoseconds`, spinning for the sub-millisecond part
+    if nanoseconds <= 0:
+        return
+    deadline = time.perf_counter_ns() + nanoseconds
+    if nanoseconds > SPIN_THRESHOLD_NS:
+        time.sleep((nanoseconds - SPIN_THRESHOLD_NS) / 1e9)
+    while time.perf_counter_ns() < deadline:
+        pass
+
+
+# The fixed sleeps of the original script (E_DELAY = E_PULSE = 0.5 ms, E_DELAY after clear during init)
+LEGACY_TIMING = TimingProfile(setup_ns=500_000, pulse_ns=500_000, hold_ns=500_000, exec_ns=0, slow_exec_ns=500_000)
+
+# HD44780U datasheet: tAS 40 ns, PWEH 230 ns, tcycE 500 ns (rounded up to 1 us), 37 us / 1.52 ms execution times
+DATASHEET_TIMING = TimingProfile(setup_ns=1_000, pulse_ns=1_000, hold_ns=1_000, exec_ns=37_000,
+                                 slow_exec_ns=MIN_SLOW_EXEC_NS)
+
+
+def calibrate(lcd, check, factors=None, trials=3, margin=1.25):
+    # Find the fastest scale of DATASHEET_TIMING the module tolerates (clear/home stay at the datasheet 1.52 ms)
+    # check(lcd) writes a test pattern and returns True if it reads back correctly
+    if factors is None:
+        factors = [1.0, 0.5, 0.25, 0.1, 0.05, 0.01, 0.0]
+
+    original = lcd.timing
+    best = None
+    try:
+        for factor in sorted(factors, reverse=True):
+            lcd.timing = DATASHEET_TIMING.scaled(factor)
+            if not all(check(lcd) for _ in range(trials)):
+                break
+            best = factor
+    finally:
+        lcd.timing = original
+
+    if best is None:
+        return None
+    # Keep a safety margin over the fastest passing setting, but never go slower than the datasheet
+    return DATASHEET_TIMING.scaled(min(1.0, best * margin))
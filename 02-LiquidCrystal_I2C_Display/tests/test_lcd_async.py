@@ -0,0 +1,65 @@
+"""
+Error handling of the writer task of lcd_async.py.
+"""
+
+import asyncio
+import pytest
+from lcd_async import AsyncLCD
+
+
+class FlakyBackend:
+    # Records the lines it writes and raises `error` for the texts in `failing`
+    rows = 2
+
+    def __init__(self, error, failing):
+        self.error = error
+        self.failing = failing
+        self.lines = []
+
+    def write_line(self, row, text):
+        if text in self.failing:
+            raise self.error
+        self.lines.append((row, text))
+
+    def clear(self):
+        self.lines.clear()
+
+
+def within(awaitable):
+    # Give up instead of hanging if flush() or close() never return
+    return asyncio.wait_for(awaitable, timeout=5)
+
+
+def test_bus_error_skips_only_that_line():
+    backend = FlakyBackend(OSError(121, "Remote I/O error"), {"lost"})
+
+    async def main():
+        display = AsyncLCD(backend)
+        display.start()
+        await display.set_line(0, "lost")
+        await within(display.flush())
+        await display.set_line(1, "sent")
+        await within(display.close())
+        return display
+
+    display = asyncio.run(main())
+    assert backend.lines == [(1, "sent")]
+    assert (display.lines_sent, display.write_errors) == (1, 1)
+    assert display.last_write_error is backend.error
+
+
+def test_writer_error_is_raised():
+    backend = FlakyBackend(ValueError("bad text"), {"bad"})
+
+    async def main():
+        display = AsyncLCD(backend)
+        display.start()
+        await display.set_line(0, "bad")
+        with pytest.raises(ValueError):
+            await within(display.flush())
+        with pytest.raises(ValueError):
+            await display.set_line(1, "next")
+        with pytest.raises(ValueError):
+            await within(display.close())
+
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+"""
+Queueing of lcd_bus_manager.py against the recording fake bus.
+"""
+
+import pytest
+from fake_smbus import FakeSMBus
+from lcd_bus_manager import LCDBusManager
+from lcd_driver import LCD_LINE_1, LCD_RW
+
+ADDRESS = 0x27
+
+def test_read_is_refused_before_anything_is_queued():
+    manager = LCDBusManager(FakeSMBus())
+    lcd = manager.add_display(ADDRESS)
+    manager.run_pending()
+    with pytest.raises(OSError):
+        lcd.read_ddram(0x00, 4)
+    assert not manager._channels[ADDRESS].queue
+
+    # The next update is sent as usual, and no state with RW high ever reaches the bus
+    manager.update(ADDRESS, "Hello", LCD_LINE_1)
+    manager.run_pending()
+    assert not any(byte & LCD_RW for byte in manager.bus.data_for(ADDRESS))
+
+def test_latency_stats_are_running_totals():
+    manager = LCDBusManager(FakeSMBus())
+    manager.add_display(ADDRESS)
+    for n in range(50):
+        manager.update(ADDRESS, f"Update {n}", LCD_LINE_1)
+        manager.run_pending()
+    stats = manager.latency_stats()[ADDRESS]
+    assert stats["updates"] == 51  # lcd_init() counts as one update
+    assert 0 <= stats["last_ms"] <= stats["max_ms"]
+    assert 0 <= stats["mean_ms"] <= stats["max_ms"]
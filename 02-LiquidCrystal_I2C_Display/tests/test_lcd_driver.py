@@ -0,0 +1,68 @@
+"""
+Byte streams of the batched transports of lcd_driver.py, recorded by fake_smbus.py.
+
+Expander states: D7-D4 in the high nibble, then backlight (0x08), E (0x04) and RS (0x01).
+"""
+
+import pytest
+from fake_smbus import FakeSMBus
+from lcd_driver import HD44780, LCD_LINE_1, TRANSPORT_BLOCK, TRANSPORT_RDWR
+
+ADDRESS = 0x3F
+
+INIT = [
+    # Function set (8-bit), after RS settles; 4.1 ms wait
+    bytes([0x38, 0x3C, 0x38]),
+    # Function set (8-bit); 100 us wait
+    bytes([0x3C, 0x38]),
+    # Function set (8-bit), 4-bit mode, then 0x06, 0x0C, 0x28 and clear display (0x01)
+    bytes([0x3C, 0x38, 0x2C, 0x28,
+           0x0C, 0x08, 0x6C, 0x68,
+           0x0C, 0x08, 0xCC, 0xC8,
+           0x2C, 0x28, 0x8C, 0x88,
+           0x0C, 0x08, 0x1C, 0x18]),
+]
+
+def data_states(text):
+    # Two enable pulses per character, RS high
+    states = []
+    for value in text.encode():
+        for nibble in (value & 0xF0, (value << 4) & 0xF0):
+            states += [nibble | 0x0D, nibble | 0x09]
+    return states
+
+def new_lcd(transport):
+    bus = FakeSMBus()
+    lcd = HD44780(bus, address=ADDRESS, transport=transport)
+    lcd.lcd_init()
+    return bus, lcd
+
+@pytest.mark.parametrize("transport", [TRANSPORT_BLOCK, TRANSPORT_RDWR])
+def test_init(transport):
+    bus, _ = new_lcd(transport)
+    assert bus.transactions == [(ADDRESS, data) for data in INIT]
+
+@pytest.mark.parametrize("transport", [TRANSPORT_BLOCK, TRANSPORT_RDWR])
+def test_text_line(transport):
+    bus, lcd = new_lcd(transport)
+    bus.reset()
+    lcd.lcd_string("Hello, World!", LCD_LINE_1, diff=False)
+
+    # Set DDRAM address 0x00, then RS settles (with the first nibble of "H") and the 16 cells follow
+    stream = bytes([0x8C, 0x88, 0x0C, 0x08, 0x49] + data_states("Hello, World!   "))
+    assert bus.data_for(ADDRESS) == stream
+    if transport == TRANSPORT_BLOCK:
+        # 32 data bytes plus the "command" byte per block write
+        assert [data for _, data in bus.transactions] == [stream[:33], stream[33:66], stream[66:]]
+    else:
+        assert bus.transactions == [(ADDRESS, stream)]
+
+@pytest.mark.parametrize("transport", [TRANSPORT_BLOCK, TRANSPORT_RDWR])
+def test_cursor_jump(transport):
+    bus, lcd = new_lcd(transport)
+    lcd.lcd_string("AB", LCD_LINE_1)
+    bus.reset()
+    lcd.lcd_string("AB      X", LCD_LINE_1)
+
+    # Only cell 8 changed: set DDRAM address 0x08 (RS settles low first), then "X" (RS settles high)
+    assert bus.transactions == [(ADDRESS, bytes([0x88, 0x8C, 0x88, 0x8C, 0x88, 0x59, 0x5D, 0x59, 0x8D, 0x89]))]
@@ -0,0 +1,41 @@
+"""
+Timing violations reported by the HD44780 emulator (lcd_emulator.py).
+"""
+
+import pytest
+from lcd_driver import HD44780, LCD_CMD, LCD_LINE_1, TRANSPORT_BLOCK, TRANSPORT_BYTE
+from lcd_emulator import EmulatedSMBus
+from lcd_timing import DATASHEET_TIMING, TimingProfile
+
+ADDRESS = 0x3F
+
+def new_lcd(transport=TRANSPORT_BLOCK):
+    bus = EmulatedSMBus()
+    lcd = HD44780(bus, address=ADDRESS, transport=transport)
+    return bus, lcd
+
+@pytest.mark.parametrize("transport", [TRANSPORT_BYTE, TRANSPORT_BLOCK])
+def test_init_keeps_the_function_set_waits(transport):
+    bus, lcd = new_lcd(transport)
+    lcd.lcd_init()
+    lcd.lcd_string("Hello", LCD_LINE_1)
+    assert bus.display(ADDRESS).timing_violations == 0
+    assert bus.display(ADDRESS).text(0) == "Hello           "
+
+def test_init_without_waits_is_reported():
+    # The old initialisation: 0x33 and 0x32 in one batch, no 4.1 ms / 100 us between the function sets
+    bus, lcd = new_lcd()
+    with lcd.batch():
+        lcd.lcd_byte(0x33, LCD_CMD)
+        lcd.lcd_byte(0x32, LCD_CMD)
+    assert bus.display(ADDRESS).timing_violations >= 1
+
+@pytest.mark.parametrize("slow_exec_ns, violations", [(DATASHEET_TIMING.slow_exec_ns, 0), (0, 1)])
+def test_wait_after_clear(slow_exec_ns, violations):
+    bus, lcd = new_lcd()
+    lcd.lcd_init()
+    bus.reset()
+    lcd.timing = TimingProfile(**dict(DATASHEET_TIMING.as_dict(), slow_exec_ns=slow_exec_ns))
+    lcd.lcd_byte(0x01, LCD_CMD)  # Clear display
+    lcd.lcd_string("Hello", LCD_LINE_1)
+    assert min(bus.display(ADDRESS).timing_violations, 1) == violations
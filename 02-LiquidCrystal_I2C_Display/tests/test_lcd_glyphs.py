@@ -0,0 +1,72 @@
+"""
+CGRAM writes of lcd_glyphs.py while text scrolls across line 1, counted by the HD44780 emulator (lcd_emulator.py).
+"""
+
+from lcd_driver import HD44780, LCD_LINE_1, LCD_LINE_2, LCD_WIDTH, TRANSPORT_BLOCK
+from lcd_emulator import EmulatedSMBus
+from lcd_glyphs import GLYPHS, GlyphCache
+
+ADDRESS = 0x3F
+LOOPS = 5
+
+SLEEP = "Error 404: Sleep Not Found! 😴"  # One glyph
+SYMBOLS = "Battery 🔋 ↑ 80% ✓  Temp 🌡 ↓ 21C ♥ Price 5€ 😊 🌟 😴"  # 10 glyphs, more than the 8 slots
+
+def frames(text):
+    # The text scrolls in from the right and out to the left, one character per frame, LOOPS times
+    padded = " " * LCD_WIDTH + text + " " * LCD_WIDTH
+    for _ in range(LOOPS):
+        for i in range(len(padded) - LCD_WIDTH + 1):
+            yield padded[i:i + LCD_WIDTH]
+
+def scroll(text):
+    bus = EmulatedSMBus()
+    lcd = HD44780(bus, address=ADDRESS, transport=TRANSPORT_BLOCK)
+    lcd.lcd_init()
+    display = bus.display(ADDRESS)
+    glyphs = GlyphCache.for_driver(lcd)
+
+    shown = {}  # char -> slot of the glyphs on the previous frame
+    for frame in frames(text):
+        lcd.lcd_string(glyphs.encode(frame), LCD_LINE_1)
+        # A glyph that stays on the display keeps its slot: visible glyphs are never evicted
+        slots = {char: glyphs.slots[char] for char in frame if char in GLYPHS}
+        assert all(slots[char] == slot for char, slot in shown.items() if char in slots)
+        shown = slots
+        # Every cell shows its character: ROM codes as they are, glyphs from a CGRAM slot holding their bitmap
+        for char, code in zip(frame, display.visible(0)):
+            if char in GLYPHS:
+                assert code < 8 and display.glyph(code) == GLYPHS[char]
+            else:
+                assert code == ord(char)
+    assert display.timing_violations == 0
+    return display, glyphs
+
+def test_glyph_is_uploaded_once():
+    display, glyphs = scroll(SLEEP)
+    assert glyphs.glyph_uploads == 1
+    assert glyphs.slots == {"😴": 0}
+    assert display.cgram_writes == glyphs.cgram_bytes == 8
+
+def test_more_glyphs_than_slots():
+    # Only 8 of the 10 glyphs fit into CGRAM. The first pass loads all 10 (evicting the 2 that scrolled out first);
+    # on every later pass the LRU order matches the scroll order, so each glyph is evicted before it comes back.
+    display, glyphs = scroll(SYMBOLS)
+    assert glyphs.glyph_uploads == LOOPS * 10
+    assert display.cgram_writes == glyphs.cgram_bytes == 8 * glyphs.glyph_uploads
+
+def test_glyph_on_the_other_line_is_never_evicted():
+    # "♥" on line 2 is the least recently used glyph while line 1 scrolls 9 others, but it is visible
+    bus = EmulatedSMBus()
+    lcd = HD44780(bus, address=ADDRESS, transport=TRANSPORT_BLOCK)
+    lcd.lcd_init()
+    display = bus.display(ADDRESS)
+    glyphs = GlyphCache.for_driver(lcd)
+    lcd.lcd_string(glyphs.encode("I ♥ my Pi", row=1), LCD_LINE_2)
+    heart = glyphs.slots["♥"]
+
+    for frame in frames(SYMBOLS.replace("♥", " ")):
+        lcd.lcd_string(glyphs.encode(frame), LCD_LINE_1)
+        assert glyphs.slots.get("♥") == heart
+        assert display.visible(1)[2] == heart and display.glyph(heart) == GLYPHS["♥"]
+    assert glyphs.glyph_uploads > 9  # Line 1 did need evictions
@@ -0,0 +1,63 @@
+"""
+Lazy indexing, reloading and precompiling of lcd_playlist.py.
+"""
+
+import os
+from lcd_charmap import charmap
+from lcd_frames import frame_table
+from lcd_playlist import Playlist
+
+
+def write_playlist(path, count, stamp):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Test playlist\n")
+        for n in range(count):
+            f.write(f"Message {n} | Line {n}\n")
+    os.utime(path, ns=(stamp, stamp))  # A new modification time, even within the file system's resolution
+
+
+def test_first_entry_does_not_index_the_whole_file(tmp_path):
+    path = tmp_path / "playlist.txt"
+    write_playlist(path, 10000, 1)
+    playlist = Playlist(str(path))
+    assert playlist.index == []
+    assert playlist.next_entry() == ("Message 0", "Line 0")
+    assert len(playlist.index) == 1
+
+
+def test_loops_and_reloads(tmp_path):
+    path = tmp_path / "playlist.txt"
+    write_playlist(path, 3, 1)
+    playlist = Playlist(str(path))
+    assert [playlist.next_entry()[0] for _ in range(4)] == ["Message 0", "Message 1", "Message 2", "Message 0"]
+
+    # Shorter: the position is past the end, so playback starts over
+    write_playlist(path, 1, 2)
+    assert playlist.check()
+    assert [playlist.next_entry()[0] for _ in range(2)] == ["Message 0", "Message 0"]
+    assert playlist.reloads == 1
+
+    # Longer: playback continues at the same position
+    write_playlist(path, 5, 3)
+    assert playlist.check()
+    assert [playlist.next_entry()[0] for _ in range(5)] == ["Message 1", "Message 2", "Message 3", "Message 4",
+                                                            "Message 0"]
+
+
+def test_empty_playlist(tmp_path):
+    playlist = Playlist(str(tmp_path / "missing.txt"))
+    assert playlist.next_entry() is None
+
+
+def test_precompiled_frames_are_the_ones_shown(tmp_path):
+    # Script 06 asks for frame_table(text, 16, ROM); the playlist must compile that same table ahead of time
+    path = tmp_path / "playlist.txt"
+    write_playlist(path, 3, 1)
+    rom = charmap("A02")
+    playlist = Playlist(str(path), charmap=rom)
+    frame_table.cache_clear()
+    playlist._precompile()
+    text1, text2 = playlist.next_entry()
+    frame_table(text1, 16, rom)
+    frame_table(text2, 16, rom)
+    assert frame_table.cache_info().hits == 2
@@ -0,0 +1,35 @@
+"""
+Statistics of lcd_scheduler.py on a simulated clock.
+"""
+
+from lcd_scheduler import FrameScheduler
+
+
+class FakeClock:
+    # time.monotonic() and time.sleep() stand-ins; sleeping only moves the clock on
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_report_sums_repeated_runs():
+    # Scripts 05-07 add their lines and run again and again; only the sums per row are kept
+    clock = FakeClock()
+    shown = []
+    scheduler = FrameScheduler(lambda row, frame: shown.append(frame), clock=clock, sleep=clock.sleep)
+    for _ in range(100):
+        scheduler.add_line(0, "abcd", period=0.5)
+        scheduler.add_line(1, "xy", period=0.25)
+        scheduler.run()
+
+    assert len(shown) == 600
+    assert scheduler.lines == []
+    assert scheduler.report() == {
+        0: {"frames": 400, "missed": 0, "seconds": 200.0, "fps": 2.0},
+        1: {"frames": 200, "missed": 0, "seconds": 50.0, "fps": 4.0},
+    }